@@ -1,13 +1,12 @@
 """Credential management for device access."""
 
 import os
-import yaml
-import json
 import logging
 from typing import Dict, Optional
 from pathlib import Path
 
 from .models import CredentialSet
+from .utils.data_files import load_data_file
 
 
 logger = logging.getLogger(__name__)
@@ -25,8 +24,8 @@ class CredentialManager:
         """
         self.credentials: Dict[str, CredentialSet] = {}
 
-        # Try to load from file
-        if credential_file and Path(credential_file).exists():
+        # Try to load from file; a single stat, and none when no file is given
+        if credential_file is not None and Path(credential_file).is_file():
             self.load_from_file(credential_file)
         # Fall back to environment variables
         elif 'PATHTRACE_USER' in os.environ:
@@ -38,24 +37,21 @@ class CredentialManager:
 
         Args:
             file_path: Path to credentials file (YAML or JSON)
+
+        Raises:
+            ValueError: If a credential set is missing a username or has
+                unknown keys
         """
         logger.info(f"Loading credentials from {file_path}")
 
-        with open(file_path, 'r') as f:
-            if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                data = yaml.safe_load(f)
-            else:
-                data = json.load(f)
+        data = load_data_file(file_path)
 
         credentials_data = data.get('credentials', {})
         for name, cred_data in credentials_data.items():
-            self.credentials[name] = CredentialSet(
-                username=cred_data['username'],
-                password=cred_data.get('password'),
-                secret=cred_data.get('secret'),
-                ssh_key_file=cred_data.get('ssh_key_file'),
-                api_token=cred_data.get('api_token')
-            )
+            try:
+                self.credentials[name] = CredentialSet(**cred_data)
+            except TypeError as e:
+                raise ValueError(f"Invalid credential set '{name}' in {file_path}: {e}") from e
 
         logger.info(f"Loaded {len(self.credentials)} credential sets")
 
@@ -1,18 +1,23 @@
 """Device discovery and inventory management."""
 
-import yaml
-import json
+import bisect
+import ipaddress
 import logging
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
 from .models import NetworkDevice, DeviceNotFoundError
-from .utils.ip_utils import ip_in_network, get_prefix_length
+from .utils.data_files import load_data_file, save_data_file
 
 
 logger = logging.getLogger(__name__)
 
 
+def _network_key(address: int, prefix_len: int, max_prefix_len: int) -> int:
+    """Return the network bits of an address as an integer key for one prefix length."""
+    return address >> (max_prefix_len - prefix_len)
+
+
 class DeviceInventory:
     """Manages network device inventory."""
 
@@ -25,6 +30,13 @@ class DeviceInventory:
         """
         self.devices: List[NetworkDevice] = []
         self.subnet_map: Dict[str, List[NetworkDevice]] = {}
+        self._by_hostname: Dict[str, NetworkDevice] = {}
+        self._by_mgmt_ip: Dict[str, List[NetworkDevice]] = {}
+        self._by_subnet_site: Dict[Tuple[str, str], List[NetworkDevice]] = {}
+        # IP version -> prefix length -> network key -> devices
+        self._subnet_index: Dict[int, Dict[int, Dict[int, List[NetworkDevice]]]] = {}
+        # IP version -> prefix lengths present, ascending
+        self._prefix_lengths: Dict[int, List[int]] = {}
         self._load_warnings: List[str] = []
 
         if inventory_file:
@@ -43,11 +55,7 @@ class DeviceInventory:
 
         logger.info(f"Loading inventory from {file_path}")
 
-        with open(file_path, 'r') as f:
-            if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                data = yaml.safe_load(f)
-            else:
-                data = json.load(f)
+        data = load_data_file(file_path)
 
         # Parse devices
         devices_data = data.get('devices', [])
@@ -76,30 +84,57 @@ class DeviceInventory:
             device: NetworkDevice to add
         """
         # Detect duplicate management IPs
-        for existing in self.devices:
-            if device.management_ip and existing.management_ip == device.management_ip and existing.hostname != device.hostname:
-                warning = f"Duplicate management IP {device.management_ip}: {existing.hostname} and {device.hostname}"
-                self._load_warnings.append(warning)
-                logger.warning(warning)
+        if device.management_ip:
+            for existing in self._by_mgmt_ip.get(device.management_ip, ()):
+                if existing.hostname != device.hostname:
+                    warning = f"Duplicate management IP {device.management_ip}: {existing.hostname} and {device.hostname}"
+                    self._load_warnings.append(warning)
+                    logger.warning(warning)
 
         self.devices.append(device)
+        # First device added under a hostname wins, as with a linear scan
+        self._by_hostname.setdefault(device.hostname, device)
+        self._by_mgmt_ip.setdefault(device.management_ip, []).append(device)
 
         for subnet in device.subnets:
-            if subnet not in self.subnet_map:
-                self.subnet_map[subnet] = []
-            else:
+            if device.site:
                 # Check for same-site overlap
-                existing_devices = self.subnet_map[subnet]
-                for existing in existing_devices:
-                    if existing.site and device.site and existing.site == device.site:
-                        warning = f"Overlapping subnet {subnet} at site {device.site}: {existing.hostname} and {device.hostname}"
-                        self._load_warnings.append(warning)
-                        logger.warning(warning)
-            self.subnet_map[subnet].append(device)
+                same_site = self._by_subnet_site.setdefault((subnet, device.site), [])
+                for existing in same_site:
+                    warning = f"Overlapping subnet {subnet} at site {device.site}: {existing.hostname} and {device.hostname}"
+                    self._load_warnings.append(warning)
+                    logger.warning(warning)
+                same_site.append(device)
+            self.subnet_map.setdefault(subnet, []).append(device)
+            self._index_subnet(subnet, device)
+
+    def _index_subnet(self, subnet: str, device: NetworkDevice) -> None:
+        """
+        Record a device subnet in the longest-prefix-match index.
+
+        Subnets that do not parse as a network are left out of the index, so
+        they never match a lookup.
+
+        Args:
+            subnet: Subnet in CIDR notation
+            device: Device owning the subnet
+        """
+        try:
+            network = ipaddress.ip_network(subnet, strict=False)
+        except ValueError:
+            return
+
+        by_length = self._subnet_index.setdefault(network.version, {})
+        if network.prefixlen not in by_length:
+            by_length[network.prefixlen] = {}
+            bisect.insort(self._prefix_lengths.setdefault(network.version, []), network.prefixlen)
+
+        key = _network_key(int(network.network_address), network.prefixlen, network.max_prefixlen)
+        by_length[network.prefixlen].setdefault(key, []).append(device)
 
     def find_device_by_ip(self, ip: str) -> List[NetworkDevice]:
         """Find all devices with this management IP."""
-        return [d for d in self.devices if d.management_ip == ip]
+        return list(self._by_mgmt_ip.get(ip, ()))
 
     def find_device_by_hostname(self, hostname: str) -> Optional[NetworkDevice]:
         """
@@ -111,31 +146,42 @@ class DeviceInventory:
         Returns:
             NetworkDevice or None
         """
-        for device in self.devices:
-            if device.hostname == hostname:
-                return device
-        return None
+        return self._by_hostname.get(hostname)
 
     def find_device_for_subnet(self, ip: str) -> List[NetworkDevice]:
-        """Find all devices owning a subnet that contains this IP, using longest prefix match."""
-        matches: List[tuple] = []  # (prefix_length, device)
-        for subnet, devices in self.subnet_map.items():
-            if ip_in_network(ip, subnet):
-                prefix_len = get_prefix_length(subnet)
-                for device in devices:
-                    matches.append((prefix_len, device))
-
-        if not matches:
+        """
+        Find all devices owning a subnet that contains this IP, using longest prefix match.
+
+        Probes the subnet index once per distinct prefix length, longest
+        first, so the cost depends on the number of prefix lengths in the
+        inventory rather than the number of subnets.
+
+        Args:
+            ip: IP address to look up
+
+        Returns:
+            Devices owning the longest matching subnet, or an empty list
+        """
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return []
+
+        by_length = self._subnet_index.get(address.version)
+        if not by_length:
             return []
 
-        # Find the longest prefix length
-        longest = max(m[0] for m in matches)
-        # Return only devices at the longest prefix length
-        return [d for plen, d in matches if plen == longest]
+        address_int = int(address)
+        max_prefix_len = address.max_prefixlen
+        for prefix_len in reversed(self._prefix_lengths[address.version]):
+            devices = by_length[prefix_len].get(_network_key(address_int, prefix_len, max_prefix_len))
+            if devices:
+                return list(devices)
+        return []
 
     def get_all_devices(self) -> List[NetworkDevice]:
         """Get all devices in inventory."""
-        return self.devices
+        return list(self.devices)
 
     def get_warnings(self) -> List[str]:
         """Return any warnings generated during inventory loading."""
@@ -175,10 +221,6 @@ class DeviceInventory:
         """
         data = self.export_to_dict()
 
-        with open(file_path, 'w') as f:
-            if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                yaml.dump(data, f, default_flow_style=False)
-            else:
-                json.dump(data, f, indent=2)
+        save_data_file(data, file_path)
 
         logger.info(f"Saved inventory to {file_path}")
@@ -1,13 +1,23 @@
-"""Network device drivers."""
+"""Network device drivers.
 
-from .base import NetworkDriver
-from .cisco_ios import CiscoIOSDriver
-from .arista_eos import AristaEOSDriver
-from .paloalto import PaloAltoDriver
-from .aruba import ArubaDriver
-from .cisco_asa import CiscoASADriver
-from .juniper_srx import JuniperSRXDriver
-from .cisco_ftd import CiscoFTDDriver
+Driver classes are imported on first attribute access, so importing one
+driver module does not load every other vendor's driver and parser.
+"""
+
+import importlib
+from typing import List
+
+# Exported name -> submodule defining it
+_DRIVER_MODULES = {
+    'NetworkDriver': 'base',
+    'CiscoIOSDriver': 'cisco_ios',
+    'AristaEOSDriver': 'arista_eos',
+    'PaloAltoDriver': 'paloalto',
+    'ArubaDriver': 'aruba',
+    'CiscoASADriver': 'cisco_asa',
+    'JuniperSRXDriver': 'juniper_srx',
+    'CiscoFTDDriver': 'cisco_ftd',
+}
 
 __all__ = [
     'NetworkDriver',
@@ -19,3 +29,18 @@ __all__ = [
     'JuniperSRXDriver',
     'CiscoFTDDriver',
 ]
+
+
+def __getattr__(name: str) -> type:
+    """Import and return a driver class the first time it is accessed."""
+    module_name = _DRIVER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including drivers not imported yet."""
+    return sorted(set(globals()) | set(__all__))
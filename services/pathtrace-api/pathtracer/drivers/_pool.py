@@ -0,0 +1,189 @@
+"""Process-wide pool of idle device sessions shared by driver instances.
+
+A driver checks a session out in connect() and back in on disconnect(),
+so the next trace through the same device skips the TCP, SSH and login
+round trips. Settings are read from the environment at import:
+
+    CONNECTION_POOL_ENABLED       "0", "false", "no" or "off" disables pooling
+    CONNECTION_POOL_MAX_SIZE      idle sessions kept per key (default 4)
+    CONNECTION_POOL_IDLE_TIMEOUT  seconds a session may sit idle (default 300)
+    CONNECTION_POOL_MAX_AGE       seconds a session may live in total (default 3600)
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv('CONNECTION_POOL_ENABLED', '1').lower() not in ('0', 'false', 'no', 'off')
+MAX_SIZE = int(os.getenv('CONNECTION_POOL_MAX_SIZE', '4'))
+IDLE_TIMEOUT = float(os.getenv('CONNECTION_POOL_IDLE_TIMEOUT', '300'))
+MAX_AGE = float(os.getenv('CONNECTION_POOL_MAX_AGE', '3600'))
+
+# Seconds between reaper sweeps of the idle sessions
+_REAP_INTERVAL = 30.0
+
+_lock = threading.Lock()
+# Pool key -> idle (connection, last_used, created_at), most recently used last
+_idle: Dict[Hashable, Deque[Tuple[Any, float, float]]] = {}
+# id(connection) -> created_at for sessions currently checked out
+_created: Dict[int, float] = {}
+_reaper: Optional[threading.Thread] = None
+
+
+def _close(connection: Any) -> None:
+    """Disconnect a session that is leaving the pool, ignoring errors."""
+    try:
+        connection.disconnect()
+    except Exception as e:
+        logger.debug("Error closing pooled session: %s", e)
+
+
+def _ready(connection: Any) -> bool:
+    """
+    Return whether an idle session can be handed out again.
+
+    The session must still be alive, and any output left unread in its
+    channel is dropped so it cannot be mistaken for the next command's.
+    Errors count as not ready.
+    """
+    try:
+        if not connection.is_alive():
+            return False
+        connection.clear_buffer()
+        return True
+    except Exception:
+        return False
+
+
+def _reap() -> None:
+    """Close idle sessions past IDLE_TIMEOUT or MAX_AGE."""
+    now = time.monotonic()
+    expired = []
+    with _lock:
+        for key in list(_idle):
+            keep: Deque[Tuple[Any, float, float]] = deque()
+            for entry in _idle[key]:
+                if now - entry[1] >= IDLE_TIMEOUT or now - entry[2] >= MAX_AGE:
+                    expired.append(entry[0])
+                else:
+                    keep.append(entry)
+            if keep:
+                _idle[key] = keep
+            else:
+                del _idle[key]
+    for connection in expired:
+        _close(connection)
+
+
+def _run_reaper() -> None:
+    """Sweep the pool every _REAP_INTERVAL seconds for the life of the process."""
+    while True:
+        time.sleep(_REAP_INTERVAL)
+        _reap()
+
+
+def _start_reaper() -> None:
+    """Start the reaper thread on first use."""
+    global _reaper
+    with _lock:
+        if _reaper is not None:
+            return
+        _reaper = threading.Thread(target=_run_reaper, name="connection-pool-reaper", daemon=True)
+        _reaper.start()
+
+
+def acquire(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Check out a session for key, opening one with factory if none is idle.
+
+    Idle sessions are tried most recently used first; any that are past
+    MAX_AGE, fail is_alive() or cannot have their buffer cleared are
+    closed and skipped.
+
+    Args:
+        key: Identifies interchangeable sessions (host, port, user, device type)
+        factory: Opens a new session; its exceptions propagate
+
+    Returns:
+        A connected session, owned by the caller until release()
+    """
+    if not ENABLED:
+        return factory()
+
+    _start_reaper()
+    while True:
+        with _lock:
+            entries = _idle.get(key)
+            entry = entries.pop() if entries else None
+            if entries is not None and not entries:
+                del _idle[key]
+        if entry is None:
+            break
+        connection, _last_used, created_at = entry
+        if time.monotonic() - created_at < MAX_AGE and _ready(connection):
+            with _lock:
+                _created[id(connection)] = created_at
+            logger.debug("Reusing pooled session for %s", key)
+            return connection
+        _close(connection)
+
+    connection = factory()
+    with _lock:
+        _created[id(connection)] = time.monotonic()
+    return connection
+
+
+def release(key: Hashable, connection: Any) -> None:
+    """
+    Return a session to the pool, or close it if the pool cannot keep it.
+
+    Sessions are closed when pooling is disabled, the key already holds
+    MAX_SIZE idle sessions, or the session is past MAX_AGE.
+
+    Args:
+        key: The key the session was acquired under
+        connection: Session returned by acquire()
+    """
+    if ENABLED:
+        now = time.monotonic()
+        with _lock:
+            created_at = _created.pop(id(connection), now)
+            if now - created_at < MAX_AGE and len(_idle.get(key, ())) < MAX_SIZE:
+                _idle.setdefault(key, deque()).append((connection, now, created_at))
+                return
+    _close(connection)
+
+
+def discard(connection: Any) -> None:
+    """
+    Close a checked-out session without returning it to the pool.
+
+    For sessions that saw a failed command: unread output may still be
+    in the channel, so they must not be handed to another caller.
+
+    Args:
+        connection: Session returned by acquire()
+    """
+    with _lock:
+        _created.pop(id(connection), None)
+    _close(connection)
+
+
+def close_all() -> None:
+    """Close every idle session, e.g. at shutdown."""
+    with _lock:
+        connections = [entry[0] for entries in _idle.values() for entry in entries]
+        _idle.clear()
+    for connection in connections:
+        _close(connection)
+
+
+# Log out of idle sessions on interpreter exit instead of dropping the sockets
+atexit.register(close_all)
@@ -24,6 +24,12 @@ class AristaEOSDriver(NetworkDriver):
         super().__init__(device, credentials, config)
         self.parser = AristaParser()
         self.device_type = 'arista_eos'
+        # VRF list is static for the life of a session; cleared on disconnect
+        self._vrf_cache: Optional[List[str]] = None
+
+    def _cache_clear(self) -> None:
+        """Drop per-connection cached command results."""
+        self._vrf_cache = None
 
     def connect(self) -> None:
         """Establish SSH connection to Arista EOS device."""
@@ -34,8 +40,17 @@ class AristaEOSDriver(NetworkDriver):
                 'username': self.credentials.username,
                 'timeout': self.config.get('ssh_timeout', 30),
                 'session_timeout': self.config.get('command_timeout', 60),
+                # Netmiko pacing: fast_cli skips fixed waits where it can and
+                # global_delay_factor scales the ones left, which dominate
+                # wall time for short outputs
+                'fast_cli': self.config.get('fast_cli', True),
+                'global_delay_factor': self.config.get('global_delay_factor', 0.1),
             }
 
+            # Session transcripts cost a file write per read; only on request
+            if self.config.get('session_log'):
+                connection_params['session_log'] = self.config['session_log']
+
             # Add authentication method
             if self.credentials.has_key():
                 connection_params['use_keys'] = True
@@ -45,11 +60,11 @@ class AristaEOSDriver(NetworkDriver):
             else:
                 raise AuthenticationError("No valid authentication method provided")
 
-            logger.debug(f"Connecting to {self.device.hostname} ({self.device.management_ip})")
+            logger.debug("Connecting to %s (%s)", self.device.hostname, self.device.management_ip)
             self.connection = ConnectHandler(**connection_params)
 
             self._connected = True
-            logger.info(f"Successfully connected to {self.device.hostname}")
+            logger.info("Successfully connected to %s", self.device.hostname)
 
         except NetmikoAuthenticationException as e:
             raise AuthenticationError(f"Authentication failed for {self.device.hostname}: {e}")
@@ -63,12 +78,13 @@ class AristaEOSDriver(NetworkDriver):
         if self.connection:
             try:
                 self.connection.disconnect()
-                logger.debug(f"Disconnected from {self.device.hostname}")
+                logger.debug("Disconnected from %s", self.device.hostname)
             except Exception as e:
-                logger.warning(f"Error disconnecting from {self.device.hostname}: {e}")
+                logger.warning("Error disconnecting from %s: %s", self.device.hostname, e)
             finally:
                 self._connected = False
                 self.connection = None
+                self._cache_clear()
 
     def get_route(self, destination: str, context: str = None) -> Optional[RouteEntry]:
         """
@@ -93,19 +109,19 @@ class AristaEOSDriver(NetworkDriver):
             else:
                 command = f"show ip route {destination}"
 
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command)
             elapsed_ms = (time.time() - start_time) * 1000
 
-            logger.debug(f"Command completed in {elapsed_ms:.2f}ms")
+            logger.debug("Command completed in %.2fms", elapsed_ms)
 
             # Parse output
             route = self.parser.parse_route_entry(output, destination, context or "default")
 
             if route:
-                logger.debug(f"Found route: {route.destination} via {route.next_hop}")
+                logger.debug("Found route: %s via %s", route.destination, route.next_hop)
             else:
-                logger.debug(f"No route found for {destination}")
+                logger.debug("No route found for %s", destination)
 
             return route
 
@@ -132,12 +148,12 @@ class AristaEOSDriver(NetworkDriver):
             else:
                 command = "show ip route"
 
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command, read_timeout=90)
 
             # Parse output
             routes = self.parser.parse_routing_table(output, context or "default")
-            logger.debug(f"Parsed {len(routes)} routes from routing table")
+            logger.debug("Parsed %s routes from routing table", len(routes))
 
             return routes
 
@@ -148,27 +164,36 @@ class AristaEOSDriver(NetworkDriver):
         """
         List all VRFs.
 
+        The result is cached until disconnect.
+
         Returns:
             List of VRF names
         """
         if not self._connected:
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
 
+        if self._vrf_cache is not None:
+            return list(self._vrf_cache)
+
         try:
             output = self.connection.send_command("show vrf")
             vrfs = self.parser.parse_vrf_list(output)
 
-            logger.debug(f"Found VRFs: {vrfs}")
-            return vrfs
+            logger.debug("Found VRFs: %s", vrfs)
+            self._vrf_cache = vrfs
+            return list(vrfs)
 
         except Exception as e:
-            logger.warning(f"Failed to list VRFs: {e}")
+            logger.warning("Failed to list VRFs: %s", e)
             return ["default"]
 
     def get_interface_to_context_mapping(self) -> Dict[str, str]:
         """
         Map interfaces to their VRFs.
 
+        When the device reports no VRF besides "default", the running
+        config is not read at all.
+
         Returns:
             Dictionary mapping interface name to VRF name
         """
@@ -180,33 +205,35 @@ class AristaEOSDriver(NetworkDriver):
             output = self.connection.send_command("show ip interface brief")
             interfaces = self.parser.parse_interfaces(output)
 
-            # For each interface, check its VRF
-            mapping = {}
-            for interface in interfaces.keys():
-                try:
-                    vrf_output = self.connection.send_command(f"show run interface {interface} | include vrf")
-                    if "vrf" in vrf_output.lower() and "member" in vrf_output.lower():
-                        # vrf member VRF_NAME
-                        parts = vrf_output.split()
-                        for i, part in enumerate(parts):
-                            if part.lower() == "member" and i + 1 < len(parts):
-                                mapping[interface] = parts[i + 1]
-                                break
-                    else:
-                        mapping[interface] = "default"
-                except:
-                    mapping[interface] = "default"
+            # Only trust a VRF list that was actually read (and is now
+            # cached); a failed 'show vrf' also answers ["default"]
+            self.list_logical_contexts()
+            if self._vrf_cache == ["default"]:
+                return {interface: "default" for interface in interfaces}
+
+            # One config dump for every interface's VRF, not a command per interface
+            try:
+                vrf_output = self.connection.send_command("show running-config | section interface")
+                vrf_map = self.parser.parse_interface_vrf_table(vrf_output)
+            except Exception as e:
+                logger.warning("Failed to read interface VRFs, assuming default: %s", e)
+                vrf_map = {}
+
+            mapping = {interface: vrf_map.get(interface, "default") for interface in interfaces}
 
             return mapping
 
         except Exception as e:
-            logger.warning(f"Failed to get interface VRF mapping: {e}")
+            logger.warning("Failed to get interface VRF mapping: %s", e)
             return {}
 
     def detect_device_info(self) -> Dict:
         """
         Return device hostname, version, model.
 
+        Uses 'show version', plus 'show hostname' when the version output
+        does not name the device.
+
         Returns:
             Dictionary with keys: hostname, version, model, serial
         """
@@ -214,46 +241,21 @@ class AristaEOSDriver(NetworkDriver):
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
 
         try:
-            info = {
-                'hostname': '',
-                'version': '',
-                'model': '',
-                'serial': ''
-            }
+            output = self.connection.send_command("show version")
+            info = self.parser.parse_show_version(output)
 
-            # Get hostname
-            hostname_output = self.connection.send_command("show hostname")
-            if hostname_output:
-                info['hostname'] = hostname_output.strip().split()[0]
-
-            # Get version
-            version_output = self.connection.send_command("show version | include Software")
-            if version_output:
-                info['version'] = version_output.strip()
-
-            # Get model and serial
-            inventory_output = self.connection.send_command("show version | include Serial")
-            if inventory_output:
-                # Extract serial number
-                if 'Serial' in inventory_output:
-                    parts = inventory_output.split()
-                    for i, part in enumerate(parts):
-                        if part.lower() == 'number:' and i + 1 < len(parts):
-                            info['serial'] = parts[i + 1]
-
-            # Get model
-            model_output = self.connection.send_command("show version | include model")
-            if model_output:
-                parts = model_output.split()
-                if 'model:' in model_output.lower():
-                    for i, part in enumerate(parts):
-                        if part.lower() == 'model:' and i + 1 < len(parts):
-                            info['model'] = parts[i + 1]
+            # 'show version' carries no hostname on most EOS releases
+            if not info['hostname']:
+                hostname_output = self.connection.send_command("show hostname")
+                info['hostname'] = (
+                    self.parser.parse_show_version(hostname_output)['hostname']
+                    or self.device.hostname
+                )
 
             return info
 
         except Exception as e:
-            logger.warning(f"Failed to detect device info: {e}")
+            logger.warning("Failed to detect device info: %s", e)
             return {'hostname': self.device.hostname, 'version': '', 'model': '', 'serial': ''}
 
     def get_interface_detail(self, interface_name: str) -> Optional[InterfaceDetail]:
@@ -262,9 +264,9 @@ class AristaEOSDriver(NetworkDriver):
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
         try:
             command = f"show interfaces {interface_name}"
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command)
             return self.parser.parse_interface_detail(output)
         except Exception as e:
-            logger.warning(f"Failed to get interface detail for {interface_name}: {e}")
+            logger.warning("Failed to get interface detail for %s: %s", interface_name, e)
             return None
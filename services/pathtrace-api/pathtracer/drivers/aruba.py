@@ -186,16 +186,17 @@ class ArubaDriver(NetworkDriver):
             for interface in interfaces.keys():
                 try:
                     vrf_output = self.connection.send_command(f"show run interface {interface} | include vrf")
-                    if "vrf attach" in vrf_output.lower():
+                    start = vrf_output.lower().find("vrf attach")
+                    if start >= 0:
                         # vrf attach VRF_NAME
-                        parts = vrf_output.split()
-                        for i, part in enumerate(parts):
-                            if part.lower() == "attach" and i + 1 < len(parts):
-                                mapping[interface] = parts[i + 1]
-                                break
+                        rest = vrf_output[start + len("vrf attach"):]
+                        vrf = rest.split(None, 1) if rest[:1].isspace() else []
+                        if vrf:
+                            mapping[interface] = vrf[0]
                     else:
                         mapping[interface] = "default"
-                except:
+                except Exception:
+                    # One unreadable interface should not fail the whole map
                     mapping[interface] = "default"
 
             return mapping
@@ -238,7 +239,7 @@ class ArubaDriver(NetworkDriver):
             # Get hostname
             hostname_output = self.connection.send_command("show run | include hostname")
             if "hostname" in hostname_output:
-                info['hostname'] = hostname_output.split("hostname")[1].strip().split()[0]
+                info['hostname'] = hostname_output.partition("hostname")[2].split(None, 1)[0]
 
             # Get version
             version_output = self.connection.send_command("show version | include Version")
@@ -26,6 +26,33 @@ class CiscoASADriver(NetworkDriver):
         super().__init__(device, credentials, config)
         self.parser = CiscoASAParser()
         self.device_type = 'cisco_asa'
+        # Context list and nameif table are static for the life of a
+        # session; both are cleared on disconnect
+        self._context_cache: Optional[List[str]] = None
+        self._nameif_cache: Optional[Dict[str, str]] = None
+        # Source IP -> packet-tracer input nameif (None when unresolvable)
+        self._input_iface_cache: Dict[str, Optional[str]] = {}
+
+    def _cache_clear(self) -> None:
+        """Drop per-connection cached command results."""
+        self._context_cache = None
+        self._nameif_cache = None
+        self._input_iface_cache = {}
+
+    def _get_nameif_mapping(self) -> Dict[str, str]:
+        """
+        Return the physical interface to nameif mapping from 'show nameif'.
+
+        The command runs once per connection; later calls reuse the parsed
+        table. Command errors propagate to the caller and are not cached.
+
+        Returns:
+            Dictionary mapping physical interface name to nameif name
+        """
+        if self._nameif_cache is None:
+            output = self.connection.send_command("show nameif")
+            self._nameif_cache = self.parser.parse_nameif_mapping(output)
+        return self._nameif_cache
 
     def connect(self) -> None:
         """Establish SSH connection to Cisco ASA device."""
@@ -36,8 +63,17 @@ class CiscoASADriver(NetworkDriver):
                 'username': self.credentials.username,
                 'timeout': self.config.get('ssh_timeout', 30),
                 'session_timeout': self.config.get('command_timeout', 60),
+                # Netmiko pacing: fast_cli skips fixed waits where it can and
+                # global_delay_factor scales the ones left, which dominate
+                # wall time for short outputs
+                'fast_cli': self.config.get('fast_cli', True),
+                'global_delay_factor': self.config.get('global_delay_factor', 0.1),
             }
 
+            # Session transcripts cost a file write per read; only on request
+            if self.config.get('session_log'):
+                connection_params['session_log'] = self.config['session_log']
+
             # Add authentication method
             if self.credentials.has_key():
                 connection_params['use_keys'] = True
@@ -51,11 +87,11 @@ class CiscoASADriver(NetworkDriver):
             if self.credentials.secret:
                 connection_params['secret'] = self.credentials.secret
 
-            logger.debug(f"Connecting to {self.device.hostname} ({self.device.management_ip})")
+            logger.debug("Connecting to %s (%s)", self.device.hostname, self.device.management_ip)
             self.connection = ConnectHandler(**connection_params)
 
             self._connected = True
-            logger.info(f"Successfully connected to {self.device.hostname}")
+            logger.info("Successfully connected to %s", self.device.hostname)
 
         except NetmikoAuthenticationException as e:
             raise AuthenticationError(f"Authentication failed for {self.device.hostname}: {e}")
@@ -69,12 +105,13 @@ class CiscoASADriver(NetworkDriver):
         if self.connection:
             try:
                 self.connection.disconnect()
-                logger.debug(f"Disconnected from {self.device.hostname}")
+                logger.debug("Disconnected from %s", self.device.hostname)
             except Exception as e:
-                logger.warning(f"Error disconnecting from {self.device.hostname}: {e}")
+                logger.warning("Error disconnecting from %s: %s", self.device.hostname, e)
             finally:
                 self._connected = False
                 self.connection = None
+                self._cache_clear()
 
     def get_route(self, destination: str, context: str = None) -> Optional[RouteEntry]:
         """
@@ -96,18 +133,18 @@ class CiscoASADriver(NetworkDriver):
             ctx = context if context and context != "system" else "system"
             command = f"show route {destination}"
 
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command)
             elapsed_ms = (time.time() - start_time) * 1000
 
-            logger.debug(f"Command completed in {elapsed_ms:.2f}ms")
+            logger.debug("Command completed in %.2fms", elapsed_ms)
 
             route = self.parser.parse_route_entry(output, destination, ctx)
 
             if route:
-                logger.debug(f"Found route: {route.destination} via {route.next_hop}")
+                logger.debug("Found route: %s via %s", route.destination, route.next_hop)
             else:
-                logger.debug(f"No route found for {destination}")
+                logger.debug("No route found for %s", destination)
 
             return route
 
@@ -131,11 +168,11 @@ class CiscoASADriver(NetworkDriver):
             ctx = context if context and context != "system" else "system"
             command = "show route"
 
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command, read_timeout=90)
 
             routes = self.parser.parse_routing_table(output, ctx)
-            logger.debug(f"Parsed {len(routes)} routes from routing table")
+            logger.debug("Parsed %s routes from routing table", len(routes))
 
             return routes
 
@@ -146,43 +183,27 @@ class CiscoASADriver(NetworkDriver):
         """
         List all security contexts (multi-context mode) or return ["system"].
 
+        The result is cached until disconnect.
+
         Returns:
             List of security context names
         """
         if not self._connected:
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
 
+        if self._context_cache is not None:
+            return list(self._context_cache)
+
         try:
             output = self.connection.send_command("show context")
+            contexts = self.parser.parse_context_list(output)
 
-            # If the command returns meaningful output, parse context names
-            contexts = []
-            if output and output.strip():
-                lines = output.strip().split("\n")
-                for line in lines:
-                    stripped = line.strip()
-                    # Skip headers, separator lines, and empty lines
-                    if not stripped or stripped.startswith("Context") or stripped.startswith("---") or stripped.startswith("*"):
-                        continue
-                    # Skip lines that look like error messages
-                    if "not supported" in stripped.lower() or "not available" in stripped.lower():
-                        return ["system"]
-                    parts = stripped.split()
-                    if parts:
-                        contexts.append(parts[0])
-
-            if not contexts:
-                contexts = ["system"]
-
-            # Always include system
-            if "system" not in contexts:
-                contexts.insert(0, "system")
-
-            logger.debug(f"Found security contexts: {contexts}")
-            return contexts
+            logger.debug("Found security contexts: %s", contexts)
+            self._context_cache = contexts
+            return list(contexts)
 
         except Exception as e:
-            logger.warning(f"Failed to list security contexts: {e}")
+            logger.warning("Failed to list security contexts: %s", e)
             return ["system"]
 
     def get_interface_to_context_mapping(self) -> Dict[str, str]:
@@ -198,13 +219,12 @@ class CiscoASADriver(NetworkDriver):
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
 
         try:
-            output = self.connection.send_command("show nameif")
-            mapping = self.parser.parse_nameif_mapping(output)
-            logger.debug(f"Found nameif mapping: {mapping}")
+            mapping = dict(self._get_nameif_mapping())
+            logger.debug("Found nameif mapping: %s", mapping)
             return mapping
 
         except Exception as e:
-            logger.warning(f"Failed to get nameif mapping: {e}")
+            logger.warning("Failed to get nameif mapping: %s", e)
             return {}
 
     def detect_device_info(self) -> Dict:
@@ -220,41 +240,8 @@ class CiscoASADriver(NetworkDriver):
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
 
         try:
-            info = {
-                'hostname': '',
-                'version': '',
-                'model': '',
-                'serial': ''
-            }
-
             output = self.connection.send_command("show version")
-            lines = output.split('\n')
-
-            for line in lines:
-                lower = line.lower().strip()
-
-                # Cisco Adaptive Security Appliance Software Version 9.16(3)
-                if 'software version' in lower:
-                    version_match = line.split('Version')
-                    if len(version_match) > 1:
-                        info['version'] = version_match[-1].strip()
-
-                # Hardware:   ASA5525, 8192 MB RAM
-                elif lower.startswith('hardware:'):
-                    parts = line.split(':', 1)[1].strip().split(',')
-                    if parts:
-                        info['model'] = parts[0].strip()
-
-                # Serial Number: ABC12345678
-                elif 'serial number:' in lower:
-                    info['serial'] = line.split(':', 1)[1].strip()
-
-                # hostname
-                elif line.strip().endswith('up'):
-                    # "<hostname> up 10 days 5 hours"
-                    hostname_match = line.strip().split()
-                    if hostname_match:
-                        info['hostname'] = hostname_match[0]
+            info = self.parser.parse_show_version(output)
 
             # Fallback hostname from device object
             if not info['hostname']:
@@ -263,7 +250,7 @@ class CiscoASADriver(NetworkDriver):
             return info
 
         except Exception as e:
-            logger.warning(f"Failed to detect device info: {e}")
+            logger.warning("Failed to detect device info: %s", e)
             return {'hostname': self.device.hostname, 'version': '', 'model': '', 'serial': ''}
 
     def get_interface_detail(self, interface_name: str) -> Optional[InterfaceDetail]:
@@ -281,11 +268,11 @@ class CiscoASADriver(NetworkDriver):
 
         try:
             command = f"show interface {interface_name}"
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command)
             return self.parser.parse_interface_detail(output)
         except Exception as e:
-            logger.warning(f"Failed to get interface detail for {interface_name}: {e}")
+            logger.warning("Failed to get interface detail for %s: %s", interface_name, e)
             return None
 
     def get_zone_for_interface(self, interface_name: str) -> Optional[str]:
@@ -305,18 +292,15 @@ class CiscoASADriver(NetworkDriver):
             return None
 
         try:
-            output = self.connection.send_command("show nameif")
-            mapping = self.parser.parse_nameif_mapping(output)
-
             # Look up the nameif for the given physical interface
-            nameif = mapping.get(interface_name)
+            nameif = self._get_nameif_mapping().get(interface_name)
             if nameif:
-                logger.debug(f"Interface {interface_name} has nameif '{nameif}'")
+                logger.debug("Interface %s has nameif '%s'", interface_name, nameif)
             else:
-                logger.debug(f"No nameif found for interface {interface_name}")
+                logger.debug("No nameif found for interface %s", interface_name)
             return nameif
         except Exception as e:
-            logger.warning(f"Failed to get zone for interface {interface_name}: {e}")
+            logger.warning("Failed to get zone for interface %s: %s", interface_name, e)
             return None
 
     def lookup_security_policy(
@@ -353,13 +337,13 @@ class CiscoASADriver(NetworkDriver):
                 f" {dest_ip} {port}"
                 f" detailed"
             )
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command, read_timeout=60)
 
             policy_result, _nat_result = self.parser.parse_packet_tracer(output)
             return policy_result
         except Exception as e:
-            logger.warning(f"Failed to lookup security policy: {e}")
+            logger.warning("Failed to lookup security policy: %s", e)
             return None
 
     def lookup_nat(
@@ -403,13 +387,13 @@ class CiscoASADriver(NetworkDriver):
                 f" {dest_ip} {port}"
                 f" detailed"
             )
-            logger.debug(f"Executing: {command}")
+            logger.debug("Executing: %s", command)
             output = self.connection.send_command(command, read_timeout=60)
 
             _policy_result, nat_result = self.parser.parse_packet_tracer(output)
             return nat_result
         except Exception as e:
-            logger.warning(f"Failed to lookup NAT policy: {e}")
+            logger.warning("Failed to lookup NAT policy: %s", e)
             return None
 
     def _resolve_input_interface(self, source_ip: str) -> Optional[str]:
@@ -418,6 +402,8 @@ class CiscoASADriver(NetworkDriver):
 
         Looks up the route for source_ip and maps the outgoing interface
         (which on ASA is already a nameif name) to use as packet-tracer input.
+        Answers are remembered per source IP until disconnect, unless a
+        command failed while producing them.
 
         Args:
             source_ip: Source IP address
@@ -425,21 +411,30 @@ class CiscoASADriver(NetworkDriver):
         Returns:
             Nameif name string, or None if unable to resolve
         """
+        if source_ip in self._input_iface_cache:
+            return self._input_iface_cache[source_ip]
+
+        interface = None
+        failed = False
         try:
             output = self.connection.send_command(f"show route {source_ip}")
             route = self.parser.parse_route_entry(output, source_ip, "system")
             if route and route.outgoing_interface:
-                return route.outgoing_interface
+                interface = route.outgoing_interface
         except Exception as e:
-            logger.debug(f"Failed to resolve input interface for {source_ip}: {e}")
+            failed = True
+            logger.debug("Failed to resolve input interface for %s: %s", source_ip, e)
 
         # Fallback: try to get first nameif
-        try:
-            output = self.connection.send_command("show nameif")
-            mapping = self.parser.parse_nameif_mapping(output)
-            if mapping:
-                return next(iter(mapping.values()))
-        except Exception as e:
-            logger.debug(f"Failed to get fallback nameif: {e}")
+        if interface is None:
+            try:
+                mapping = self._get_nameif_mapping()
+                if mapping:
+                    interface = next(iter(mapping.values()))
+            except Exception as e:
+                failed = True
+                logger.debug("Failed to get fallback nameif: %s", e)
 
-        return None
+        if not failed:
+            self._input_iface_cache[source_ip] = interface
+        return interface
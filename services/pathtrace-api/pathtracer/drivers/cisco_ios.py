@@ -208,7 +208,8 @@ class CiscoIOSDriver(NetworkDriver):
                         mapping[interface] = vrf_name
                     else:
                         mapping[interface] = "global"
-                except:
+                except Exception:
+                    # One unreadable interface should not fail the whole map
                     mapping[interface] = "global"
 
             return mapping
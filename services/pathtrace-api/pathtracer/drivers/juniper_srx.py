@@ -7,6 +7,7 @@ from typing import List, Dict, Optional
 from netmiko import ConnectHandler
 from netmiko.exceptions import NetmikoTimeoutException, NetmikoAuthenticationException
 
+from . import _pool
 from .base import NetworkDriver
 from ..models import (
     RouteEntry, NetworkDevice, CredentialSet, InterfaceDetail,
@@ -26,6 +27,32 @@ class JuniperSRXDriver(NetworkDriver):
         super().__init__(device, credentials, config)
         self.parser = JuniperSRXParser()
         self.device_type = 'juniper_junos'
+        # Sessions in the process-wide pool are interchangeable per this key
+        self._pool_key = (
+            device.management_ip, self.config.get('port', 22), credentials.username, self.device_type
+        )
+        # Set once a command fails on this session; it is closed, not pooled
+        self._session_dirty = False
+
+    def _send_command(self, command: str, **kwargs) -> str:
+        """
+        Run a command, marking the session dirty if it fails.
+
+        A timed-out or failed command can leave output unread in the
+        channel, so such a session must not go back to the pool.
+
+        Args:
+            command: CLI command to send
+            **kwargs: Passed through to the connection's send_command
+
+        Returns:
+            Command output
+        """
+        try:
+            return self.connection.send_command(command, **kwargs)
+        except Exception:
+            self._session_dirty = True
+            raise
 
     def connect(self) -> None:
         """Establish SSH connection to Juniper SRX device."""
@@ -33,6 +60,7 @@ class JuniperSRXDriver(NetworkDriver):
             connection_params = {
                 'device_type': self.device_type,
                 'host': self.device.management_ip,
+                'port': self._pool_key[1],
                 'username': self.credentials.username,
                 'timeout': self.config.get('ssh_timeout', 30),
                 'session_timeout': self.config.get('command_timeout', 60),
@@ -48,7 +76,8 @@ class JuniperSRXDriver(NetworkDriver):
                 raise AuthenticationError("No valid authentication method provided")
 
             logger.debug(f"Connecting to {self.device.hostname} ({self.device.management_ip})")
-            self.connection = ConnectHandler(**connection_params)
+            self.connection = _pool.acquire(self._pool_key, lambda: ConnectHandler(**connection_params))
+            self._session_dirty = False
 
             self._connected = True
             logger.info(f"Successfully connected to {self.device.hostname}")
@@ -61,17 +90,27 @@ class JuniperSRXDriver(NetworkDriver):
             raise DeviceConnectionError(f"Failed to connect to {self.device.hostname}: {e}")
 
     def disconnect(self) -> None:
-        """Close SSH connection."""
+        """Hand the SSH session back to the connection pool, or close it if dirty."""
         if self.connection:
             try:
-                self.connection.disconnect()
-                logger.debug(f"Disconnected from {self.device.hostname}")
+                if self._session_dirty:
+                    _pool.discard(self.connection)
+                    logger.debug(f"Closed session to {self.device.hostname} after a failed command")
+                else:
+                    _pool.release(self._pool_key, self.connection)
+                    logger.debug(f"Released session for {self.device.hostname}")
             except Exception as e:
                 logger.warning(f"Error disconnecting from {self.device.hostname}: {e}")
             finally:
                 self._connected = False
                 self.connection = None
 
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; a session left by an exception is not pooled."""
+        if exc_type is not None:
+            self._session_dirty = True
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
     def get_route(self, destination: str, context: str = None) -> Optional[RouteEntry]:
         """
         Query routing table for specific destination.
@@ -93,7 +132,7 @@ class JuniperSRXDriver(NetworkDriver):
             command = f"show route {destination}"
 
             logger.debug(f"Executing: {command}")
-            output = self.connection.send_command(command)
+            output = self._send_command(command)
             elapsed_ms = (time.time() - start_time) * 1000
 
             logger.debug(f"Command completed in {elapsed_ms:.2f}ms")
@@ -128,7 +167,7 @@ class JuniperSRXDriver(NetworkDriver):
             command = "show route"
 
             logger.debug(f"Executing: {command}")
-            output = self.connection.send_command(command, read_timeout=90)
+            output = self._send_command(command, read_timeout=90)
 
             routes = self.parser.parse_routing_table(output, ctx)
             logger.debug(f"Parsed {len(routes)} routes from routing table")
@@ -149,7 +188,7 @@ class JuniperSRXDriver(NetworkDriver):
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
 
         try:
-            output = self.connection.send_command("show routing-instances")
+            output = self._send_command("show routing-instances")
 
             instances = []
             if output and output.strip():
@@ -188,7 +227,7 @@ class JuniperSRXDriver(NetworkDriver):
             raise DeviceConnectionError(f"Not connected to {self.device.hostname}")
 
         try:
-            output = self.connection.send_command("show routing-instances")
+            output = self._send_command("show routing-instances")
 
             mapping = {}
             current_instance = None
@@ -237,7 +276,7 @@ class JuniperSRXDriver(NetworkDriver):
                 'serial': ''
             }
 
-            output = self.connection.send_command("show version")
+            output = self._send_command("show version")
             lines = output.split('\n')
 
             for line in lines:
@@ -290,7 +329,7 @@ class JuniperSRXDriver(NetworkDriver):
         try:
             command = f"show interfaces {interface_name} extensive"
             logger.debug(f"Executing: {command}")
-            output = self.connection.send_command(command)
+            output = self._send_command(command)
             return self.parser.parse_interface_detail(output)
         except Exception as e:
             logger.warning(f"Failed to get interface detail for {interface_name}: {e}")
@@ -313,7 +352,7 @@ class JuniperSRXDriver(NetworkDriver):
             return None
 
         try:
-            output = self.connection.send_command("show security zones")
+            output = self._send_command("show security zones")
             zone_map = self.parser.parse_security_zones(output)
 
             zone = zone_map.get(interface_name)
@@ -362,7 +401,7 @@ class JuniperSRXDriver(NetworkDriver):
                 f" protocol {protocol}"
             )
             logger.debug(f"Executing: {command}")
-            output = self.connection.send_command(command)
+            output = self._send_command(command)
             return self.parser.parse_security_policy_match(output)
         except Exception as e:
             logger.warning(f"Failed to lookup security policy: {e}")
@@ -394,12 +433,12 @@ class JuniperSRXDriver(NetworkDriver):
             # Get source NAT rules
             source_command = "show security nat source rule all"
             logger.debug(f"Executing: {source_command}")
-            source_output = self.connection.send_command(source_command)
+            source_output = self._send_command(source_command)
 
             # Get destination NAT rules
             dest_command = "show security nat destination rule all"
             logger.debug(f"Executing: {dest_command}")
-            dest_output = self.connection.send_command(dest_command)
+            dest_output = self._send_command(dest_command)
 
             return self.parser.parse_nat_rules(
                 source_output, dest_output,
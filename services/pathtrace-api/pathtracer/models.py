@@ -57,7 +57,7 @@ class ResolveStatus(Enum):
     AMBIGUOUS = "ambiguous"
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkDevice:
     """Represents a network device."""
     hostname: str
@@ -80,7 +80,7 @@ class NetworkDevice:
         return self.management_ip == other.management_ip
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteEntry:
     """Represents a routing table entry."""
     destination: str  # CIDR notation
@@ -99,7 +99,7 @@ class RouteEntry:
                self.next_hop == target_ip
 
 
-@dataclass
+@dataclass(slots=True)
 class PathHop:
     """Represents one hop in the traced path."""
     sequence: int
@@ -154,7 +154,7 @@ class ResolveResult:
     candidates: List[NetworkDevice] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyResult:
     """Matched firewall security policy/rule."""
     rule_name: str
@@ -169,7 +169,7 @@ class PolicyResult:
     raw_output: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NatTranslation:
     """One direction of NAT translation."""
     original_ip: str
@@ -179,14 +179,14 @@ class NatTranslation:
     nat_rule_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NatResult:
     """NAT lookup result with separate SNAT and DNAT."""
     snat: Optional[NatTranslation] = None
     dnat: Optional[NatTranslation] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceDetail:
     """Interface operational detail."""
     name: str
@@ -228,7 +228,7 @@ class ConnectionConfig:
         return cls(**{k: v for k, v in config.items() if k in cls.__annotations__})
 
 
-@dataclass
+@dataclass(slots=True)
 class CredentialSet:
     """Credentials for device access."""
     username: str
@@ -1,10 +1,99 @@
 """Parser for Arista EOS output."""
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from ..models import RouteEntry, NextHopType, InterfaceDetail
 
 
+# One line of interest in 'show running-config | section interface': an
+# "interface <name>" header, an indented "vrf [member|forwarding] <name>"
+# statement, or any other top-level line (which ends the interface block)
+_RE_RUN_INTERFACE_VRF = re.compile(
+    r'^(?:interface[^\S\n]+(?P<interface>\S+)'
+    r'|[^\S\n]+vrf[^\S\n]+(?:(?:member|forwarding)[^\S\n]+)?(?P<vrf>\S+)[^\S\n]*$'
+    r'|\S)',
+    re.MULTILINE,
+)
+
+# Next-hop type strings, resolved once at import
+_NHT_IP = NextHopType.IP.value
+_NHT_CONNECTED = NextHopType.CONNECTED.value
+
+# Characters of a route-code token ("S", "S*", "B", "E")
+_ROUTE_CODE_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ*'
+_RE_CONNECTED = re.compile(r'directly connected,\s+(\S+)')
+_RE_VIA = re.compile(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+(\S+))?')
+
+_RE_INTERFACE_STATUS = re.compile(r'^(\S+)\s+is\s+(.+?),\s+line protocol is\s+(\S+)')
+_RE_DESCRIPTION = re.compile(r'^Description:\s+(.+)$')
+_RE_BANDWIDTH = re.compile(r'BW\s+(\d+)\s+Kbit/sec')
+_RE_SPEED = re.compile(r'duplex,\s+(\S+),')
+_RE_INPUT_RATE = re.compile(r'5 minute input rate\s+([\d.]+)\s+(\w+(?:/\w+)?)')
+_RE_OUTPUT_RATE = re.compile(r'5 minute output rate\s+([\d.]+)\s+(\w+(?:/\w+)?)')
+_RE_INPUT_ERRORS = re.compile(r'(\d+)\s+input errors')
+_RE_OUTPUT_ERRORS = re.compile(r'(\d+)\s+output errors')
+_RE_INPUT_DROPS = re.compile(r'(\d+)\s+input queue drops')
+_RE_OUTPUT_DROPS = re.compile(r'(\d+)\s+output drops')
+
+# Protocol codes, looked up after any '*' has been stripped
+_ROUTE_PROTOCOL_MAP = {
+    'C': 'connected',
+    'S': 'static',
+    'O': 'ospf',
+    'B': 'bgp',
+    'K': 'kernel',
+    'i': 'isis',
+}
+_TABLE_PROTOCOL_MAP = {
+    'C': 'connected',
+    'S': 'static',
+    'O': 'ospf',
+    'B': 'bgp',
+    'K': 'kernel',
+}
+
+# Labelled 'show version' / 'show hostname' lines. The platform comes from the
+# leading "Arista DCS-..." banner; an explicit "Model:" line overrides it.
+_RE_SHOW_VERSION = re.compile(
+    r'^[^\S\n]*(?:(?-i:Arista)[^\S\n]+(?P<platform>\S+)'
+    r'|Software image version:[^\S\n]*(?P<version>\S+)'
+    r'|Serial number:[^\S\n]*(?P<serial>\S+)'
+    r'|Model:[^\S\n]*(?P<model>\S+)'
+    r'|Hostname:[^\S\n]*(?P<hostname>\S+))',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def _split_route_line(line: str) -> Optional[Tuple[str, str, str]]:
+    """Split a stripped route line into code, network and the rest.
+
+    The code is the longest run of leading code tokens that still leaves a
+    network and at least one more token after it. Multi-token codes
+    ("B E") come back space-joined; no protocol map has such keys, so
+    they read as unknown either way.
+
+    Args:
+        line: One route line with surrounding whitespace stripped
+
+    Returns:
+        (code, network, rest) or None if the line is not a route line
+    """
+    parts = line.split(None, 2)
+    if len(parts) < 3 or parts[0].strip(_ROUTE_CODE_CHARS):
+        return None
+
+    # Common case: a single code token
+    if parts[1].strip(_ROUTE_CODE_CHARS):
+        return parts[0], parts[1], parts[2]
+
+    tokens = line.split()
+    codes = 1
+    while codes < len(tokens) - 2 and not tokens[codes].strip(_ROUTE_CODE_CHARS):
+        codes += 1
+    rest = line.split(None, codes + 1)[codes + 1]
+    return ' '.join(tokens[:codes]), tokens[codes], rest
+
+
 class AristaParser:
     """Parser for Arista EOS routing output."""
 
@@ -46,36 +135,21 @@ class AristaParser:
             # C        10.1.1.0/24 is directly connected, Ethernet1
             # S        192.168.1.0/24 [1/0] via 10.1.1.2, Ethernet1
             # O        10.2.0.0/16 [110/20] via 10.1.1.3, Ethernet2
-            match = re.match(r'^([A-Z\*\s]+)\s+(\S+)\s+(.+)$', line)
-            if match:
-                protocol_code = match.group(1).strip()
-                network = match.group(2)
-                rest = match.group(3)
-
-                # Map protocol codes
-                protocol_map = {
-                    'C': 'connected',
-                    'S': 'static',
-                    'S*': 'static',
-                    'O': 'ospf',
-                    'O*': 'ospf',
-                    'B': 'bgp',
-                    'B*': 'bgp',
-                    'K': 'kernel',
-                    'i': 'isis',
-                }
-
-                protocol = protocol_map.get(protocol_code.replace('*', ''), 'unknown')
+            route_line = _split_route_line(line)
+            if route_line:
+                protocol_code, network, rest = route_line
+
+                protocol = _ROUTE_PROTOCOL_MAP.get(protocol_code.replace('*', ''), 'unknown')
 
                 # Parse connected routes
                 if 'directly connected' in rest:
-                    match_int = re.search(r'directly connected,\s+(\S+)', rest)
+                    match_int = _RE_CONNECTED.search(rest)
                     interface = match_int.group(1) if match_int else None
 
                     return RouteEntry(
                         destination=network,
                         next_hop=interface or "",
-                        next_hop_type=NextHopType.CONNECTED.value,
+                        next_hop_type=_NHT_CONNECTED,
                         outgoing_interface=interface,
                         protocol=protocol,
                         logical_context=context,
@@ -86,7 +160,7 @@ class AristaParser:
 
                 # Parse routes with next hop
                 # [110/20] via 10.1.1.2, Ethernet1
-                match_via = re.search(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+(\S+))?', rest)
+                match_via = _RE_VIA.search(rest)
                 if match_via:
                     preference = int(match_via.group(1))
                     metric = int(match_via.group(2))
@@ -96,7 +170,7 @@ class AristaParser:
                     return RouteEntry(
                         destination=network,
                         next_hop=next_hop,
-                        next_hop_type=NextHopType.IP.value,
+                        next_hop_type=_NHT_IP,
                         outgoing_interface=interface,
                         protocol=protocol,
                         logical_context=context,
@@ -130,31 +204,21 @@ class AristaParser:
                 continue
 
             # Parse route entry
-            match = re.match(r'^([A-Z\*\s]+)\s+(\S+)\s+(.+)$', line)
-            if match:
-                protocol_code = match.group(1).strip()
-                network = match.group(2)
-                rest = match.group(3)
-
-                protocol_map = {
-                    'C': 'connected',
-                    'S': 'static',
-                    'O': 'ospf',
-                    'B': 'bgp',
-                    'K': 'kernel',
-                }
-
-                protocol = protocol_map.get(protocol_code.replace('*', ''), 'unknown')
+            route_line = _split_route_line(line)
+            if route_line:
+                protocol_code, network, rest = route_line
+
+                protocol = _TABLE_PROTOCOL_MAP.get(protocol_code.replace('*', ''), 'unknown')
 
                 # Connected routes
                 if 'directly connected' in rest:
-                    match_int = re.search(r'directly connected,\s+(\S+)', rest)
+                    match_int = _RE_CONNECTED.search(rest)
                     interface = match_int.group(1) if match_int else None
 
                     routes.append(RouteEntry(
                         destination=network,
                         next_hop=interface or "",
-                        next_hop_type=NextHopType.CONNECTED.value,
+                        next_hop_type=_NHT_CONNECTED,
                         outgoing_interface=interface,
                         protocol=protocol,
                         logical_context=context,
@@ -165,7 +229,7 @@ class AristaParser:
 
                 # Routes with next hop
                 else:
-                    match_via = re.search(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+(\S+))?', rest)
+                    match_via = _RE_VIA.search(rest)
                     if match_via:
                         preference = int(match_via.group(1))
                         metric = int(match_via.group(2))
@@ -175,7 +239,7 @@ class AristaParser:
                         routes.append(RouteEntry(
                             destination=network,
                             next_hop=next_hop,
-                            next_hop_type=NextHopType.IP.value,
+                            next_hop_type=_NHT_IP,
                             outgoing_interface=interface,
                             protocol=protocol,
                             logical_context=context,
@@ -250,6 +314,76 @@ class AristaParser:
 
         return interfaces
 
+    @staticmethod
+    def parse_interface_vrf_table(output: str) -> Dict[str, str]:
+        """
+        Parse interface VRF membership from 'show running-config | section interface'.
+
+        Accepts "vrf <name>", "vrf forwarding <name>" and "vrf member <name>"
+        inside an interface block. Interfaces without a vrf statement are
+        left out; callers treat them as being in the default VRF.
+
+        Args:
+            output: Raw command output
+
+        Returns:
+            Dictionary mapping interface name to VRF name
+        """
+        mapping = {}
+        current = None
+
+        for match in _RE_RUN_INTERFACE_VRF.finditer(output):
+            interface, vrf = match.group('interface', 'vrf')
+            if interface:
+                current = interface
+            elif vrf:
+                if current:
+                    mapping[current] = vrf
+            else:
+                current = None
+
+        return mapping
+
+    @staticmethod
+    def parse_show_version(output: str) -> Dict[str, str]:
+        """
+        Parse 'show version' (or 'show hostname') output.
+
+        Expected lines:
+            Arista DCS-7280SR-48C6-M-R
+            Serial number:       JPE17000000
+            Software image version: 4.22.1F
+            Hostname: leaf1
+
+        When a label repeats, the last occurrence wins.
+
+        Args:
+            output: Raw command output
+
+        Returns:
+            Dict with keys hostname, version, model and serial; empty
+            strings for anything not found
+        """
+        info = {'hostname': '', 'version': '', 'model': '', 'serial': ''}
+        platform = ''
+
+        for match in _RE_SHOW_VERSION.finditer(output):
+            if match.group('platform'):
+                platform = match.group('platform')
+            elif match.group('version'):
+                info['version'] = match.group('version')
+            elif match.group('serial'):
+                info['serial'] = match.group('serial')
+            elif match.group('model'):
+                info['model'] = match.group('model')
+            elif match.group('hostname'):
+                info['hostname'] = match.group('hostname')
+
+        if not info['model']:
+            info['model'] = platform
+
+        return info
+
     @staticmethod
     def _parse_rate(value: str, unit: str) -> int:
         """
@@ -300,9 +434,7 @@ class AristaParser:
         # e.g. "Ethernet1 is up, line protocol is up (connected)"
         # e.g. "Ethernet2 is up, line protocol is down (notconnect)"
         # Strip anything in parentheses from line protocol status
-        first_line_match = re.match(
-            r'^(\S+)\s+is\s+(.+?),\s+line protocol is\s+(\S+)', lines[0]
-        )
+        first_line_match = _RE_INTERFACE_STATUS.match(lines[0])
         if not first_line_match:
             return None
 
@@ -333,64 +465,69 @@ class AristaParser:
             stripped = line.strip()
 
             # Description: Uplink to core
-            desc_match = re.match(r'^Description:\s+(.+)$', stripped)
-            if desc_match:
-                description = desc_match.group(1).strip()
-                continue
+            if stripped.startswith('Description:'):
+                desc_match = _RE_DESCRIPTION.match(stripped)
+                if desc_match:
+                    description = desc_match.group(1).strip()
+                    continue
 
             # BW 10000000 Kbit/sec
-            bw_match = re.search(r'BW\s+(\d+)\s+Kbit/sec', stripped)
-            if bw_match:
-                bandwidth = int(bw_match.group(1))
-                continue
+            if 'BW' in stripped:
+                bw_match = _RE_BANDWIDTH.search(stripped)
+                if bw_match:
+                    bandwidth = int(bw_match.group(1))
+                    continue
 
             # Full-duplex, 10Gb/s, auto negotiation: off, uni-link: n/a
-            speed_match = re.search(r'duplex,\s+(\S+),', stripped)
-            if speed_match:
-                speed = speed_match.group(1)
-                continue
+            if 'duplex,' in stripped:
+                speed_match = _RE_SPEED.search(stripped)
+                if speed_match:
+                    speed = speed_match.group(1)
+                    continue
 
             # 5 minute input rate 2.50 Gbps, 200000 packets/sec
             # 5 minute input rate 0 bps, 0 packets/sec
-            input_rate_match = re.search(
-                r'5 minute input rate\s+([\d.]+)\s+(\w+(?:/\w+)?)', stripped
-            )
-            if input_rate_match:
-                input_rate = AristaParser._parse_rate(
-                    input_rate_match.group(1), input_rate_match.group(2)
-                )
-                continue
+            if '5 minute input rate' in stripped:
+                input_rate_match = _RE_INPUT_RATE.search(stripped)
+                if input_rate_match:
+                    input_rate = AristaParser._parse_rate(
+                        input_rate_match.group(1), input_rate_match.group(2)
+                    )
+                    continue
 
             # 5 minute output rate 5.00 Gbps, 400000 packets/sec
-            output_rate_match = re.search(
-                r'5 minute output rate\s+([\d.]+)\s+(\w+(?:/\w+)?)', stripped
-            )
-            if output_rate_match:
-                output_rate = AristaParser._parse_rate(
-                    output_rate_match.group(1), output_rate_match.group(2)
-                )
-                continue
+            if '5 minute output rate' in stripped:
+                output_rate_match = _RE_OUTPUT_RATE.search(stripped)
+                if output_rate_match:
+                    output_rate = AristaParser._parse_rate(
+                        output_rate_match.group(1), output_rate_match.group(2)
+                    )
+                    continue
 
             # 10 input errors, 5 CRC, 0 alignment, 0 symbol
-            input_errors_match = re.search(r'(\d+)\s+input errors', stripped)
-            if input_errors_match:
-                errors_in = int(input_errors_match.group(1))
-                continue
+            if 'input errors' in stripped:
+                input_errors_match = _RE_INPUT_ERRORS.search(stripped)
+                if input_errors_match:
+                    errors_in = int(input_errors_match.group(1))
+                    continue
 
             # 2 output errors, 0 collisions
-            output_errors_match = re.search(r'(\d+)\s+output errors', stripped)
-            if output_errors_match:
-                errors_out = int(output_errors_match.group(1))
-                continue
+            if 'output errors' in stripped:
+                output_errors_match = _RE_OUTPUT_ERRORS.search(stripped)
+                if output_errors_match:
+                    errors_out = int(output_errors_match.group(1))
+                    continue
 
             # 0 input queue drops, 3 output drops
-            input_drops_match = re.search(r'(\d+)\s+input queue drops', stripped)
-            if input_drops_match:
-                discards_in = int(input_drops_match.group(1))
-
-            output_drops_match = re.search(r'(\d+)\s+output drops', stripped)
-            if output_drops_match:
-                discards_out = int(output_drops_match.group(1))
+            if 'input queue drops' in stripped:
+                input_drops_match = _RE_INPUT_DROPS.search(stripped)
+                if input_drops_match:
+                    discards_in = int(input_drops_match.group(1))
+
+            if 'output drops' in stripped:
+                output_drops_match = _RE_OUTPUT_DROPS.search(stripped)
+                if output_drops_match:
+                    discards_out = int(output_drops_match.group(1))
 
         # Calculate utilisation: rate / (bandwidth * 1000) * 100
         # bandwidth is in Kbit/sec, rate is in bits/sec
@@ -1,15 +1,82 @@
 """Parser for Aruba/HPE AOS-CX and AOS-Switch output."""
 
 import re
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 from ..models import RouteEntry, NextHopType, InterfaceDetail
+from ..utils.text import as_text
+
+
+_RE_ROUTE_LINE = re.compile(r'^([A-Z\*\s]+)\s+(\S+)\s+(.+)$')
+_RE_CONNECTED = re.compile(r'directly connected,\s+(\S+)')
+_RE_VIA = re.compile(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+(\S+))?')
+
+_PROTOCOL_MAP = {
+    'C': 'connected',
+    'L': 'local',
+    'S': 'static',
+    'R': 'rip',
+    'O': 'ospf',
+    'B': 'bgp',
+    'i': 'isis',
+}
+
+
+def _parse_aruba_line(line: str, context: str) -> Optional[RouteEntry]:
+    """Parse a single route line from 'show ip route' output.
+
+    Shared by the single-route and full-table parsers so both go through the
+    same code path.
+
+    Args:
+        line: One line of command output
+        context: VRF name
+
+    Returns:
+        RouteEntry, or None if the line is not a route line
+    """
+    line = line.strip()
+
+    # Skip code legend and empty lines
+    if not line or line.startswith('Codes:') or line.startswith('Gateway'):
+        return None
+
+    # C    10.1.1.0/24 is directly connected, vlan10
+    # S    192.168.1.0/24 [1/0] via 10.1.1.2, vlan20
+    # O    10.2.0.0/16 [110/20] via 10.1.1.3, vlan30
+    match = _RE_ROUTE_LINE.match(line)
+    if not match:
+        return None
+
+    protocol_code, network, rest = match.groups()
+    protocol = _PROTOCOL_MAP.get(protocol_code.strip().replace('*', ''), 'unknown')
+
+    # Connected routes
+    if 'directly connected' in rest:
+        match_int = _RE_CONNECTED.search(rest)
+        interface = match_int.group(1) if match_int else None
+
+        return RouteEntry(
+            network, interface or "", NextHopType.CONNECTED.value,
+            interface, protocol, context, 0, 0, line
+        )
+
+    # Routes with next hop
+    match_via = _RE_VIA.search(rest)
+    if not match_via:
+        return None
+
+    return RouteEntry(
+        network, match_via.group(3), NextHopType.IP.value,
+        match_via.group(4), protocol, context,
+        int(match_via.group(2)), int(match_via.group(1)), line
+    )
 
 
 class ArubaParser:
     """Parser for Aruba AOS-CX/AOS-Switch routing output."""
 
     @staticmethod
-    def parse_route_entry(output: str, destination: str, context: str = "default") -> Optional[RouteEntry]:
+    def parse_route_entry(output: Union[bytes, str], destination: str, context: str = "default") -> Optional[RouteEntry]:
         """
         Parse 'show ip route <destination> vrf <vrf>' output.
 
@@ -22,167 +89,54 @@ class ArubaParser:
         C    10.0.0.0/8 is directly connected, vlan100
 
         Args:
-            output: Raw command output
+            output: Raw command output, as str or undecoded bytes
             destination: Destination IP queried
             context: VRF name
 
         Returns:
             RouteEntry or None if no route found
         """
+        output = as_text(output)
         if not output or "no such route" in output.lower():
             return None
 
-        lines = output.strip().split('\n')
-
-        for line in lines:
-            line = line.strip()
-
-            # Skip code legend and empty lines
-            if not line or line.startswith('Codes:') or line.startswith('Gateway'):
-                continue
-
-            # Parse route line
-            # C    10.1.1.0/24 is directly connected, vlan10
-            # S    192.168.1.0/24 [1/0] via 10.1.1.2, vlan20
-            # O    10.2.0.0/16 [110/20] via 10.1.1.3, vlan30
-            match = re.match(r'^([A-Z\*\s]+)\s+(\S+)\s+(.+)$', line)
-            if match:
-                protocol_code = match.group(1).strip()
-                network = match.group(2)
-                rest = match.group(3)
-
-                # Map protocol codes
-                protocol_map = {
-                    'C': 'connected',
-                    'L': 'local',
-                    'S': 'static',
-                    'S*': 'static',
-                    'R': 'rip',
-                    'O': 'ospf',
-                    'B': 'bgp',
-                    'i': 'isis',
-                }
-
-                protocol = protocol_map.get(protocol_code.replace('*', ''), 'unknown')
-
-                # Parse connected routes
-                if 'directly connected' in rest:
-                    match_int = re.search(r'directly connected,\s+(\S+)', rest)
-                    interface = match_int.group(1) if match_int else None
-
-                    return RouteEntry(
-                        destination=network,
-                        next_hop=interface or "",
-                        next_hop_type=NextHopType.CONNECTED.value,
-                        outgoing_interface=interface,
-                        protocol=protocol,
-                        logical_context=context,
-                        metric=0,
-                        preference=0,
-                        raw_output=line
-                    )
-
-                # Parse routes with next hop
-                match_via = re.search(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+(\S+))?', rest)
-                if match_via:
-                    preference = int(match_via.group(1))
-                    metric = int(match_via.group(2))
-                    next_hop = match_via.group(3)
-                    interface = match_via.group(4)
-
-                    return RouteEntry(
-                        destination=network,
-                        next_hop=next_hop,
-                        next_hop_type=NextHopType.IP.value,
-                        outgoing_interface=interface,
-                        protocol=protocol,
-                        logical_context=context,
-                        metric=metric,
-                        preference=preference,
-                        raw_output=line
-                    )
+        for line in output.strip().split('\n'):
+            route = _parse_aruba_line(line, context)
+            if route is not None:
+                return route
 
         return None
 
     @staticmethod
-    def parse_routing_table(output: str, context: str = "default") -> List[RouteEntry]:
+    def parse_routing_table(output: Union[bytes, str], context: str = "default") -> List[RouteEntry]:
         """
         Parse full routing table from 'show ip route vrf <vrf>' output.
 
         Args:
-            output: Raw command output
+            output: Raw command output, as str or undecoded bytes
             context: VRF name
 
         Returns:
             List of RouteEntry objects
         """
-        routes = []
-        lines = output.strip().split('\n')
+        return list(ArubaParser.iter_routing_table(output, context))
 
-        for line in lines:
-            line = line.strip()
+    @staticmethod
+    def iter_routing_table(output: Union[bytes, str], context: str = "default") -> Iterator[RouteEntry]:
+        """
+        Lazily parse full routing table from 'show ip route vrf <vrf>' output.
 
-            # Skip headers and empty lines
-            if not line or line.startswith('Codes:') or line.startswith('Gateway'):
-                continue
+        Args:
+            output: Raw command output, as str or undecoded bytes
+            context: VRF name
 
-            # Parse route entry
-            match = re.match(r'^([A-Z\*\s]+)\s+(\S+)\s+(.+)$', line)
-            if match:
-                protocol_code = match.group(1).strip()
-                network = match.group(2)
-                rest = match.group(3)
-
-                protocol_map = {
-                    'C': 'connected',
-                    'L': 'local',
-                    'S': 'static',
-                    'R': 'rip',
-                    'O': 'ospf',
-                    'B': 'bgp',
-                }
-
-                protocol = protocol_map.get(protocol_code.replace('*', ''), 'unknown')
-
-                # Connected routes
-                if 'directly connected' in rest:
-                    match_int = re.search(r'directly connected,\s+(\S+)', rest)
-                    interface = match_int.group(1) if match_int else None
-
-                    routes.append(RouteEntry(
-                        destination=network,
-                        next_hop=interface or "",
-                        next_hop_type=NextHopType.CONNECTED.value,
-                        outgoing_interface=interface,
-                        protocol=protocol,
-                        logical_context=context,
-                        metric=0,
-                        preference=0,
-                        raw_output=line
-                    ))
-
-                # Routes with next hop
-                else:
-                    match_via = re.search(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+(\S+))?', rest)
-                    if match_via:
-                        preference = int(match_via.group(1))
-                        metric = int(match_via.group(2))
-                        next_hop = match_via.group(3)
-                        interface = match_via.group(4)
-
-                        routes.append(RouteEntry(
-                            destination=network,
-                            next_hop=next_hop,
-                            next_hop_type=NextHopType.IP.value,
-                            outgoing_interface=interface,
-                            protocol=protocol,
-                            logical_context=context,
-                            metric=metric,
-                            preference=preference,
-                            raw_output=line
-                        ))
-
-        return routes
+        Yields:
+            RouteEntry objects in output order
+        """
+        for line in as_text(output).strip().split('\n'):
+            route = _parse_aruba_line(line, context)
+            if route is not None:
+                yield route
 
     @staticmethod
     def parse_vrf_list(output: str) -> List[str]:
@@ -196,25 +150,27 @@ class ArubaParser:
             List of VRF names
         """
         vrfs = []
-        lines = output.strip().split('\n')
+        has_default = False
 
-        for line in lines:
+        for line in output.splitlines():
             # VRF Name                    VRF ID    State
             # default                     1         Up
             # management                  2         Up
+            parts = line.split(None, 1)
+            if not parts:
+                continue
 
             # Skip headers
-            if 'VRF Name' in line or '---' in line:
+            vrf_name = parts[0]
+            if vrf_name.startswith('---') or (vrf_name == 'VRF' and parts[-1].startswith('Name')):
                 continue
 
-            parts = line.strip().split()
-            if parts:
-                vrf_name = parts[0]
-                if vrf_name:
-                    vrfs.append(vrf_name)
+            vrfs.append(vrf_name)
+            if vrf_name == 'default':
+                has_default = True
 
         # Ensure default is included
-        if 'default' not in vrfs:
+        if not has_default:
             vrfs.insert(0, 'default')
 
         return vrfs
@@ -287,12 +243,11 @@ class ArubaParser:
         lines = output.strip().split('\n')
 
         # First line: Interface name and link status
-        first_line_match = re.match(r'^Interface\s+(\S+)\s+is\s+(\S+)', lines[0])
-        if not first_line_match:
+        parts = lines[0].split()
+        if len(parts) < 4 or parts[0] != 'Interface' or parts[2] != 'is':
             return None
 
-        name = first_line_match.group(1)
-        link_status = first_line_match.group(2).lower()
+        name, link_status = parts[1], parts[3].lower()
 
         # Defaults
         admin_state = "up"
@@ -310,22 +265,25 @@ class ArubaParser:
             stripped = line.strip()
 
             # Admin state
-            admin_match = re.match(r'^Admin state is\s+(\S+)', stripped)
-            if admin_match:
-                admin_state = admin_match.group(1).lower()
-                continue
+            if stripped.startswith('Admin state is'):
+                admin_match = re.match(r'^Admin state is\s+(\S+)', stripped)
+                if admin_match:
+                    admin_state = admin_match.group(1).lower()
+                    continue
 
             # Description
-            desc_match = re.match(r'^Description:\s+(.+)$', stripped)
-            if desc_match:
-                description = desc_match.group(1)
-                continue
+            if stripped.startswith('Description:'):
+                desc_match = re.match(r'^Description:\s+(.+)$', stripped)
+                if desc_match:
+                    description = desc_match.group(1)
+                    continue
 
             # Speed
-            speed_match = re.match(r'^Speed\s+(.+)$', stripped)
-            if speed_match:
-                speed = speed_match.group(1)
-                continue
+            if stripped.startswith('Speed'):
+                speed_match = re.match(r'^Speed\s+(.+)$', stripped)
+                if speed_match:
+                    speed = speed_match.group(1)
+                    continue
 
             # Section markers
             if stripped == 'RX':
@@ -335,26 +293,23 @@ class ArubaParser:
                 section = 'tx'
                 continue
 
-            # Counters within RX/TX sections
-            if section == 'rx':
-                err_match = re.match(r'^(\d+)\s+input errors', stripped)
-                if err_match:
-                    errors_in = int(err_match.group(1))
-                    continue
-                drop_match = re.match(r'^(\d+)\s+drops', stripped)
-                if drop_match:
-                    discards_in = int(drop_match.group(1))
-                    continue
+            # Counters within RX/TX sections: "<count> <label>"
+            if section is None:
+                continue
+            count, _, label = stripped.partition(' ')
+            if not count.isdigit():
+                continue
+            label = label.lstrip()
 
-            elif section == 'tx':
-                err_match = re.match(r'^(\d+)\s+output errors', stripped)
-                if err_match:
-                    errors_out = int(err_match.group(1))
-                    continue
-                drop_match = re.match(r'^(\d+)\s+drops', stripped)
-                if drop_match:
-                    discards_out = int(drop_match.group(1))
-                    continue
+            if section == 'rx':
+                if label.startswith('input errors'):
+                    errors_in = int(count)
+                elif label.startswith('drops'):
+                    discards_in = int(count)
+            elif label.startswith('output errors'):
+                errors_out = int(count)
+            elif label.startswith('drops'):
+                discards_out = int(count)
 
         # Determine status: admin_down takes precedence, then link status
         if admin_state == "down":
@@ -13,6 +13,84 @@ from ..models import (
 )
 
 
+_RE_ROUTING_ENTRY = re.compile(
+    r"Routing entry for\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)"
+)
+_RE_KNOWN = re.compile(
+    r'Known via\s+"([^"]+)",\s+distance\s+(\d+),\s+metric\s+(\d+)'
+)
+_RE_HOP = re.compile(r"\*\s+(\d+\.\d+\.\d+\.\d+),\s+via\s+(\S+)")
+_RE_HOP_CONNECTED = re.compile(r"\*\s+directly connected,\s+via\s+(\S+)")
+
+# Next-hop type strings, resolved once at import
+_NHT_IP = NextHopType.IP.value
+_NHT_CONNECTED = NextHopType.CONNECTED.value
+_NHT_LOCAL = NextHopType.LOCAL.value
+
+# Characters of a route-code token in 'show route' ("S", "S*", "C")
+_ROUTE_CODE_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ*"
+_DIRECTLY_CONNECTED = "is directly connected,"
+
+_RE_INTERFACE_STATUS = re.compile(
+    r'^Interface\s+(\S+)\s+"[^"]*",\s+is\s+(.+?),\s+line protocol is\s+(\S+)'
+)
+_RE_DESCRIPTION = re.compile(r"^Description:\s+(.+)$")
+_RE_BANDWIDTH = re.compile(r"BW\s+(\d+)\s+Mbps")
+_RE_INPUT_RATE = re.compile(r"5 minute input rate\s+(\d+)\s+bits/sec")
+_RE_OUTPUT_RATE = re.compile(r"5 minute output rate\s+(\d+)\s+bits/sec")
+_RE_ERRORS = re.compile(r"(\d+)\s+input errors,\s+(\d+)\s+output errors")
+_RE_DROPS = re.compile(r"(\d+)\s+drops,\s+(\d+)\s+output drops")
+
+_RE_NAMEIF_INTERFACE = re.compile(r"^[A-Za-z]")
+
+# First token of each 'show context' line that is not a header, separator
+# or '*' line; leading blanks are consumed first so the lookahead sees the
+# same text a strip() would
+_RE_CONTEXT_NAME = re.compile(
+    r"^[^\S\n]*+(?!Context|---|\*)(\S+)", re.MULTILINE
+)
+_RE_CONTEXT_UNSUPPORTED = re.compile(r"not (?:supported|available)", re.IGNORECASE)
+
+# "<hostname> up <N> <unit>" uptime line in 'show version'; units appear as
+# years, days, hours, mins and secs
+_RE_UPTIME_HOSTNAME = re.compile(
+    r"\s*(\S+)[^\S\n]+up[^\S\n]+\d+[^\S\n]+(?:year|day|hour|min|sec)"
+)
+
+_RE_ACTION = re.compile(r"Action:\s+(\S+)")
+_RE_PHASE_SPLIT = re.compile(r"(?=Phase:\s+\d+)")
+_RE_PHASE_TYPE = re.compile(r"Type:\s+(.+)")
+_RE_PHASE_RESULT = re.compile(r"Result:\s+(\S+)")
+_RE_ACCESS_LIST = re.compile(r"access-list\s+(\S+)")
+_RE_ACCESS_GROUP = re.compile(r"access-group\s+(\S+)")
+# "<ip>/<port> to <ip>/<port>": the address is everything up to the first
+# '/' of the token. Spelled out possessively rather than as a lazy \S+?, so
+# a token full of slashes is scanned once instead of once per slash.
+_RE_UNTRANSLATE = re.compile(
+    r"Untranslate\s++(\S[^\s/]*+)/(\S++)\s++to\s++(\S[^\s/]*+)/(\S++)"
+)
+_RE_TRANSLATE = re.compile(
+    r"(?:Dynamic |Static )?translate\s++(\S[^\s/]*+)/(\S++)\s++to\s++(\S[^\s/]*+)/(\S++)",
+    re.IGNORECASE,
+)
+_RE_NAT_CONFIG = re.compile(r"^(nat\s+.+)$", re.MULTILINE)
+
+# Route codes in 'show route', looked up after any '*' has been stripped
+_PROTOCOL_MAP = {
+    "C": "connected",
+    "L": "local",
+    "S": "static",
+    "O": "ospf",
+    "B": "bgp",
+    "D": "eigrp",
+    "R": "rip",
+    "i": "isis",
+}
+
+# packet-tracer final action -> PolicyResult action
+_ACTION_MAP = {"allow": "permit", "drop": "deny"}
+
+
 def _subnet_mask_to_prefix_length(mask: str) -> int:
     """Convert a dotted-decimal subnet mask to CIDR prefix length.
 
@@ -28,6 +106,25 @@ def _subnet_mask_to_prefix_length(mask: str) -> int:
         return 0
 
 
+def _is_dotted_quad(token: str) -> bool:
+    """Check for four dot-separated runs of digits, e.g. "255.255.255.0".
+
+    Args:
+        token: Whitespace-free token
+
+    Returns:
+        True if the token is shaped like a dotted-decimal address
+    """
+    octets = token.split(".")
+    return (
+        len(octets) == 4
+        and octets[0].isdecimal()
+        and octets[1].isdecimal()
+        and octets[2].isdecimal()
+        and octets[3].isdecimal()
+    )
+
+
 def _mask_to_cidr(network: str, mask: str) -> str:
     """Convert network + subnet mask to CIDR notation.
 
@@ -72,10 +169,7 @@ class CiscoASAParser:
         for line in lines:
             # ASA format: "Routing entry for 10.1.1.0 255.255.255.0"
             # or "Routing entry for 0.0.0.0 0.0.0.0"
-            match = re.search(
-                r"Routing entry for\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)",
-                line,
-            )
+            match = _RE_ROUTING_ENTRY.search(line)
             if match:
                 network = match.group(1)
                 mask = match.group(2)
@@ -90,9 +184,7 @@ class CiscoASAParser:
         preference = 0
         metric = 0
         for line in lines:
-            match = re.search(
-                r'Known via\s+"([^"]+)",\s+distance\s+(\d+),\s+metric\s+(\d+)', line
-            )
+            match = _RE_KNOWN.search(line)
             if match:
                 protocol = match.group(1)
                 preference = int(match.group(2))
@@ -105,28 +197,24 @@ class CiscoASAParser:
         interface = None
         for line in lines:
             # Match "* <ip>, via <nameif>"
-            hop_match = re.search(
-                r"\*\s+(\d+\.\d+\.\d+\.\d+),\s+via\s+(\S+)", line
-            )
+            hop_match = _RE_HOP.search(line)
             if hop_match:
                 next_hop = hop_match.group(1)
                 interface = hop_match.group(2)
                 break
 
             # Match "* directly connected, via <nameif>"
-            connected_match = re.search(
-                r"\*\s+directly connected,\s+via\s+(\S+)", line
-            )
+            connected_match = _RE_HOP_CONNECTED.search(line)
             if connected_match:
                 interface = connected_match.group(1)
                 break
 
         # Determine next hop type
-        next_hop_type = NextHopType.IP.value
+        next_hop_type = _NHT_IP
         if protocol == "connected":
-            next_hop_type = NextHopType.CONNECTED.value
+            next_hop_type = _NHT_CONNECTED
         elif protocol == "local":
-            next_hop_type = NextHopType.LOCAL.value
+            next_hop_type = _NHT_LOCAL
 
         return RouteEntry(
             destination=destination_network,
@@ -163,18 +251,6 @@ class CiscoASAParser:
 
         lines = output.strip().split("\n")
 
-        # Protocol code mapping
-        protocol_map = {
-            "C": "connected",
-            "L": "local",
-            "S": "static",
-            "O": "ospf",
-            "B": "bgp",
-            "D": "eigrp",
-            "R": "rip",
-            "i": "isis",
-        }
-
         for line in lines:
             stripped = line.strip()
 
@@ -182,28 +258,33 @@ class CiscoASAParser:
             if not stripped or stripped.startswith("Codes:") or stripped.startswith("Gateway"):
                 continue
 
-            # Match connected routes:
+            # "<code> <network> <mask> <rest>"
+            parts = stripped.split(None, 3)
+            if (
+                len(parts) < 4
+                or parts[0].strip(_ROUTE_CODE_CHARS)
+                or not _is_dotted_quad(parts[1])
+                or not _is_dotted_quad(parts[2])
+            ):
+                continue
+            code, network, mask, rest = parts
+            protocol = _PROTOCOL_MAP.get(code.replace("*", ""), "unknown")
+
+            # Connected routes:
             # "C    10.1.1.0 255.255.255.0 is directly connected, inside"
-            connected_match = re.match(
-                r"^([A-Z\*]+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)"
-                r"\s+is directly connected,\s+(\S+)",
-                stripped,
-            )
-            if connected_match:
-                code = connected_match.group(1).strip().replace("*", "")
-                network = connected_match.group(2)
-                mask = connected_match.group(3)
-                iface = connected_match.group(4)
-                protocol = protocol_map.get(code, "unknown")
-                dest = _mask_to_cidr(network, mask)
-
-                next_hop_type = NextHopType.CONNECTED.value
+            if rest.startswith(_DIRECTLY_CONNECTED):
+                tail = rest[len(_DIRECTLY_CONNECTED):]
+                if not tail[:1].isspace():
+                    continue
+                iface = tail.split(None, 1)[0]
+
+                next_hop_type = _NHT_CONNECTED
                 if protocol == "local":
-                    next_hop_type = NextHopType.LOCAL.value
+                    next_hop_type = _NHT_LOCAL
 
                 routes.append(
                     RouteEntry(
-                        destination=dest,
+                        destination=_mask_to_cidr(network, mask),
                         next_hop=iface,
                         next_hop_type=next_hop_type,
                         outgoing_interface=iface,
@@ -216,39 +297,43 @@ class CiscoASAParser:
                 )
                 continue
 
-            # Match routes with next hop:
+            # Routes with next hop, the whole rest of the line being
+            # "[pref/metric] via <hop>" optionally followed by ", <nameif>":
             # "S    0.0.0.0 0.0.0.0 [1/0] via 10.0.0.1, outside"
-            via_match = re.match(
-                r"^([A-Z\*]+)\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)"
-                r"\s+\[(\d+)/(\d+)\]\s+via\s+(\S+?)(?:,\s+(\S+))?$",
-                stripped,
-            )
-            if via_match:
-                code = via_match.group(1).strip().replace("*", "")
-                network = via_match.group(2)
-                mask = via_match.group(3)
-                pref = int(via_match.group(4))
-                met = int(via_match.group(5))
-                hop = via_match.group(6)
-                iface = via_match.group(7)
-                protocol = protocol_map.get(code, "unknown")
-                dest = _mask_to_cidr(network, mask)
+            fields = rest.split(None, 2)
+            if len(fields) < 3 or fields[1] != "via":
+                continue
+            distance = fields[0]
+            if not (distance.startswith("[") and distance.endswith("]")):
+                continue
+            pref, slash, met = distance[1:-1].partition("/")
+            if not (slash and pref.isdecimal() and met.isdecimal()):
+                continue
 
-                routes.append(
-                    RouteEntry(
-                        destination=dest,
-                        next_hop=hop,
-                        next_hop_type=NextHopType.IP.value,
-                        outgoing_interface=iface,
-                        protocol=protocol,
-                        logical_context=context,
-                        metric=met,
-                        preference=pref,
-                        raw_output=line,
-                    )
-                )
+            hop_fields = fields[2].split()
+            if len(hop_fields) == 1:
+                hop = hop_fields[0]
+                iface = None
+            elif len(hop_fields) == 2 and len(hop_fields[0]) > 1 and hop_fields[0].endswith(","):
+                hop = hop_fields[0][:-1]
+                iface = hop_fields[1]
+            else:
                 continue
 
+            routes.append(
+                RouteEntry(
+                    destination=_mask_to_cidr(network, mask),
+                    next_hop=hop,
+                    next_hop_type=_NHT_IP,
+                    outgoing_interface=iface,
+                    protocol=protocol,
+                    logical_context=context,
+                    metric=int(met),
+                    preference=int(pref),
+                    raw_output=line,
+                )
+            )
+
         return routes
 
     @staticmethod
@@ -274,10 +359,7 @@ class CiscoASAParser:
 
         # Parse first line:
         # Interface GigabitEthernet0/0 "outside", is up, line protocol is up
-        first_match = re.match(
-            r'^Interface\s+(\S+)\s+"[^"]*",\s+is\s+(.+?),\s+line protocol is\s+(\S+)',
-            lines[0],
-        )
+        first_match = _RE_INTERFACE_STATUS.match(lines[0])
         if not first_match:
             return None
 
@@ -306,50 +388,48 @@ class CiscoASAParser:
             stripped = line.strip()
 
             # Description: Internet uplink
-            desc_match = re.match(r"^Description:\s+(.+)$", stripped)
-            if desc_match:
-                description = desc_match.group(1).strip()
-                continue
+            if stripped.startswith("Description:"):
+                desc_match = _RE_DESCRIPTION.match(stripped)
+                if desc_match:
+                    description = desc_match.group(1).strip()
+                    continue
 
             # BW 1000 Mbps
-            bw_match = re.search(r"BW\s+(\d+)\s+Mbps", stripped)
-            if bw_match:
-                bandwidth_mbps = int(bw_match.group(1))
-                continue
+            if "BW" in stripped:
+                bw_match = _RE_BANDWIDTH.search(stripped)
+                if bw_match:
+                    bandwidth_mbps = int(bw_match.group(1))
+                    continue
 
             # 5 minute input rate 250000000 bits/sec, 150000 pkts/sec
-            input_rate_match = re.search(
-                r"5 minute input rate\s+(\d+)\s+bits/sec", stripped
-            )
-            if input_rate_match:
-                input_rate = int(input_rate_match.group(1))
-                continue
+            if "5 minute input rate" in stripped:
+                input_rate_match = _RE_INPUT_RATE.search(stripped)
+                if input_rate_match:
+                    input_rate = int(input_rate_match.group(1))
+                    continue
 
             # 5 minute output rate 500000000 bits/sec, 300000 pkts/sec
-            output_rate_match = re.search(
-                r"5 minute output rate\s+(\d+)\s+bits/sec", stripped
-            )
-            if output_rate_match:
-                output_rate = int(output_rate_match.group(1))
-                continue
+            if "5 minute output rate" in stripped:
+                output_rate_match = _RE_OUTPUT_RATE.search(stripped)
+                if output_rate_match:
+                    output_rate = int(output_rate_match.group(1))
+                    continue
 
             # 5 input errors, 1 output errors
-            errors_match = re.search(
-                r"(\d+)\s+input errors,\s+(\d+)\s+output errors", stripped
-            )
-            if errors_match:
-                errors_in = int(errors_match.group(1))
-                errors_out = int(errors_match.group(2))
-                continue
+            if "input errors," in stripped:
+                errors_match = _RE_ERRORS.search(stripped)
+                if errors_match:
+                    errors_in = int(errors_match.group(1))
+                    errors_out = int(errors_match.group(2))
+                    continue
 
             # 2 drops, 0 output drops
-            drops_match = re.search(
-                r"(\d+)\s+drops,\s+(\d+)\s+output drops", stripped
-            )
-            if drops_match:
-                discards_in = int(drops_match.group(1))
-                discards_out = int(drops_match.group(2))
-                continue
+            if "output drops" in stripped:
+                drops_match = _RE_DROPS.search(stripped)
+                if drops_match:
+                    discards_in = int(drops_match.group(1))
+                    discards_out = int(drops_match.group(2))
+                    continue
 
         # Calculate utilisation: rate / (bandwidth_mbps * 1_000_000) * 100
         utilisation_in = None
@@ -413,11 +493,97 @@ class CiscoASAParser:
                 interface = parts[0]
                 nameif = parts[1]
                 # Skip if the first part doesn't look like an interface name
-                if re.match(r"^[A-Za-z]", interface):
+                if _RE_NAMEIF_INTERFACE.match(interface):
                     mapping[interface] = nameif
 
         return mapping
 
+    @staticmethod
+    def parse_context_list(output: str) -> List[str]:
+        """Parse 'show context' output from ASA.
+
+        Expected format:
+            Context Name      Class      Interfaces           Mode    URL
+             admin            default    GigabitEthernet0/1   Routed  disk0:/admin.cfg
+             ctx1             default    GigabitEthernet0/2   Routed  disk0:/ctx1.cfg
+
+        Single-context devices answer with a "not supported"/"not available"
+        error, which yields just the system context.
+
+        Args:
+            output: Raw command output
+
+        Returns:
+            Context names in order of first appearance, always starting with
+            "system" unless the device lists it elsewhere
+        """
+        if not output or _RE_CONTEXT_UNSUPPORTED.search(output):
+            return ["system"]
+
+        contexts = list(dict.fromkeys(_RE_CONTEXT_NAME.findall(output)))
+        if "system" not in contexts:
+            contexts.insert(0, "system")
+        return contexts
+
+    @staticmethod
+    def parse_show_version(output: str) -> Dict[str, str]:
+        """Parse 'show version' output from ASA.
+
+        Expected lines:
+            Cisco Adaptive Security Appliance Software Version 9.16(3)
+            asa-01 up 10 days 5 hours
+            Hardware:   ASA5525, 8192 MB RAM, CPU Lynnfield 2394 MHz
+            Serial Number: FCH12345678
+
+        Lines are only stripped or split once a fixed-case label is found
+        in them, so most lines cost a few substring tests, and the scan
+        stops as soon as all four fields are set. Until then a repeated
+        label overwrites the earlier value, except for the hostname, which
+        comes from the first uptime line.
+
+        Args:
+            output: Raw command output
+
+        Returns:
+            Dict with keys hostname, version, model and serial; empty
+            strings for anything not found
+        """
+        info = {'hostname': '', 'version': '', 'model': '', 'serial': ''}
+
+        for line in output.splitlines():
+            # Cisco Adaptive Security Appliance Software Version 9.16(3)
+            if 'Software Version' in line:
+                version = line.rpartition('Version')[2].split()
+                if version:
+                    info['version'] = version[0]
+
+            # Hardware:   ASA5525, 8192 MB RAM
+            elif 'Hardware:' in line:
+                label, _, value = line.partition('Hardware:')
+                if not label.strip():
+                    info['model'] = value.split(',', 1)[0].strip()
+
+            # Serial Number: FCH12345678
+            elif 'Serial Number:' in line:
+                label, _, value = line.partition('Serial Number:')
+                if not label.strip():
+                    info['serial'] = value.strip()
+
+            # asa-01 up 10 days 5 hours
+            elif ' up ' in line and not info['hostname']:
+                match = _RE_UPTIME_HOSTNAME.match(line)
+                if match:
+                    info['hostname'] = match.group(1)
+
+            else:
+                continue
+
+            # Everything after the last field is licence and interface detail
+            if all(info.values()):
+                break
+
+        return info
+
     @staticmethod
     def parse_packet_tracer(
         output: str,
@@ -441,15 +607,14 @@ class CiscoASAParser:
 
         # Parse the final action from "Action: allow/drop"
         final_action = "deny"
-        action_match = re.search(r"Action:\s+(\S+)", output)
+        action_match = _RE_ACTION.search(output)
         if action_match:
             raw_action = action_match.group(1).lower()
-            action_map = {"allow": "permit", "drop": "deny"}
-            final_action = action_map.get(raw_action, raw_action)
+            final_action = _ACTION_MAP.get(raw_action, raw_action)
 
         # Split into phases using "Phase:" as delimiter
         # The last section after all phases is the Result block
-        phase_sections = re.split(r"(?=Phase:\s+\d+)", output)
+        phase_sections = _RE_PHASE_SPLIT.split(output)
 
         policy_result = None
         dnat_translation = None
@@ -461,23 +626,23 @@ class CiscoASAParser:
                 continue
 
             # Determine phase type
-            type_match = re.search(r"Type:\s+(.+)", section)
+            type_match = _RE_PHASE_TYPE.search(section)
             if not type_match:
                 continue
             phase_type = type_match.group(1).strip()
 
             # Parse result for this phase
-            result_match = re.search(r"Result:\s+(\S+)", section)
+            result_match = _RE_PHASE_RESULT.search(section)
             phase_result = result_match.group(1).upper() if result_match else ""
 
             if phase_type == "ACCESS-LIST":
                 # Extract access-list or access-group name
                 rule_name = ""
-                acl_match = re.search(r"access-list\s+(\S+)", section)
+                acl_match = _RE_ACCESS_LIST.search(section)
                 if acl_match:
                     rule_name = acl_match.group(1)
                 elif not acl_match:
-                    acg_match = re.search(r"access-group\s+(\S+)", section)
+                    acg_match = _RE_ACCESS_GROUP.search(section)
                     if acg_match:
                         rule_name = acg_match.group(1)
 
@@ -497,13 +662,11 @@ class CiscoASAParser:
 
             elif phase_type == "UN-NAT":
                 # Destination NAT: "Untranslate <orig_ip>/<port> to <xlated_ip>/<port>"
-                unnat_match = re.search(
-                    r"Untranslate\s+(\S+?)/(\S+)\s+to\s+(\S+?)/(\S+)", section
-                )
+                unnat_match = _RE_UNTRANSLATE.search(section)
                 if unnat_match:
                     # Extract NAT rule name from config line
                     nat_rule = ""
-                    nat_config_match = re.search(r"^(nat\s+.+)$", section, re.MULTILINE)
+                    nat_config_match = _RE_NAT_CONFIG.search(section)
                     if nat_config_match:
                         nat_rule = nat_config_match.group(1).strip()
 
@@ -517,14 +680,10 @@ class CiscoASAParser:
 
             elif phase_type == "NAT":
                 # Source NAT: "Dynamic translate <orig_ip>/<port> to <xlated_ip>/<port>"
-                snat_match = re.search(
-                    r"(?:Dynamic |Static )?translate\s+(\S+?)/(\S+)\s+to\s+(\S+?)/(\S+)",
-                    section,
-                    re.IGNORECASE,
-                )
+                snat_match = _RE_TRANSLATE.search(section)
                 if snat_match:
                     nat_rule = ""
-                    nat_config_match = re.search(r"^(nat\s+.+)$", section, re.MULTILINE)
+                    nat_config_match = _RE_NAT_CONFIG.search(section)
                     if nat_config_match:
                         nat_rule = nat_config_match.group(1).strip()
 
@@ -1,10 +1,88 @@
 """Parser for Cisco IOS routing table output."""
 
 import re
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from ..models import RouteEntry, NextHopType, InterfaceDetail
 
 
+_RE_DEST = re.compile(r'Routing entry for\s+(\S+)')
+_RE_KNOWN = re.compile(r'Known via\s+"([^"]+)",\s+distance\s+(\d+),\s+metric\s+(\d+)')
+_RE_CONNECTED = re.compile(r'directly connected,\s+via\s+(\S+)')
+_RE_HOP = re.compile(r'(?:Last update from|via)\s+(\S+)(?:\s+on\s+(\S+))?')
+
+
+# One route line: protocol code tokens ("S*", "O IA"), the network and the
+# rest of the line. [^\S\n] is whitespace that never crosses into the next
+# line, so a single finditer walks every route in the output.
+_RE_TABLE_LINE = re.compile(
+    r'^[^\S\n]*+(?P<line>(?P<code>[A-Z*]++(?:[^\S\n]++[A-Z*]++(?=[^\S\n]))*+)'
+    r'[^\S\n]++(?P<net>\S++)[^\S\n]++(?P<rest>\S(?:.*\S)?))',
+    re.MULTILINE,
+)
+_RE_TABLE_CONNECTED = re.compile(r'directly connected,\s+(\S+)')
+_RE_TABLE_VIA = re.compile(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+[\d:]+,\s+(\S+))?')
+
+_RE_INTERFACE_STATUS = re.compile(r'^(\S+)\s+is\s+(.+?),\s+line protocol is\s+(\S+)')
+_RE_DESCRIPTION = re.compile(r'^Description:\s+(.+)$')
+_RE_BANDWIDTH = re.compile(r'BW\s+(\d+)\s+Kbit/sec')
+_RE_SPEED = re.compile(r'duplex,\s+(\S+),')
+_RE_INPUT_RATE = re.compile(r'5 minute input rate\s+(\d+)\s+bits/sec')
+_RE_OUTPUT_RATE = re.compile(r'5 minute output rate\s+(\d+)\s+bits/sec')
+_RE_INPUT_ERRORS = re.compile(r'(\d+)\s+input errors')
+_RE_OUTPUT_ERRORS = re.compile(r'(\d+)\s+output errors')
+_RE_INPUT_DROPS = re.compile(r'(\d+)\s+input queue drops')
+_RE_OUTPUT_DROPS = re.compile(r'(\d+)\s+output drops')
+
+_PROTOCOL_MAP = {
+    'C': 'connected',
+    'L': 'local',
+    'S': 'static',
+    'O': 'ospf',
+    'B': 'bgp',
+    'D': 'eigrp',
+    'R': 'rip',
+    'i': 'isis',
+}
+
+
+def _parse_ios_table_match(match: re.Match, context: str) -> Optional[RouteEntry]:
+    """Build a route from one _RE_TABLE_LINE match of 'show ip route' output.
+
+    Args:
+        match: Match of one route line
+        context: VRF or routing context
+
+    Returns:
+        RouteEntry, or None if the line is neither connected nor via a next hop
+    """
+    # C        10.1.1.0/24 is directly connected, GigabitEthernet0/0
+    # O        192.168.1.0/24 [110/20] via 10.1.1.2, 00:05:23, GigabitEthernet0/1
+    # S*       0.0.0.0/0 [1/0] via 10.0.0.1
+    line, protocol_code, network, rest = match.group('line', 'code', 'net', 'rest')
+    protocol = _PROTOCOL_MAP.get(protocol_code.replace('*', ''), 'unknown')
+
+    # Connected routes
+    if 'directly connected' in rest:
+        match_int = _RE_TABLE_CONNECTED.search(rest)
+        interface = match_int.group(1) if match_int else None
+
+        return RouteEntry(
+            network, interface or "", NextHopType.CONNECTED.value,
+            interface, protocol, context, 0, 0, line
+        )
+
+    # [110/20] via 10.1.1.2, 00:05:23, GigabitEthernet0/1
+    match_via = _RE_TABLE_VIA.search(rest)
+    if not match_via:
+        return None
+
+    return RouteEntry(
+        network, match_via.group(3), NextHopType.IP.value,
+        match_via.group(4), protocol, context,
+        int(match_via.group(2)), int(match_via.group(1)), line
+    )
+
+
 class CiscoIOSParser:
     """Parser for Cisco IOS show ip route output."""
 
@@ -30,7 +108,7 @@ class CiscoIOSParser:
         Returns:
             RouteEntry or None if no route found
         """
-        if not output or "not in table" in output.lower() or "% subnet not in table" in output.lower():
+        if not output or "not in table" in output.lower():
             return None
 
         lines = output.strip().split('\n')
@@ -43,35 +121,40 @@ class CiscoIOSParser:
         next_hop = None
         interface = None
 
-        # Find destination network
+        # Single pass: destination, then protocol/metrics, then the first hop line
         for line in lines:
-            match = re.search(r'Routing entry for\s+(\S+)', line)
-            if match:
-                destination_network = match.group(1)
-                break
-
-        if not destination_network:
-            return None
+            if destination_network is None:
+                # Routing entry for 192.168.1.0/24
+                match = _RE_DEST.search(line)
+                if match:
+                    destination_network = match.group(1)
+                continue
 
-        # Parse protocol and metrics
-        for line in lines:
             # Known via "ospf 1", distance 110, metric 20
-            match = re.search(r'Known via\s+"([^"]+)",\s+distance\s+(\d+),\s+metric\s+(\d+)', line)
+            match = _RE_KNOWN.search(line)
             if match:
                 protocol = match.group(1)
                 preference = int(match.group(2))
                 metric = int(match.group(3))
+                continue
+
+            # * directly connected, via GigabitEthernet0/0
+            match = _RE_CONNECTED.search(line)
+            if match:
+                interface = match.group(1)
+                break
 
-        # Parse next hop and interface
-        for line in lines:
             # Last update from 10.1.1.2 on GigabitEthernet0/1
-            match = re.search(r'(?:Last update from|via)\s+(\S+)(?:\s+on\s+(\S+))?', line)
+            match = _RE_HOP.search(line)
             if match:
                 next_hop = match.group(1)
                 if match.group(2):
                     interface = match.group(2).rstrip(',')
                 break
 
+        if not destination_network:
+            return None
+
         # Determine next hop type
         next_hop_type = NextHopType.IP.value
         if protocol == "connected":
@@ -105,85 +188,28 @@ class CiscoIOSParser:
         Returns:
             List of RouteEntry objects
         """
-        routes = []
-        lines = output.strip().split('\n')
+        return list(CiscoIOSParser.iter_routing_table(output, context))
 
-        current_network = None
-        current_protocol = None
+    @staticmethod
+    def iter_routing_table(output: str, context: str = "global") -> Iterator[RouteEntry]:
+        """
+        Lazily parse full routing table from 'show ip route' output.
 
-        for line in lines:
-            line = line.strip()
+        Yields routes as they are parsed so callers that stream entries into
+        another structure never hold an intermediate list.
 
-            # Skip empty lines and headers
-            if not line or line.startswith('Codes:') or line.startswith('Gateway'):
-                continue
-
-            # Parse route entry
-            # C        10.1.1.0/24 is directly connected, GigabitEthernet0/0
-            # O        192.168.1.0/24 [110/20] via 10.1.1.2, 00:05:23, GigabitEthernet0/1
-            # S*       0.0.0.0/0 [1/0] via 10.0.0.1
+        Args:
+            output: Raw command output
+            context: VRF or routing context
 
-            match = re.match(r'^([A-Z\*\s]+)\s+(\S+)\s+(.+)$', line)
-            if match:
-                protocol_code = match.group(1).strip()
-                network = match.group(2)
-                rest = match.group(3)
-
-                # Map protocol codes
-                protocol_map = {
-                    'C': 'connected',
-                    'L': 'local',
-                    'S': 'static',
-                    'S*': 'static',
-                    'O': 'ospf',
-                    'B': 'bgp',
-                    'D': 'eigrp',
-                    'R': 'rip',
-                    'i': 'isis',
-                }
-
-                protocol = protocol_map.get(protocol_code.replace('*', ''), 'unknown')
-
-                # Parse connected routes
-                if 'directly connected' in rest:
-                    match_int = re.search(r'directly connected,\s+(\S+)', rest)
-                    interface = match_int.group(1) if match_int else None
-
-                    routes.append(RouteEntry(
-                        destination=network,
-                        next_hop=interface or "",
-                        next_hop_type=NextHopType.CONNECTED.value,
-                        outgoing_interface=interface,
-                        protocol=protocol,
-                        logical_context=context,
-                        metric=0,
-                        preference=0,
-                        raw_output=line
-                    ))
-
-                # Parse routes with next hop
-                else:
-                    # [110/20] via 10.1.1.2, 00:05:23, GigabitEthernet0/1
-                    match_via = re.search(r'\[(\d+)/(\d+)\]\s+via\s+(\S+)(?:,\s+[\d:]+,\s+(\S+))?', rest)
-                    if match_via:
-                        preference = int(match_via.group(1))
-                        metric = int(match_via.group(2))
-                        next_hop = match_via.group(3)
-                        interface = match_via.group(4)
-
-                        routes.append(RouteEntry(
-                            destination=network,
-                            next_hop=next_hop,
-                            next_hop_type=NextHopType.IP.value,
-                            outgoing_interface=interface,
-                            protocol=protocol,
-                            logical_context=context,
-                            metric=metric,
-                            preference=preference,
-                            raw_output=line
-                        ))
-
-        return routes
+        Yields:
+            RouteEntry objects in output order
+        """
+        # Headers, legend and blank lines never match the route pattern
+        for match in _RE_TABLE_LINE.finditer(output):
+            route = _parse_ios_table_match(match, context)
+            if route is not None:
+                yield route
 
     @staticmethod
     def parse_vrf_list(output: str) -> List[str]:
@@ -233,10 +259,9 @@ class CiscoIOSParser:
                 continue
 
             # GigabitEthernet0/0    10.1.1.1        YES manual up                    up
-            match = re.match(r'^(\S+)\s+(\S+)\s+', line)
-            if match:
-                interface = match.group(1)
-                ip = match.group(2)
+            parts = line.split(None, 2)
+            if len(parts) >= 2:
+                interface, ip = parts[0], parts[1]
                 if ip != 'unassigned':
                     interfaces[interface] = ip
 
@@ -261,9 +286,7 @@ class CiscoIOSParser:
         # Parse first line: interface name and status
         # e.g. "GigabitEthernet0/1 is up, line protocol is up"
         # e.g. "GigabitEthernet0/2 is administratively down, line protocol is down"
-        first_line_match = re.match(
-            r'^(\S+)\s+is\s+(.+?),\s+line protocol is\s+(\S+)', lines[0]
-        )
+        first_line_match = _RE_INTERFACE_STATUS.match(lines[0])
         if not first_line_match:
             return None
 
@@ -294,60 +317,65 @@ class CiscoIOSParser:
             stripped = line.strip()
 
             # Description: Uplink to spine
-            desc_match = re.match(r'^Description:\s+(.+)$', stripped)
-            if desc_match:
-                description = desc_match.group(1).strip()
-                continue
+            if stripped.startswith('Description:'):
+                desc_match = _RE_DESCRIPTION.match(stripped)
+                if desc_match:
+                    description = desc_match.group(1).strip()
+                    continue
 
             # BW 1000000 Kbit/sec
-            bw_match = re.search(r'BW\s+(\d+)\s+Kbit/sec', stripped)
-            if bw_match:
-                bandwidth = int(bw_match.group(1))
-                continue
+            if 'BW' in stripped:
+                bw_match = _RE_BANDWIDTH.search(stripped)
+                if bw_match:
+                    bandwidth = int(bw_match.group(1))
+                    continue
 
             # Full-duplex, 1000Mb/s, media type is RJ45
-            speed_match = re.search(r'duplex,\s+(\S+),', stripped)
-            if speed_match:
-                speed = speed_match.group(1)
-                continue
+            if 'duplex,' in stripped:
+                speed_match = _RE_SPEED.search(stripped)
+                if speed_match:
+                    speed = speed_match.group(1)
+                    continue
 
             # 5 minute input rate 230000000 bits/sec
-            input_rate_match = re.search(
-                r'5 minute input rate\s+(\d+)\s+bits/sec', stripped
-            )
-            if input_rate_match:
-                input_rate = int(input_rate_match.group(1))
-                continue
+            if '5 minute input rate' in stripped:
+                input_rate_match = _RE_INPUT_RATE.search(stripped)
+                if input_rate_match:
+                    input_rate = int(input_rate_match.group(1))
+                    continue
 
             # 5 minute output rate 460000000 bits/sec
-            output_rate_match = re.search(
-                r'5 minute output rate\s+(\d+)\s+bits/sec', stripped
-            )
-            if output_rate_match:
-                output_rate = int(output_rate_match.group(1))
-                continue
+            if '5 minute output rate' in stripped:
+                output_rate_match = _RE_OUTPUT_RATE.search(stripped)
+                if output_rate_match:
+                    output_rate = int(output_rate_match.group(1))
+                    continue
 
             # 5 input errors, 3 CRC, 0 frame, 0 overrun, 2 ignored
-            input_errors_match = re.search(r'(\d+)\s+input errors', stripped)
-            if input_errors_match:
-                errors_in = int(input_errors_match.group(1))
-                continue
+            if 'input errors' in stripped:
+                input_errors_match = _RE_INPUT_ERRORS.search(stripped)
+                if input_errors_match:
+                    errors_in = int(input_errors_match.group(1))
+                    continue
 
             # 1 output errors, 0 collisions, 0 interface resets
-            output_errors_match = re.search(r'(\d+)\s+output errors', stripped)
-            if output_errors_match:
-                errors_out = int(output_errors_match.group(1))
-                continue
+            if 'output errors' in stripped:
+                output_errors_match = _RE_OUTPUT_ERRORS.search(stripped)
+                if output_errors_match:
+                    errors_out = int(output_errors_match.group(1))
+                    continue
 
             # 10 input queue drops
-            input_drops_match = re.search(r'(\d+)\s+input queue drops', stripped)
-            if input_drops_match:
-                discards_in = int(input_drops_match.group(1))
+            if 'input queue drops' in stripped:
+                input_drops_match = _RE_INPUT_DROPS.search(stripped)
+                if input_drops_match:
+                    discards_in = int(input_drops_match.group(1))
 
             # 5 output drops
-            output_drops_match = re.search(r'(\d+)\s+output drops', stripped)
-            if output_drops_match:
-                discards_out = int(output_drops_match.group(1))
+            if 'output drops' in stripped:
+                output_drops_match = _RE_OUTPUT_DROPS.search(stripped)
+                if output_drops_match:
+                    discards_out = int(output_drops_match.group(1))
 
         # Calculate utilisation: rate / (bandwidth * 1000) * 100
         # bandwidth is in Kbit/sec, rate is in bits/sec
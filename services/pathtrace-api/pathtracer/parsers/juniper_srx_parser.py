@@ -1,7 +1,8 @@
 """Parser for Juniper SRX (Junos) output."""
 
 import re
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, List, Optional, Tuple
 from ..models import (
     InterfaceDetail,
     NatResult,
@@ -12,6 +13,103 @@ from ..models import (
 )
 
 
+_RE_METRIC = re.compile(r"metric\s+(\d+)")
+# One active route plus the first "> to X via Y" line before the next
+# prefix. [^\S\n] is whitespace that never crosses into the next line.
+_RE_ROUTE_BLOCK = re.compile(
+    r"^[^\S\n]*(?P<dst>\S+/\d+)[^\S\n]+"
+    r"\*\[(?P<proto>\w+)/(?P<pref>\d+)\][^\S\n]+(?P<rest>.+)"
+    r"(?:\n(?:(?![^\S\n]*\S+/\d+[^\S\n]).*\n)*?"
+    r".*?>[^\S\n]+to[^\S\n]+(?P<nh>\S+)[^\S\n]+via[^\S\n]+(?P<via>\S+))?",
+    re.MULTILINE,
+)
+_RE_PHYSICAL = re.compile(
+    r"^Physical interface:\s+(\S+),\s+\S+,\s+Physical link is\s+(\S+)"
+)
+# Each alternative ends on the group that identifies it, so lastgroup is
+# one of description, speed, errors_out or drops_out
+_RE_INTERFACE_FIELD = re.compile(
+    r"^[^\S\n]*Description:[^\S\n]+(?P<description>.+)"
+    r"|Speed:[^\S\n]+(?P<speed>\S+)"
+    r"|Input errors:[^\S\n]+(?P<errors_in>\d+),"
+    r"[^\S\n]+Output errors:[^\S\n]+(?P<errors_out>\d+)"
+    r"|Input drops:[^\S\n]+(?P<drops_in>\d+),"
+    r"[^\S\n]+Output drops:[^\S\n]+(?P<drops_out>\d+)",
+    re.MULTILINE,
+)
+# A zone header, then everything after its "Interfaces bound:" line up to
+# the next zone or "Send reset" line
+_RE_ZONE_BLOCK = re.compile(
+    r"^[^\S\n]*Security zone:[^\S\n]+(\S+)"
+    r"(?:\n(?![^\S\n]*Security zone:).*)*?"
+    r"\n[^\S\n]*Interfaces bound:.*"
+    r"((?:\n(?![^\S\n]*(?:Security zone|Send reset)).*)*)",
+    re.MULTILINE,
+)
+_RE_ALPHA_START = re.compile(r"^[a-zA-Z]")
+# Negated classes with possessive quantifiers stop at the first comma
+# without backtracking
+_RE_POLICY_NAME = re.compile(r"Policy:\s++([^\s,]++),")
+_RE_SEQUENCE = re.compile(r"Sequence number:\s+(\d+)")
+_RE_POLICY_ZONES = re.compile(
+    r"Source zone:\s++([^\s,]++),\s++Destination zone:\s++(\S++)"
+)
+_RE_SOURCE_ADDRESSES = re.compile(r"Source addresses:\s+(.+)")
+_RE_DEST_ADDRESSES = re.compile(r"Destination addresses:\s+(.+)")
+_RE_APPLICATIONS = re.compile(r"Applications:\s+(.+)")
+_RE_ACTION = re.compile(r"Action:\s+(\S+)")
+_RE_CSV_SPLIT = re.compile(r"\s*,\s*")
+_RE_SNAT_RULE = re.compile(r"source NAT rule:\s+(\S+)")
+_RE_TRANSLATED_ADDRESS = re.compile(r"translated address:\s+(\S+)")
+_RE_DNAT_RULE = re.compile(r"destination NAT rule:\s+(\S+)")
+_RE_TRANSLATED_PORT = re.compile(r"translated port:\s+(\d+)")
+
+# Next-hop type strings, resolved once at import
+_NHT_IP = NextHopType.IP.value
+_NHT_CONNECTED = NextHopType.CONNECTED.value
+_NHT_LOCAL = NextHopType.LOCAL.value
+
+# Protocols whose routes are not via an IP next hop
+_NEXT_HOP_TYPES = {
+    "direct": _NHT_CONNECTED,
+    "local": _NHT_LOCAL,
+}
+
+
+def _route_fields(
+    match: re.Match,
+) -> Tuple[str, str, str, Optional[str], str, int, int]:
+    """Extract route fields from one _RE_ROUTE_BLOCK match.
+
+    Args:
+        match: Match of an active route line and its next-hop line
+
+    Returns:
+        Tuple of (destination, next_hop, next_hop_type, interface, protocol,
+        metric, preference)
+    """
+    # Interned so every route of a protocol shares one string
+    protocol = sys.intern(match.group("proto").lower())
+
+    metric = 0
+    metric_match = _RE_METRIC.search(match.group("rest"))
+    if metric_match:
+        metric = int(metric_match.group(1))
+
+    next_hop = match.group("nh")
+    interface = match.group("via")
+
+    return (
+        match.group("dst"),
+        next_hop or interface or "",
+        _NEXT_HOP_TYPES.get(protocol, _NHT_IP),
+        interface,
+        protocol,
+        metric,
+        int(match.group("pref")),
+    )
+
+
 class JuniperSRXParser:
     """Parser for Juniper SRX / Junos show command output."""
 
@@ -36,65 +134,23 @@ class JuniperSRXParser:
         Returns:
             RouteEntry or None if no route found
         """
-        if not output or not output.strip():
+        # Every active route carries a "*[" marker; without one there is
+        # nothing to scan
+        if not output or "*[" not in output:
             return None
 
-        lines = output.strip().split("\n")
-
-        destination_network = None
-        protocol = "unknown"
-        preference = 0
-        metric = 0
-        next_hop = None
-        interface = None
-
-        for i, line in enumerate(lines):
-            # Match route line: "0.0.0.0/0          *[Static/5] 30d 12:45:00"
-            # or "0.0.0.0/0          *[Static/5] 30d 12:45:00, metric 20"
-            route_match = re.match(
-                r"^\s*(\S+/\d+)\s+\*\[(\w+)/(\d+)\]\s+(.+)$", line
-            )
-            if route_match:
-                destination_network = route_match.group(1)
-                protocol = route_match.group(2).lower()
-                preference = int(route_match.group(3))
-
-                # Check for metric in the rest of the line
-                rest = route_match.group(4)
-                metric_match = re.search(r"metric\s+(\d+)", rest)
-                if metric_match:
-                    metric = int(metric_match.group(1))
-
-                # Look at the next line(s) for next hop and interface
-                for j in range(i + 1, len(lines)):
-                    hop_line = lines[j]
-                    # "> to 10.0.0.1 via ge-0/0/0.0"
-                    hop_match = re.search(
-                        r">\s+to\s+(\S+)\s+via\s+(\S+)", hop_line
-                    )
-                    if hop_match:
-                        next_hop = hop_match.group(1)
-                        interface = hop_match.group(2)
-                        break
-                    # Stop if we hit another route entry
-                    if re.match(r"^\s*\S+/\d+\s+", hop_line):
-                        break
-
-                break  # Only parse the first matching route
-
-        if not destination_network:
+        # Only the first route is parsed: "0.0.0.0/0  *[Static/5] 30d 12:45:00"
+        # or "... 30d 12:45:00, metric 20", plus its "> to X via Y" line
+        match = _RE_ROUTE_BLOCK.search(output.strip())
+        if not match:
             return None
 
-        # Determine next hop type
-        next_hop_type = NextHopType.IP.value
-        if protocol == "direct":
-            next_hop_type = NextHopType.CONNECTED.value
-        elif protocol == "local":
-            next_hop_type = NextHopType.LOCAL.value
-
+        destination, next_hop, next_hop_type, interface, protocol, metric, preference = (
+            _route_fields(match)
+        )
         return RouteEntry(
-            destination=destination_network,
-            next_hop=next_hop or interface or "",
+            destination=destination,
+            next_hop=next_hop,
             next_hop_type=next_hop_type,
             outgoing_interface=interface,
             protocol=protocol,
@@ -110,6 +166,9 @@ class JuniperSRXParser:
     ) -> List[RouteEntry]:
         """Parse full Junos routing table from 'show route' output.
 
+        Entries leave raw_output empty; only parse_route_entry keeps the
+        command output, so a large table holds no per-route text.
+
         Args:
             output: Raw command output
             context: Routing instance name
@@ -121,64 +180,22 @@ class JuniperSRXParser:
         if not output or not output.strip():
             return routes
 
-        lines = output.strip().split("\n")
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Match route line: "prefix/len *[Protocol/pref] age, metric N"
-            route_match = re.match(
-                r"^\s*(\S+/\d+)\s+\*\[(\w+)/(\d+)\]\s+(.+)$", line
+        for match in _RE_ROUTE_BLOCK.finditer(output.strip()):
+            destination, next_hop, next_hop_type, interface, protocol, metric, preference = (
+                _route_fields(match)
             )
-            if route_match:
-                destination_network = route_match.group(1)
-                protocol = route_match.group(2).lower()
-                preference = int(route_match.group(3))
-
-                rest = route_match.group(4)
-                metric = 0
-                metric_match = re.search(r"metric\s+(\d+)", rest)
-                if metric_match:
-                    metric = int(metric_match.group(1))
-
-                # Look for next hop on subsequent lines
-                next_hop = None
-                interface = None
-                for j in range(i + 1, len(lines)):
-                    hop_line = lines[j]
-                    hop_match = re.search(
-                        r">\s+to\s+(\S+)\s+via\s+(\S+)", hop_line
-                    )
-                    if hop_match:
-                        next_hop = hop_match.group(1)
-                        interface = hop_match.group(2)
-                        break
-                    if re.match(r"^\s*\S+/\d+\s+", hop_line):
-                        break
-
-                # Determine next hop type
-                next_hop_type = NextHopType.IP.value
-                if protocol == "direct":
-                    next_hop_type = NextHopType.CONNECTED.value
-                elif protocol == "local":
-                    next_hop_type = NextHopType.LOCAL.value
-
-                routes.append(
-                    RouteEntry(
-                        destination=destination_network,
-                        next_hop=next_hop or interface or "",
-                        next_hop_type=next_hop_type,
-                        outgoing_interface=interface,
-                        protocol=protocol,
-                        logical_context=context,
-                        metric=metric,
-                        preference=preference,
-                        raw_output=line,
-                    )
+            routes.append(
+                RouteEntry(
+                    destination=destination,
+                    next_hop=next_hop,
+                    next_hop_type=next_hop_type,
+                    outgoing_interface=interface,
+                    protocol=protocol,
+                    logical_context=context,
+                    metric=metric,
+                    preference=preference,
                 )
-
-            i += 1
+            )
 
         return routes
 
@@ -205,13 +222,10 @@ class JuniperSRXParser:
         if not output or not output.strip():
             return None
 
-        lines = output.strip().split("\n")
+        header, _, body = output.strip().partition("\n")
 
         # Parse first line: "Physical interface: ge-0/0/0, Enabled, Physical link is Up"
-        first_match = re.match(
-            r"^Physical interface:\s+(\S+),\s+\S+,\s+Physical link is\s+(\S+)",
-            lines[0],
-        )
+        first_match = _RE_PHYSICAL.match(header)
         if not first_match:
             return None
 
@@ -230,38 +244,19 @@ class JuniperSRXParser:
         discards_in = 0
         discards_out = 0
 
-        for line in lines[1:]:
-            stripped = line.strip()
-
-            # Description: Outside uplink
-            desc_match = re.match(r"^Description:\s+(.+)$", stripped)
-            if desc_match:
-                description = desc_match.group(1).strip()
-                continue
-
-            # Speed: 1000mbps (from Link-level type line)
-            speed_match = re.search(r"Speed:\s+(\S+)", stripped)
-            if speed_match:
-                speed = speed_match.group(1)
-                continue
-
-            # Input errors: 5, Output errors: 1
-            errors_match = re.search(
-                r"Input errors:\s+(\d+),\s+Output errors:\s+(\d+)", stripped
-            )
-            if errors_match:
-                errors_in = int(errors_match.group(1))
-                errors_out = int(errors_match.group(2))
-                continue
-
-            # Input drops: 2, Output drops: 0
-            drops_match = re.search(
-                r"Input drops:\s+(\d+),\s+Output drops:\s+(\d+)", stripped
-            )
-            if drops_match:
-                discards_in = int(drops_match.group(1))
-                discards_out = int(drops_match.group(2))
-                continue
+        # One pass over everything below the header line
+        for match in _RE_INTERFACE_FIELD.finditer(body):
+            field = match.lastgroup
+            if field == "description":
+                description = match.group("description").strip()
+            elif field == "speed":
+                speed = match.group("speed")
+            elif field == "errors_out":
+                errors_in = int(match.group("errors_in"))
+                errors_out = int(match.group("errors_out"))
+            else:
+                discards_in = int(match.group("drops_in"))
+                discards_out = int(match.group("drops_out"))
 
         return InterfaceDetail(
             name=name,
@@ -302,33 +297,14 @@ class JuniperSRXParser:
         if not output or not output.strip():
             return zones
 
-        current_zone = None
-        in_interfaces = False
-
-        for line in output.strip().split("\n"):
-            stripped = line.strip()
-
-            # Security zone: <name>
-            zone_match = re.match(r"^Security zone:\s+(\S+)", stripped)
-            if zone_match:
-                current_zone = zone_match.group(1)
-                in_interfaces = False
-                continue
-
-            # Interfaces bound: <count>
-            if re.match(r"^Interfaces bound:", stripped):
-                in_interfaces = True
-                continue
-
-            # Interface names are indented lines after "Interfaces bound:"
-            # They look like interface names (e.g., ge-0/0/1.0)
-            if current_zone and in_interfaces and stripped:
-                # Check if this looks like an interface name
-                if re.match(r"^[a-zA-Z]", stripped) and "/" in stripped:
-                    zones[stripped] = current_zone
-                elif re.match(r"^(Security zone|Send reset)", stripped):
-                    # We've moved past the interface list
-                    in_interfaces = False
+        for match in _RE_ZONE_BLOCK.finditer(output):
+            zone = sys.intern(match.group(1))
+            # Interface names are the indented lines after "Interfaces bound:"
+            # that look like interface names (e.g., ge-0/0/1.0)
+            for line in match.group(2).split("\n"):
+                stripped = line.strip()
+                if "/" in stripped and _RE_ALPHA_START.match(stripped):
+                    zones[stripped] = zone
 
         return zones
 
@@ -354,57 +330,57 @@ class JuniperSRXParser:
             return None
 
         # Extract policy name: "Policy: <name>,"
-        name_match = re.search(r"Policy:\s+(\S+?),", output)
+        name_match = _RE_POLICY_NAME.search(output)
         if not name_match:
             return None
         rule_name = name_match.group(1)
 
         # Extract sequence number for rule position
-        seq_match = re.search(r"Sequence number:\s+(\d+)", output)
+        seq_match = _RE_SEQUENCE.search(output)
         rule_position = int(seq_match.group(1)) if seq_match else 0
 
         # Extract source and destination zones
         source_zone = ""
         dest_zone = ""
-        zone_match = re.search(
-            r"Source zone:\s+(\S+?),\s+Destination zone:\s+(\S+)", output
-        )
+        zone_match = _RE_POLICY_ZONES.search(output)
         if zone_match:
-            source_zone = zone_match.group(1)
-            dest_zone = zone_match.group(2)
+            source_zone = sys.intern(zone_match.group(1))
+            dest_zone = sys.intern(zone_match.group(2))
 
         # Extract source addresses
         source_addresses: List[str] = []
-        src_match = re.search(r"Source addresses:\s+(.+)", output)
+        src_match = _RE_SOURCE_ADDRESSES.search(output)
         if src_match:
             source_addresses = [
-                s.strip() for s in src_match.group(1).split(",") if s.strip()
+                s for s in _RE_CSV_SPLIT.split(src_match.group(1).strip()) if s
             ]
 
         # Extract destination addresses
         dest_addresses: List[str] = []
-        dst_match = re.search(r"Destination addresses:\s+(.+)", output)
+        dst_match = _RE_DEST_ADDRESSES.search(output)
         if dst_match:
             dest_addresses = [
-                s.strip() for s in dst_match.group(1).split(",") if s.strip()
+                s for s in _RE_CSV_SPLIT.split(dst_match.group(1).strip()) if s
             ]
 
         # Extract services/applications
         services: List[str] = []
-        app_match = re.search(r"Applications:\s+(.+)", output)
+        app_match = _RE_APPLICATIONS.search(output)
         if app_match:
             services = [
-                s.strip() for s in app_match.group(1).split(",") if s.strip()
+                s for s in _RE_CSV_SPLIT.split(app_match.group(1).strip()) if s
             ]
 
         # Extract action
-        action_match = re.search(r"Action:\s+(\S+)", output)
+        action_match = _RE_ACTION.search(output)
         if not action_match:
             return None
         action = action_match.group(1).rstrip(",").lower()
 
-        # Check for logging
-        logging_enabled = "log" in output.lower().split("action:")[-1]
+        # Check for logging after the last "Action:" label; only that tail
+        # is lowercased, not the whole output
+        action_tail = output[output.rfind("Action:"):]
+        logging_enabled = "log" in action_tail.lower()
 
         return PolicyResult(
             rule_name=rule_name,
@@ -460,12 +436,8 @@ class JuniperSRXParser:
 
         # Parse source NAT
         if source_output and source_output.strip():
-            rule_match = re.search(
-                r"source NAT rule:\s+(\S+)", source_output
-            )
-            translated_match = re.search(
-                r"translated address:\s+(\S+)", source_output
-            )
+            rule_match = _RE_SNAT_RULE.search(source_output)
+            translated_match = _RE_TRANSLATED_ADDRESS.search(source_output)
             if rule_match and translated_match:
                 translated_ip = translated_match.group(1).rstrip(",")
                 snat = NatTranslation(
@@ -478,19 +450,13 @@ class JuniperSRXParser:
 
         # Parse destination NAT
         if dest_output and dest_output.strip():
-            rule_match = re.search(
-                r"destination NAT rule:\s+(\S+)", dest_output
-            )
-            translated_match = re.search(
-                r"translated address:\s+(\S+)", dest_output
-            )
+            rule_match = _RE_DNAT_RULE.search(dest_output)
+            translated_match = _RE_TRANSLATED_ADDRESS.search(dest_output)
             if rule_match and translated_match:
                 translated_ip = translated_match.group(1).rstrip(",")
 
                 # Check for translated port
-                port_match = re.search(
-                    r"translated port:\s+(\d+)", dest_output
-                )
+                port_match = _RE_TRANSLATED_PORT.search(dest_output)
                 translated_port = (
                     port_match.group(1) if port_match else None
                 )
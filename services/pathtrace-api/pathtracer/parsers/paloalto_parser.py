@@ -1,15 +1,273 @@
 """Parser for Palo Alto PAN-OS output."""
 
+import functools
 import re
-from typing import List, Optional
+import sys
+from typing import Iterator, List, Optional, Tuple, Union
 from ..models import RouteEntry, NextHopType, InterfaceDetail, PolicyResult, NatResult, NatTranslation
+from ..utils.text import as_text
+
+
+_RE_VIRTUAL_ROUTER = re.compile(r'Virtual Router:\s+(\S+)')
+_RE_IPV4 = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+# Case-insensitive "ip:" label, matched without lowercasing a copy of the line
+_RE_IP_LABEL = re.compile(r'ip:', re.IGNORECASE)
+_RE_ZONE = re.compile(r'^\s*Zone:\s+(\S+)')
+_RE_RULE_NAME = re.compile(r'"([^"]+)"')
+# One "<keyword> <value>;" line of a policy match; possessive quantifiers
+# and negated classes keep it from backtracking on long or malformed output
+_RE_POLICY_FIELD = re.compile(
+    r'^[^\S\n]*+(?P<key>from|to|source|destination|application/service|action)'
+    r'[^\S\n]++(?P<value>[^;\n]++);',
+    re.MULTILINE,
+)
+_RE_NAT_RULE = re.compile(r'Matched NAT rule:\s*"([^"]+)"')
+_RE_TRANSLATION = re.compile(r'(\S+)\s*==>\s*(\S+)')
+_RE_SOURCE_TRANSLATION = re.compile(r'Source translation:\s*(.+)')
+_RE_DEST_TRANSLATION = re.compile(r'Destination translation:\s*(.+)')
+# One route row: at least five columns, then destination, nexthop, metric,
+# one or more flag tokens ("A S" or "AS"), an optional numeric age and the
+# interface. [^\S\n] is whitespace that never crosses into the next line.
+_RE_ROUTE_ROW = re.compile(
+    r'^(?=[^\S\n]*+(?:\S++[^\S\n]++){4}\S)'
+    r'[^\S\n]*+(?P<dst>\S+/\d+)[^\S\n]++(?P<nh>\S++)[^\S\n]++(?P<metric>\S++)'
+    r'(?P<flags>(?:[^\S\n]++[A-Z?~]++(?!\S))++)'
+    r'(?:[^\S\n]++\d++(?!\S))?+'
+    r'(?:[^\S\n]++(?P<intf>\S++))?+'
+    r'.*',
+    re.MULTILINE,
+)
+
+_PROTO_MAP = {
+    'S': 'static',
+    'C': 'connected',
+    'O': 'ospf',
+    'B': 'bgp',
+    'R': 'rip',
+}
+
+# Policy keywords whose value is a single token
+_POLICY_TOKEN_FIELDS = frozenset(('from', 'to', 'action'))
+
+# Name prefixes of the interface rows in 'show interface all'
+_INTERFACE_PREFIXES = ('ethernet', 'vlan', 'ae', 'tunnel', 'loopback')
+
+_NHT_IP = NextHopType.IP.value
+_NHT_CONNECTED = NextHopType.CONNECTED.value
+_NHT_NULL = NextHopType.NULL.value
+
+
+def _field_text(value: str) -> Optional[str]:
+    """Return a free-text interface field, or None if it is blank."""
+    return value or None
+
+
+def _field_state(value: str) -> Optional[str]:
+    """Return the lowercased first word of a link state field."""
+    words = value.split(None, 1)
+    return words[0].lower() if words else None
+
+
+def _field_speed(value: str) -> Optional[str]:
+    """Return a numeric link speed field as Mb/s, or None if not numeric."""
+    words = value.split(None, 1)
+    if words and words[0].isdigit():
+        return f"{words[0]}Mb/s"
+    return None
+
+
+def _field_count(value: str) -> Optional[int]:
+    """Return a numeric counter field, or None if not numeric."""
+    words = value.split(None, 1)
+    if words and words[0].isdigit():
+        return int(words[0])
+    return None
+
+
+# 'show interface <name>' label -> (InterfaceDetail field, value converter)
+_INTERFACE_FIELDS = {
+    'Name': ('name', _field_text),
+    'Description': ('description', _field_text),
+    'Link state': ('status', _field_state),
+    'Link speed': ('speed', _field_speed),
+    'Errors received': ('errors_in', _field_count),
+    'Errors transmitted': ('errors_out', _field_count),
+    'Drops received': ('discards_in', _field_count),
+    'Drops transmitted': ('discards_out', _field_count),
+}
+
+
+def _table_start(output: str) -> int:
+    """Return the offset of the first line below the dashed header rule.
+
+    Rows are then scanned in place from this offset, so the table body is
+    never copied out of the command output.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        Offset of the first row, or -1 if there is no header rule
+    """
+    rule = output.find('---')
+    if rule < 0:
+        return -1
+
+    # Skip the remainder of the dashed rule itself
+    end = output.find('\n', rule)
+    if end < 0:
+        return -1
+    return end + 1
+
+
+def _table_rows(output: str) -> Iterator[re.Match]:
+    """Return matches for the route rows below the dashed header rule.
+
+    One finditer over the output picks out and splits every route row, so
+    blank lines, separators and trailers never reach Python code.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        Iterator of _RE_ROUTE_ROW matches in output order, empty if there is
+        no header rule
+    """
+    start = _table_start(output)
+    if start < 0:
+        return iter(())
+    return _RE_ROUTE_ROW.finditer(output, start)
+
+
+@functools.lru_cache(maxsize=64)
+def _classify_route(flags: str, discard: bool) -> Tuple[str, str]:
+    """Map a route's flags and discard next hop to protocol and next-hop type.
+
+    Only a handful of distinct flag strings appear in a table, so nearly
+    every row is answered from the cache.
+
+    Args:
+        flags: Concatenated flag letters, e.g. "AS"
+        discard: Whether the next hop is "discard"
+
+    Returns:
+        Tuple of (protocol, next hop type)
+    """
+    # The first flag letter that names a protocol wins
+    protocol = 'unknown'
+    for flag in flags:
+        mapped = _PROTO_MAP.get(flag)
+        if mapped is not None:
+            protocol = mapped
+            break
+
+    # Determine next hop type
+    next_hop_type = _NHT_IP
+    if protocol == "connected":
+        next_hop_type = _NHT_CONNECTED
+    elif discard:
+        next_hop_type = _NHT_NULL
+
+    return protocol, next_hop_type
+
+
+def _route_row_fields(match: re.Match) -> Tuple[str, str, str, Optional[str], str, int]:
+    """Convert one route row match into route fields.
+
+    Args:
+        match: _RE_ROUTE_ROW match for one data row
+
+    Returns:
+        Tuple of (destination, next_hop, next_hop_type, interface, protocol,
+        metric)
+    """
+    # One group() call fetches every column
+    destination, next_hop, metric_text, flags, interface = match.group(
+        'dst', 'nh', 'metric', 'flags', 'intf'
+    )
+    try:
+        metric = int(metric_text)
+    except ValueError:
+        metric = 0
+
+    # Spaced flags ("A S") are joined into one flag string
+    protocol, next_hop_type = _classify_route(
+        ''.join(flags.split()), next_hop == "discard"
+    )
+
+    return destination, next_hop, next_hop_type, interface, protocol, metric
+
+
+def _parse_route_row(match: re.Match, context: str, include_raw: bool = True) -> RouteEntry:
+    """Parse one data row of a PAN-OS route table.
+
+    Args:
+        match: _RE_ROUTE_ROW match for one data row
+        context: Virtual router name
+        include_raw: Keep the row text as raw_output
+
+    Returns:
+        RouteEntry for the row
+    """
+    network, next_hop, next_hop_type, interface, protocol, metric = (
+        _route_row_fields(match)
+    )
+    return RouteEntry(
+        network, next_hop, next_hop_type, interface, protocol, context,
+        metric,
+        0,  # PAN-OS doesn't show AD in this output
+        match.group() if include_raw else ""
+    )
+
+
+def _split_ip_port(value: str) -> Tuple[str, Optional[str]]:
+    """Split 'ip:port' into (ip, port) or (ip, None)."""
+    ip, sep, port = value.rpartition(':')
+    if not sep:
+        return value, None
+    return ip, port
+
+
+def _parse_translation(line_value: str, rule_name: str) -> Optional[NatTranslation]:
+    """Parse a translation line value like '10.1.1.100 ==> 203.0.113.5'.
+
+    Args:
+        line_value: Text after the "Source/Destination translation:" label
+        rule_name: Matched NAT rule name
+
+    Returns:
+        NatTranslation, or None for "none" or an unrecognised value
+    """
+    if not line_value or line_value.strip().lower() == "none":
+        return None
+
+    parts = _RE_TRANSLATION.match(line_value.strip())
+    if not parts:
+        return None
+
+    original = parts.group(1)
+    translated = parts.group(2)
+
+    # Parse ip:port format
+    original_ip, original_port = _split_ip_port(original)
+    translated_ip, translated_port = _split_ip_port(translated)
+
+    return NatTranslation(
+        original_ip=original_ip,
+        original_port=original_port,
+        translated_ip=translated_ip,
+        translated_port=translated_port,
+        nat_rule_name=rule_name,
+    )
 
 
 class PaloAltoParser:
     """Parser for Palo Alto PAN-OS routing output."""
 
     @staticmethod
-    def parse_route_entry(output: str, destination: str, context: str = "default") -> Optional[RouteEntry]:
+    def parse_route_entry(
+        output: Union[bytes, str], destination: str, context: str = "default"
+    ) -> Optional[RouteEntry]:
         """
         Parse 'show routing route destination <ip> virtual-router <vr>' output.
 
@@ -22,144 +280,44 @@ class PaloAltoParser:
         Flags: A - active, ? - loose, S - static, C - connect, O - OSPF, B - BGP, R - RIP
 
         Args:
-            output: Raw command output
+            output: Raw command output, as str or undecoded bytes
             destination: Destination IP queried
             context: Virtual router name
 
         Returns:
             RouteEntry or None if no route found
         """
+        output = as_text(output)
         if not output or "destination not found" in output.lower():
             return None
 
-        lines = output.strip().split('\n')
-
-        # Skip header lines
-        data_lines = []
-        found_header = False
-        for line in lines:
-            if '---' in line:
-                found_header = True
-                continue
-            if found_header and line.strip():
-                data_lines.append(line)
-
-        if not data_lines:
+        # Rows are matched lazily, so only the first route is ever scanned
+        match = next(_table_rows(output), None)
+        if match is None:
             return None
 
-        # Parse first matching route
-        for line in data_lines:
-            parts = line.split()
-            if len(parts) < 6:
-                continue
-
-            network = parts[0]
-            next_hop = parts[1]
-            metric = int(parts[2]) if parts[2].isdigit() else 0
-            flags = parts[3]
-            interface = parts[5] if len(parts) > 5 else None
-
-            # Determine protocol from flags
-            protocol = "unknown"
-            if 'S' in flags:
-                protocol = "static"
-            elif 'C' in flags:
-                protocol = "connected"
-            elif 'O' in flags:
-                protocol = "ospf"
-            elif 'B' in flags:
-                protocol = "bgp"
-            elif 'R' in flags:
-                protocol = "rip"
-
-            # Determine next hop type
-            next_hop_type = NextHopType.IP.value
-            if protocol == "connected":
-                next_hop_type = NextHopType.CONNECTED.value
-            elif next_hop == "discard":
-                next_hop_type = NextHopType.NULL.value
-
-            return RouteEntry(
-                destination=network,
-                next_hop=next_hop,
-                next_hop_type=next_hop_type,
-                outgoing_interface=interface,
-                protocol=protocol,
-                logical_context=context,
-                metric=metric,
-                preference=0,  # PAN-OS doesn't show AD in this output
-                raw_output=line
-            )
-
-        return None
+        return _parse_route_row(match, context)
 
     @staticmethod
-    def parse_routing_table(output: str, context: str = "default") -> List[RouteEntry]:
+    def parse_routing_table(
+        output: Union[bytes, str], context: str = "default", include_raw: bool = False
+    ) -> List[RouteEntry]:
         """
         Parse full routing table from 'show routing route virtual-router <vr>' output.
 
         Args:
-            output: Raw command output
+            output: Raw command output, as str or undecoded bytes
             context: Virtual router name
+            include_raw: Keep each row's text as raw_output; off by default
+                so a large table holds no per-route text
 
         Returns:
             List of RouteEntry objects
         """
-        routes = []
-        lines = output.strip().split('\n')
-
-        # Skip header
-        data_lines = []
-        found_header = False
-        for line in lines:
-            if '---' in line:
-                found_header = True
-                continue
-            if found_header and line.strip():
-                data_lines.append(line)
-
-        for line in data_lines:
-            parts = line.split()
-            if len(parts) < 6:
-                continue
-
-            network = parts[0]
-            next_hop = parts[1]
-            metric = int(parts[2]) if parts[2].isdigit() else 0
-            flags = parts[3]
-            interface = parts[5] if len(parts) > 5 else None
-
-            # Determine protocol
-            protocol = "unknown"
-            if 'S' in flags:
-                protocol = "static"
-            elif 'C' in flags:
-                protocol = "connected"
-            elif 'O' in flags:
-                protocol = "ospf"
-            elif 'B' in flags:
-                protocol = "bgp"
-
-            # Determine next hop type
-            next_hop_type = NextHopType.IP.value
-            if protocol == "connected":
-                next_hop_type = NextHopType.CONNECTED.value
-            elif next_hop == "discard":
-                next_hop_type = NextHopType.NULL.value
-
-            routes.append(RouteEntry(
-                destination=network,
-                next_hop=next_hop,
-                next_hop_type=next_hop_type,
-                outgoing_interface=interface,
-                protocol=protocol,
-                logical_context=context,
-                metric=metric,
-                preference=0,
-                raw_output=line
-            ))
-
-        return routes
+        return [
+            _parse_route_row(match, context, include_raw)
+            for match in _table_rows(as_text(output))
+        ]
 
     @staticmethod
     def parse_virtual_router_list(output: str) -> List[str]:
@@ -173,14 +331,17 @@ class PaloAltoParser:
             List of virtual router names
         """
         vrs = []
-        lines = output.strip().split('\n')
+        seen = set()
 
-        for line in lines:
+        for line in output.splitlines():
             # Look for virtual router names
-            match = re.search(r'Virtual Router:\s+(\S+)', line)
+            if 'Virtual Router:' not in line:
+                continue
+            match = _RE_VIRTUAL_ROUTER.search(line)
             if match:
                 vr_name = match.group(1)
-                if vr_name not in vrs:
+                if vr_name not in seen:
+                    seen.add(vr_name)
                     vrs.append(vr_name)
 
         return vrs
@@ -197,19 +358,18 @@ class PaloAltoParser:
             Dictionary mapping interface name to IP address
         """
         interfaces = {}
-        lines = output.strip().split('\n')
 
         current_interface = None
-        for line in lines:
+        for line in output.splitlines():
             # Interface name line
-            if line.startswith('ethernet') or line.startswith('vlan'):
+            if line.startswith(_INTERFACE_PREFIXES):
                 parts = line.split()
                 if parts:
                     current_interface = parts[0]
 
             # IP address line
-            if current_interface and 'ip:' in line.lower():
-                match = re.search(r'(\d+\.\d+\.\d+\.\d+)', line)
+            if current_interface and _RE_IP_LABEL.search(line):
+                match = _RE_IPV4.search(line)
                 if match:
                     interfaces[current_interface] = match.group(1)
                     current_interface = None
@@ -247,92 +407,29 @@ class PaloAltoParser:
         Returns:
             InterfaceDetail or None if parsing fails
         """
-        if not output or not output.strip():
+        if not output:
             return None
 
-        lines = output.strip().split('\n')
-
-        name = None
-        description = ""
-        status = "unknown"
-        speed = ""
-        errors_in = 0
-        errors_out = 0
-        discards_in = 0
-        discards_out = 0
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Name
-            match = re.match(r'^Name:\s+(.+)$', stripped)
-            if match:
-                name = match.group(1).strip()
-                continue
-
-            # Description
-            match = re.match(r'^Description:\s+(.+)$', stripped)
-            if match:
-                description = match.group(1).strip()
-                continue
-
-            # Link state
-            match = re.match(r'^Link state:\s+(\S+)', stripped)
-            if match:
-                state = match.group(1).lower()
-                if state == "up":
-                    status = "up"
-                elif state == "down":
-                    status = "down"
-                else:
-                    status = state
-                continue
-
-            # Link speed
-            match = re.match(r'^Link speed:\s+(\d+)', stripped)
-            if match:
-                speed = f"{match.group(1)}Mb/s"
-                continue
+        fields = {}
 
-            # Errors received
-            match = re.match(r'^Errors received:\s+(\d+)', stripped)
-            if match:
-                errors_in = int(match.group(1))
+        # Each wanted line is "<Label>: <value>"; one dict lookup on the
+        # label replaces trying every field pattern against every line
+        for line in output.splitlines():
+            label, sep, value = line.strip().partition(':')
+            if not sep:
                 continue
-
-            # Errors transmitted
-            match = re.match(r'^Errors transmitted:\s+(\d+)', stripped)
-            if match:
-                errors_out = int(match.group(1))
-                continue
-
-            # Drops received
-            match = re.match(r'^Drops received:\s+(\d+)', stripped)
-            if match:
-                discards_in = int(match.group(1))
+            handler = _INTERFACE_FIELDS.get(label)
+            if handler is None:
                 continue
+            field_name, convert = handler
+            converted = convert(value.strip())
+            if converted is not None:
+                fields[field_name] = converted
 
-            # Drops transmitted
-            match = re.match(r'^Drops transmitted:\s+(\d+)', stripped)
-            if match:
-                discards_out = int(match.group(1))
-                continue
-
-        if name is None:
+        if 'name' not in fields:
             return None
 
-        return InterfaceDetail(
-            name=name,
-            description=description,
-            status=status,
-            speed=speed,
-            utilisation_in_pct=None,
-            utilisation_out_pct=None,
-            errors_in=errors_in,
-            errors_out=errors_out,
-            discards_in=discards_in,
-            discards_out=discards_out,
-        )
+        return InterfaceDetail(**fields)
 
     @staticmethod
     def parse_zone_from_interface(output: str) -> Optional[str]:
@@ -347,13 +444,14 @@ class PaloAltoParser:
         Returns:
             Zone name string, or None if not found
         """
-        if not output or not output.strip():
+        if not output:
             return None
 
-        for line in output.strip().split('\n'):
-            match = re.match(r'^\s*Zone:\s+(\S+)', line)
-            if match:
-                return match.group(1).strip()
+        for line in output.splitlines():
+            if 'Zone:' in line:
+                match = _RE_ZONE.match(line)
+                if match:
+                    return sys.intern(match.group(1).strip())
 
         return None
 
@@ -387,47 +485,42 @@ class PaloAltoParser:
             return None
 
         # Extract rule name from the quoted string on the first line
-        rule_match = re.search(r'"([^"]+)"', output)
+        rule_match = _RE_RULE_NAME.search(output)
         if not rule_match:
             return None
 
         rule_name = rule_match.group(1)
 
-        # Extract source zone (from <zone>;)
-        source_zone = ""
-        from_match = re.search(r'^\s*from\s+(\S+?);', output, re.MULTILINE)
-        if from_match:
-            source_zone = from_match.group(1)
-
-        # Extract dest zone (to <zone>;)
-        dest_zone = ""
-        to_match = re.search(r'^\s*to\s+(\S+?);', output, re.MULTILINE)
-        if to_match:
-            dest_zone = to_match.group(1)
-
-        # Extract source addresses (source <addr>;) - skip source-region
-        source_addresses = []
-        source_match = re.search(r'^\s*source\s+(.+?);', output, re.MULTILINE)
-        if source_match:
-            source_addresses = [s.strip() for s in source_match.group(1).split() if s.strip()]
-
-        # Extract destination addresses (destination <addr>;) - skip destination-region
-        dest_addresses = []
-        dest_match = re.search(r'^\s*destination\s+(.+?);', output, re.MULTILINE)
-        if dest_match:
-            dest_addresses = [s.strip() for s in dest_match.group(1).split() if s.strip()]
-
-        # Extract services (application/service <value>;)
+        # One pass over the "<keyword> <value>;" lines; the first occurrence
+        # of each keyword wins
+        fields = {}
+        for match in _RE_POLICY_FIELD.finditer(output):
+            key = match.group('key')
+            if key in fields:
+                continue
+            value = match.group('value')
+            if key in _POLICY_TOKEN_FIELDS and value.split() != [value]:
+                continue
+            fields[key] = value
+
+        # Zones (from <zone>; to <zone>;)
+        source_zone = sys.intern(fields['from']) if 'from' in fields else ""
+        dest_zone = sys.intern(fields['to']) if 'to' in fields else ""
+
+        # Addresses (source <addr>...; destination <addr>...;); the -region
+        # lines never match the keyword
+        source_addresses = fields.get('source', '').split()
+        dest_addresses = fields.get('destination', '').split()
+
+        # Services (application/service <value>;)
         services = []
-        svc_match = re.search(r'application/service\s+(.+?);', output)
-        if svc_match:
-            services = [svc_match.group(1).strip()]
+        if 'application/service' in fields:
+            services = [fields['application/service'].strip()]
 
         # Extract action and map
         action = "deny"
-        action_match = re.search(r'^\s*action\s+(\S+?);', output, re.MULTILINE)
-        if action_match:
-            raw_action = action_match.group(1).lower()
+        if 'action' in fields:
+            raw_action = fields['action'].lower()
             action_map = {"allow": "permit", "deny": "deny", "drop": "drop"}
             action = action_map.get(raw_action, raw_action)
 
@@ -470,53 +563,22 @@ class PaloAltoParser:
             return None
 
         # Extract rule name
-        rule_match = re.search(r'Matched NAT rule:\s*"([^"]+)"', output)
+        rule_match = _RE_NAT_RULE.search(output)
         if not rule_match:
             return None
 
         rule_name = rule_match.group(1)
 
-        def parse_translation(line_value: str) -> Optional[NatTranslation]:
-            """Parse a translation line value like '10.1.1.100 ==> 203.0.113.5'."""
-            if not line_value or line_value.strip().lower() == "none":
-                return None
-
-            parts = re.match(r'(\S+)\s*==>\s*(\S+)', line_value.strip())
-            if not parts:
-                return None
-
-            original = parts.group(1)
-            translated = parts.group(2)
-
-            # Parse ip:port format
-            original_ip, original_port = _split_ip_port(original)
-            translated_ip, translated_port = _split_ip_port(translated)
-
-            return NatTranslation(
-                original_ip=original_ip,
-                original_port=original_port,
-                translated_ip=translated_ip,
-                translated_port=translated_port,
-                nat_rule_name=rule_name,
-            )
-
-        def _split_ip_port(value: str):
-            """Split 'ip:port' into (ip, port) or (ip, None)."""
-            if ':' in value:
-                parts = value.rsplit(':', 1)
-                return parts[0], parts[1]
-            return value, None
-
         # Extract source translation
         snat = None
-        src_match = re.search(r'Source translation:\s*(.+)', output)
+        src_match = _RE_SOURCE_TRANSLATION.search(output)
         if src_match:
-            snat = parse_translation(src_match.group(1))
+            snat = _parse_translation(src_match.group(1), rule_name)
 
         # Extract destination translation
         dnat = None
-        dst_match = re.search(r'Destination translation:\s*(.+)', output)
+        dst_match = _RE_DEST_TRANSLATION.search(output)
         if dst_match:
-            dnat = parse_translation(dst_match.group(1))
+            dnat = _parse_translation(dst_match.group(1), rule_name)
 
         return NatResult(snat=snat, dnat=dnat)
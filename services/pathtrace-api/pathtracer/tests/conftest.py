@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from pathtracer.models import CredentialSet
+
+
+@pytest.fixture(scope="module")
+def admin_creds():
+    """Credentials used by driver tests that never connect."""
+    return CredentialSet(username="admin", password="pass")
@@ -0,0 +1,204 @@
+"""Tests for Arista EOS driver VRF mapping and device info."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pathtracer.drivers.arista_eos import AristaEOSDriver
+from pathtracer.models import NetworkDevice
+
+
+IP_INTERFACE_BRIEF = """Interface         IP Address       Status    Protocol
+Ethernet1         10.1.1.1/30      up        up
+Ethernet2         10.2.2.1/30      up        up
+Vlan100           192.0.2.1/24     up        up
+"""
+
+RUNNING_CONFIG_INTERFACES = """interface Ethernet1
+   ip address 10.1.1.1/30
+!
+interface Ethernet2
+   vrf CORP
+   ip address 10.2.2.1/30
+!
+interface Vlan100
+   vrf MGMT
+"""
+
+
+@pytest.fixture
+def driver(admin_creds):
+    device = NetworkDevice(hostname="leaf-01", management_ip="10.0.0.1", vendor="arista_eos")
+    drv = AristaEOSDriver(device, admin_creds)
+    drv.connection = MagicMock()
+    drv._connected = True
+    return drv
+
+
+SHOW_VRF = """   VRF        RD          Protocols   State
+---------- ----------- ----------- ----------
+   CORP       65000:1     ipv4        v4:routing
+   MGMT       65000:2     ipv4        v4:routing
+   default    <not set>   ipv4        v4:routing
+"""
+
+SHOW_VRF_DEFAULT_ONLY = """   VRF        RD          Protocols   State
+---------- ----------- ----------- ----------
+   default    <not set>   ipv4        v4:routing
+"""
+
+
+class TestAristaInterfaceToContextMapping:
+    def test_single_config_command(self, driver):
+        driver.connection.send_command.side_effect = [
+            IP_INTERFACE_BRIEF, SHOW_VRF, RUNNING_CONFIG_INTERFACES
+        ]
+
+        mapping = driver.get_interface_to_context_mapping()
+
+        assert mapping == {"Ethernet1": "default", "Ethernet2": "CORP", "Vlan100": "MGMT"}
+        assert [c.args[0] for c in driver.connection.send_command.call_args_list] == [
+            "show ip interface brief",
+            "show vrf",
+            "show running-config | section interface",
+        ]
+
+    def test_cached_vrf_list_reused(self, driver):
+        driver.connection.send_command.side_effect = [
+            SHOW_VRF, IP_INTERFACE_BRIEF, RUNNING_CONFIG_INTERFACES
+        ]
+        driver.list_logical_contexts()
+
+        assert driver.get_interface_to_context_mapping()["Ethernet2"] == "CORP"
+        assert driver.connection.send_command.call_count == 3
+
+    def test_default_vrf_only_skips_config(self, driver):
+        driver.connection.send_command.side_effect = [IP_INTERFACE_BRIEF, SHOW_VRF_DEFAULT_ONLY]
+
+        mapping = driver.get_interface_to_context_mapping()
+
+        assert mapping == {"Ethernet1": "default", "Ethernet2": "default", "Vlan100": "default"}
+        assert driver.connection.send_command.call_count == 2
+
+    def test_failed_vrf_list_still_reads_config(self, driver):
+        driver.connection.send_command.side_effect = [
+            IP_INTERFACE_BRIEF, RuntimeError("timeout"), RUNNING_CONFIG_INTERFACES
+        ]
+
+        assert driver.get_interface_to_context_mapping()["Vlan100"] == "MGMT"
+
+    def test_config_command_failure_defaults_all(self, driver):
+        driver.connection.send_command.side_effect = [
+            IP_INTERFACE_BRIEF, SHOW_VRF, RuntimeError("timeout")
+        ]
+
+        mapping = driver.get_interface_to_context_mapping()
+
+        assert mapping == {"Ethernet1": "default", "Ethernet2": "default", "Vlan100": "default"}
+
+
+class TestAristaSessionCache:
+    def test_vrf_list_cached_until_disconnect(self, driver):
+        connection = driver.connection
+        connection.send_command.return_value = "VRF   RD   Protocols\n----  ---  ---------\nCORP  1:1  ipv4\n"
+
+        assert driver.list_logical_contexts() == ["default", "CORP"]
+        driver.list_logical_contexts().append("mutated")
+        assert driver.list_logical_contexts() == ["default", "CORP"]
+        assert connection.send_command.call_count == 1
+
+        driver.disconnect()
+        driver.connection = connection
+        driver._connected = True
+        driver.list_logical_contexts()
+        assert connection.send_command.call_count == 2
+
+    def test_failed_vrf_list_not_cached(self, driver):
+        driver.connection.send_command.side_effect = [RuntimeError("timeout"), "CORP  1:1  ipv4\n"]
+
+        assert driver.list_logical_contexts() == ["default"]
+        assert driver.list_logical_contexts() == ["default", "CORP"]
+
+
+SHOW_VERSION = """Arista DCS-7050TX-64-R
+Hardware version:    01.11
+Serial number:       JPE12345678
+
+Software image version: 4.20.1F
+"""
+
+
+class TestAristaDetectDeviceInfo:
+    def test_show_version_then_hostname(self, driver):
+        driver.connection.send_command.side_effect = [
+            SHOW_VERSION, "Hostname: leaf-01a\nFQDN:     leaf-01a.example.com\n"
+        ]
+
+        assert driver.detect_device_info() == {
+            'hostname': 'leaf-01a',
+            'version': '4.20.1F',
+            'model': 'DCS-7050TX-64-R',
+            'serial': 'JPE12345678',
+        }
+        assert [c.args[0] for c in driver.connection.send_command.call_args_list] == [
+            "show version", "show hostname",
+        ]
+
+    def test_hostname_in_version_output_skips_show_hostname(self, driver):
+        driver.connection.send_command.return_value = SHOW_VERSION + "Hostname: spine-02\n"
+
+        assert driver.detect_device_info()['hostname'] == 'spine-02'
+        assert driver.connection.send_command.call_count == 1
+
+    def test_hostname_falls_back_to_inventory(self, driver):
+        driver.connection.send_command.side_effect = [SHOW_VERSION, ""]
+
+        assert driver.detect_device_info()['hostname'] == 'leaf-01'
+
+    def test_command_failure(self, driver):
+        driver.connection.send_command.side_effect = RuntimeError("timeout")
+
+        assert driver.detect_device_info() == {
+            'hostname': 'leaf-01', 'version': '', 'model': '', 'serial': ''
+        }
+
+
+class TestAristaGetRoute:
+    def test_route_command_per_vrf(self, driver):
+        driver.connection.send_command.return_value = "% No matching routes found"
+
+        driver.get_route("10.9.9.9")
+        driver.get_route("10.9.9.9", "default")
+        driver.get_route("10.9.9.9", "CORP")
+        driver.get_route("10.8.8.8", "CORP")
+
+        assert [c.args[0] for c in driver.connection.send_command.call_args_list] == [
+            "show ip route 10.9.9.9",
+            "show ip route 10.9.9.9",
+            "show ip route vrf CORP 10.9.9.9",
+            "show ip route vrf CORP 10.8.8.8",
+        ]
+
+
+class TestAristaConnectParams:
+    def _connect(self, admin_creds, config=None):
+        device = NetworkDevice(hostname="leaf-03", management_ip="10.0.0.3", vendor="arista_eos")
+        drv = AristaEOSDriver(device, admin_creds, config)
+        with patch("pathtracer.drivers.arista_eos.ConnectHandler") as handler:
+            drv.connect()
+        drv.disconnect()
+        return handler.call_args.kwargs
+
+    def test_fast_pacing_by_default(self, admin_creds):
+        params = self._connect(admin_creds)
+
+        assert params["fast_cli"] is True
+        assert params["global_delay_factor"] == 0.1
+        assert "session_log" not in params
+
+    def test_pacing_and_session_log_from_config(self, admin_creds):
+        params = self._connect(admin_creds, {
+            "fast_cli": False, "global_delay_factor": 2, "session_log": "/tmp/leaf-03.log"
+        })
+
+        assert (params["fast_cli"], params["global_delay_factor"]) == (False, 2)
+        assert params["session_log"] == "/tmp/leaf-03.log"
@@ -0,0 +1,153 @@
+"""Tests for Arista EOS routing, interface VRF and version parsing."""
+
+from pathtracer.parsers.arista_parser import AristaParser
+
+
+RUNNING_CONFIG_INTERFACES = """interface Ethernet1
+   description Uplink to core
+   no switchport
+   ip address 10.1.1.1/30
+!
+interface Ethernet2
+   no switchport
+   vrf CORP
+   ip address 10.2.2.1/30
+!
+interface Ethernet3
+   vrf forwarding GUEST
+!
+interface Vlan100
+   vrf member MGMT
+   ip address 192.0.2.1/24
+!
+router ospf 1
+   passive-interface Ethernet4
+   vrf SHOULD_NOT_APPLY
+"""
+
+
+class TestAristaInterfaceVrfTable:
+    def test_parse_interface_vrf_table(self):
+        assert AristaParser.parse_interface_vrf_table(RUNNING_CONFIG_INTERFACES) == {
+            "Ethernet2": "CORP",
+            "Ethernet3": "GUEST",
+            "Vlan100": "MGMT",
+        }
+
+    def test_crlf_output(self):
+        output = RUNNING_CONFIG_INTERFACES.replace("\n", "\r\n")
+        assert AristaParser.parse_interface_vrf_table(output)["Ethernet2"] == "CORP"
+
+    def test_vrf_outside_interface_block_ignored(self):
+        output = "   vrf ORPHAN\nhostname leaf1\n   vrf ALSO_ORPHAN\n"
+        assert AristaParser.parse_interface_vrf_table(output) == {}
+
+    def test_empty_output(self):
+        assert AristaParser.parse_interface_vrf_table("") == {}
+
+
+ROUTING_TABLE = """Codes: C - connected, S - static, K - kernel, O - OSPF, B - BGP
+Gateway of last resort is not set
+
+ S*       0.0.0.0/0 [1/0] via 10.1.1.254, Ethernet1
+ C        10.1.1.0/24 is directly connected, Ethernet1
+ O        10.2.0.0/16 [110/20] via 10.1.1.3, Ethernet2
+ B E      10.3.0.0/16 [200/0] via 10.1.1.4, Ethernet2
+"""
+
+
+class TestAristaRouting:
+    def test_parse_routing_table(self):
+        routes = AristaParser.parse_routing_table(ROUTING_TABLE, "CORP")
+
+        assert [(r.destination, r.protocol) for r in routes] == [
+            ("0.0.0.0/0", "static"),
+            ("10.1.1.0/24", "connected"),
+            ("10.2.0.0/16", "ospf"),
+            ("10.3.0.0/16", "unknown"),
+        ]
+        assert routes[1].next_hop == "Ethernet1"
+        assert (routes[2].preference, routes[2].metric) == (110, 20)
+        assert routes[2].next_hop == "10.1.1.3,"
+        assert all(r.logical_context == "CORP" for r in routes)
+
+    def test_parse_route_entry(self):
+        route = AristaParser.parse_route_entry(ROUTING_TABLE, "10.9.9.9", "CORP")
+
+        assert route.destination == "0.0.0.0/0"
+        assert route.protocol == "static"
+        assert route.next_hop_type == "ip"
+
+    def test_parse_route_entry_connected(self):
+        output = " C        10.1.1.0/24 is directly connected, Ethernet1"
+        route = AristaParser.parse_route_entry(output, "10.1.1.5")
+
+        assert route.protocol == "connected"
+        assert route.outgoing_interface == "Ethernet1"
+        assert route.next_hop_type == "connected"
+
+    def test_parse_route_entry_no_match(self):
+        assert AristaParser.parse_route_entry("% No matching routes found", "10.9.9.9") is None
+
+    def test_long_blank_run_in_route_line(self):
+        # Used to backtrack over every split of the blank run (seconds at this size)
+        output = "S" + " " * 20000 + "10.4.0.0/16\n C 10.1.1.0/24 is directly connected, Ethernet1"
+
+        routes = AristaParser.parse_routing_table(output)
+
+        assert [r.destination for r in routes] == ["10.1.1.0/24"]
+
+    def test_route_code_must_precede_prefix(self):
+        output = (
+            " S E B  10.5.0.0/16 [1/0] via 10.1.1.5, Ethernet1\n"
+            " Sx     10.6.0.0/16 [1/0] via 10.1.1.6, Ethernet1\n"
+            " 10.7.0.0/16 [1/0] via 10.1.1.7, Ethernet1\n"
+            " S      10.8.0.0/16\n"
+        )
+
+        routes = AristaParser.parse_routing_table(output)
+
+        assert [(r.destination, r.protocol) for r in routes] == [("10.5.0.0/16", "unknown")]
+        assert AristaParser.parse_route_entry(output, "10.5.1.1").destination == "10.5.0.0/16"
+
+
+SHOW_VERSION = """Arista DCS-7280SR-48C6-M-R
+Hardware version:    11.00
+Serial number:       JPE17000000
+Hardware MAC address: 444c.a800.0000
+System MAC address:   444c.a800.0000
+
+Software image version: 4.22.1F
+Architecture:           i686
+Internal build version: 4.22.1F-13062802.4221F
+"""
+
+
+class TestAristaShowVersion:
+    def test_parse_show_version(self):
+        assert AristaParser.parse_show_version(SHOW_VERSION) == {
+            'hostname': '',
+            'version': '4.22.1F',
+            'model': 'DCS-7280SR-48C6-M-R',
+            'serial': 'JPE17000000',
+        }
+
+    def test_model_label_overrides_banner(self):
+        output = SHOW_VERSION + "Model: vEOS-lab\n"
+        assert AristaParser.parse_show_version(output)['model'] == 'vEOS-lab'
+
+    def test_parse_show_hostname(self):
+        output = "Hostname: leaf1\nFQDN:     leaf1.example.com\n"
+        assert AristaParser.parse_show_version(output)['hostname'] == 'leaf1'
+
+    def test_empty_value_does_not_take_next_line(self):
+        output = "Serial number:\nSoftware image version: 4.22.1F\n"
+        info = AristaParser.parse_show_version(output)
+
+        assert info['serial'] == ''
+        assert info['version'] == '4.22.1F'
+
+    def test_empty_output(self):
+        assert AristaParser.parse_show_version("") == {
+            'hostname': '', 'version': '', 'model': '', 'serial': ''
+        }
@@ -0,0 +1,65 @@
+"""Tests for Aruba driver VRF mapping and hostname detection."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pathtracer.drivers.aruba import ArubaDriver
+from pathtracer.models import NetworkDevice
+
+
+IP_INTERFACE_BRIEF = """Interface        IP Address        Status
+-----------      ---------------   ------
+vlan10           10.1.10.1/24      up
+vlan20           10.1.20.1/24      up
+vlan30           10.1.30.1/24      up
+vlan40           10.1.40.1/24      up
+"""
+
+
+@pytest.fixture
+def driver(admin_creds):
+    device = NetworkDevice(hostname="sw-01", management_ip="10.0.0.5", vendor="aruba")
+    drv = ArubaDriver(device, admin_creds)
+    drv.connection = MagicMock()
+    drv._connected = True
+    return drv
+
+
+class TestArubaInterfaceToContextMapping:
+    def test_vrf_attach_token(self, driver):
+        driver.connection.send_command.side_effect = [
+            IP_INTERFACE_BRIEF,
+            "    vrf attach CORP\n",
+            "",
+            "    VRF ATTACH Guest\n",
+            "    vrf attachment-notes\n",
+        ]
+
+        assert driver.get_interface_to_context_mapping() == {
+            "vlan10": "CORP", "vlan20": "default", "vlan30": "Guest",
+        }
+
+    def test_per_interface_failure_defaults(self, driver):
+        driver.connection.send_command.side_effect = [
+            IP_INTERFACE_BRIEF, RuntimeError("timeout"), "vrf attach CORP", "", "",
+        ]
+
+        mapping = driver.get_interface_to_context_mapping()
+
+        assert mapping["vlan10"] == "default"
+        assert mapping["vlan20"] == "CORP"
+
+    def test_interrupt_not_swallowed(self, driver):
+        driver.connection.send_command.side_effect = [IP_INTERFACE_BRIEF, KeyboardInterrupt()]
+
+        with pytest.raises(KeyboardInterrupt):
+            driver.get_interface_to_context_mapping()
+
+
+class TestArubaDetectHostname:
+    def test_hostname_containing_keyword(self, driver):
+        driver.connection.send_command.side_effect = [
+            "hostname core-hostname-01\n", "", "", "",
+        ]
+
+        assert driver.detect_device_info()["hostname"] == "core-hostname-01"
@@ -46,6 +46,36 @@ class TestArubaInterfaceDetail:
         assert detail is not None
         assert detail.status == "admin_down"
 
+    def test_counters_only_read_inside_sections(self):
+        output = """Interface 1/1/3 is up
+ Admin state is up
+ 7 drops
+ RX
+     12   input errors
+     3 drops
+     input flow-control frames 4
+ TX
+     9 output errors
+     6   drops"""
+        detail = ArubaParser.parse_interface_detail(output)
+
+        assert detail is not None
+        assert detail.errors_in == 12
+        assert detail.discards_in == 3
+        assert detail.errors_out == 9
+        assert detail.discards_out == 6
+
     def test_parse_empty(self):
         detail = ArubaParser.parse_interface_detail("")
         assert detail is None
+
+    def test_parse_unrecognised_first_line(self):
+        assert ArubaParser.parse_interface_detail("Port 1/1/1 is up") is None
+        assert ArubaParser.parse_interface_detail("Interface 1/1/1 up") is None
+        assert ArubaParser.parse_interface_detail("Interface 1/1/1 is") is None
+
+    def test_parse_link_status_is_lowercased(self):
+        detail = ArubaParser.parse_interface_detail("Interface 1/1/4 is UP")
+        assert detail is not None
+        assert detail.name == "1/1/4"
+        assert detail.status == "up"
@@ -0,0 +1,113 @@
+"""Tests for Aruba route parsing."""
+
+import pytest
+from pathtracer.parsers.aruba_parser import ArubaParser
+from pathtracer.models import NextHopType
+
+
+ROUTING_TABLE = """
+Codes: C - connected, S - static, R - RIP, O - OSPF, B - BGP
+
+Gateway of last resort is 10.0.0.1 to network 0.0.0.0
+
+S*   0.0.0.0/0 [1/0] via 10.0.0.1, vlan100
+C    10.1.1.0/24 is directly connected, vlan10
+O    10.2.0.0/16 [110/20] via 10.1.1.3, vlan30
+"""
+
+
+class TestArubaRoutingTable:
+    def test_parse_routing_table(self):
+        routes = ArubaParser.parse_routing_table(ROUTING_TABLE, "default")
+
+        assert [r.destination for r in routes] == ["0.0.0.0/0", "10.1.1.0/24", "10.2.0.0/16"]
+
+        default_route = routes[0]
+        assert default_route.protocol == "static"
+        assert default_route.preference == 1
+
+        connected = routes[1]
+        assert connected.protocol == "connected"
+        assert connected.next_hop_type == NextHopType.CONNECTED.value
+        assert connected.outgoing_interface == "vlan10"
+
+        ospf = routes[2]
+        assert ospf.protocol == "ospf"
+        assert ospf.next_hop_type == NextHopType.IP.value
+        assert ospf.metric == 20
+        assert ospf.preference == 110
+        assert ospf.logical_context == "default"
+
+    def test_parse_routing_table_from_bytes(self):
+        routes = ArubaParser.parse_routing_table(ROUTING_TABLE.encode(), "default")
+
+        assert routes == ArubaParser.parse_routing_table(ROUTING_TABLE, "default")
+
+    def test_parse_routing_table_empty(self):
+        assert ArubaParser.parse_routing_table("") == []
+
+    def test_iter_routing_table_matches_list(self):
+        routes = ArubaParser.iter_routing_table(ROUTING_TABLE, "default")
+
+        assert iter(routes) is routes
+        assert list(routes) == ArubaParser.parse_routing_table(ROUTING_TABLE, "default")
+
+class TestArubaRouteEntry:
+    def test_parse_static_route(self):
+        output = "S    192.168.1.0/24 [1/0] via 10.1.1.2, vlan20"
+        route = ArubaParser.parse_route_entry(output, "192.168.1.1", "corp")
+
+        assert route is not None
+        assert route.destination == "192.168.1.0/24"
+        assert route.protocol == "static"
+        assert route.logical_context == "corp"
+
+    def test_parse_route_entry_from_bytes(self):
+        output = b"S    192.168.1.0/24 [1/0] via 10.1.1.2, vlan20\xff"
+        route = ArubaParser.parse_route_entry(output, "192.168.1.1")
+
+        assert route is not None
+        assert route.destination == "192.168.1.0/24"
+        assert isinstance(route.raw_output, str)
+
+    def test_parse_no_such_route_bytes(self):
+        assert ArubaParser.parse_route_entry(b"No such route", "1.1.1.1") is None
+
+    def test_parse_no_such_route(self):
+        assert ArubaParser.parse_route_entry("No such route", "1.1.1.1") is None
+
+
+    def test_parse_route_entry_skips_legend(self):
+        route = ArubaParser.parse_route_entry(ROUTING_TABLE, "10.1.1.5")
+
+        assert route is not None
+        assert route == ArubaParser.parse_routing_table(ROUTING_TABLE)[0]
+
+    def test_parse_connected_route(self):
+        output = "C    10.0.0.0/8 is directly connected, vlan100"
+        route = ArubaParser.parse_route_entry(output, "10.1.1.1")
+
+        assert route is not None
+        assert route.next_hop_type == NextHopType.CONNECTED.value
+        assert route.next_hop == "vlan100"
+        assert route.outgoing_interface == "vlan100"
+
+
+class TestArubaVrfList:
+    def test_parse_vrf_list(self):
+        output = """
+VRF Name                    VRF ID    State
+--------------------------  --------  -----
+default                     1         Up
+mgmt                        2         Up
+VRF_A                       3         Up
+"""
+        assert ArubaParser.parse_vrf_list(output) == ["default", "mgmt", "VRF_A"]
+
+    def test_default_added_once(self):
+        output = "mgmt    2    Up\ndefault    1    Up\n"
+        assert ArubaParser.parse_vrf_list(output) == ["mgmt", "default"]
+
+    def test_default_inserted_when_missing(self):
+        assert ArubaParser.parse_vrf_list("mgmt    2    Up") == ["default", "mgmt"]
+        assert ArubaParser.parse_vrf_list("") == ["default"]
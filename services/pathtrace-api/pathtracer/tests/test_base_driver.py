@@ -2,7 +2,7 @@
 
 import pytest
 from pathtracer.drivers.base import NetworkDriver
-from pathtracer.models import NetworkDevice, CredentialSet
+from pathtracer.models import NetworkDevice
 
 
 class ConcreteDriver(NetworkDriver):
@@ -17,10 +17,9 @@ class ConcreteDriver(NetworkDriver):
 
 
 @pytest.fixture
-def driver():
+def driver(admin_creds):
     device = NetworkDevice(hostname="test", management_ip="10.0.0.1", vendor="cisco_ios")
-    creds = CredentialSet(username="admin", password="pass")
-    return ConcreteDriver(device, creds)
+    return ConcreteDriver(device, admin_creds)
 
 
 class TestBaseDriverDefaults:
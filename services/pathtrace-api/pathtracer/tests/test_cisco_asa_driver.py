@@ -1,24 +1,24 @@
 """Tests for Cisco ASA driver instantiation and method signatures."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 from pathtracer.drivers.cisco_asa import CiscoASADriver
-from pathtracer.models import NetworkDevice, CredentialSet
+from pathtracer.models import NetworkDevice
 
 
-class TestCiscoASADriver:
-    def test_instantiation(self):
-        device = NetworkDevice(hostname="asa-01", management_ip="10.0.0.1", vendor="cisco_asa")
-        creds = CredentialSet(username="admin", password="pass")
-        driver = CiscoASADriver(device, creds)
+@pytest.fixture(scope="module")
+def driver(admin_creds):
+    device = NetworkDevice(hostname="asa-01", management_ip="10.0.0.1", vendor="cisco_asa")
+    return CiscoASADriver(device, admin_creds)
+
 
+class TestCiscoASADriver:
+    def test_instantiation(self, driver):
         assert driver.device_type == "cisco_asa"
         assert driver.parser is not None
 
-    def test_has_firewall_methods(self):
-        device = NetworkDevice(hostname="asa-01", management_ip="10.0.0.1", vendor="cisco_asa")
-        creds = CredentialSet(username="admin", password="pass")
-        driver = CiscoASADriver(device, creds)
-
+    def test_has_firewall_methods(self, driver):
         assert hasattr(driver, 'get_interface_detail')
         assert hasattr(driver, 'get_zone_for_interface')
         assert hasattr(driver, 'lookup_security_policy')
@@ -27,3 +27,142 @@ class TestCiscoASADriver:
     def test_exported_from_package(self):
         from pathtracer.drivers import CiscoASADriver as Exported
         assert Exported is CiscoASADriver
+
+
+SHOW_NAMEIF = """Interface                  Name                     Security
+GigabitEthernet0/0         outside                       0
+GigabitEthernet0/1         inside                      100
+"""
+
+
+@pytest.fixture
+def connected_driver(admin_creds):
+    device = NetworkDevice(hostname="asa-01", management_ip="10.0.0.1", vendor="cisco_asa")
+    drv = CiscoASADriver(device, admin_creds)
+    drv.connection = MagicMock()
+    drv._connected = True
+    return drv
+
+
+class TestCiscoASASessionCache:
+    def test_nameif_fetched_once_per_connection(self, connected_driver):
+        connected_driver.connection.send_command.return_value = SHOW_NAMEIF
+
+        assert connected_driver.get_zone_for_interface("GigabitEthernet0/0") == "outside"
+        assert connected_driver.get_zone_for_interface("GigabitEthernet0/1") == "inside"
+        assert connected_driver.get_interface_to_context_mapping() == {
+            "GigabitEthernet0/0": "outside", "GigabitEthernet0/1": "inside"
+        }
+        connected_driver.connection.send_command.assert_called_once_with("show nameif")
+
+    def test_returned_mapping_is_a_copy(self, connected_driver):
+        connected_driver.connection.send_command.return_value = SHOW_NAMEIF
+
+        connected_driver.get_interface_to_context_mapping().clear()
+
+        assert connected_driver.get_zone_for_interface("GigabitEthernet0/0") == "outside"
+
+    def test_failed_nameif_not_cached(self, connected_driver):
+        connected_driver.connection.send_command.side_effect = [RuntimeError("timeout"), SHOW_NAMEIF]
+
+        assert connected_driver.get_zone_for_interface("GigabitEthernet0/0") is None
+        assert connected_driver.get_zone_for_interface("GigabitEthernet0/0") == "outside"
+
+    def test_contexts_cached_until_disconnect(self, connected_driver):
+        connection = connected_driver.connection
+        connection.send_command.return_value = "Context Name   Class\n admin   default\n"
+
+        first = connected_driver.list_logical_contexts()
+        first.append("mutated")
+        assert connected_driver.list_logical_contexts() == ["system", "admin"]
+        assert connection.send_command.call_count == 1
+
+        connected_driver.disconnect()
+        connected_driver.connection = connection
+        connected_driver._connected = True
+        connected_driver.list_logical_contexts()
+        assert connection.send_command.call_count == 2
+
+
+SHOW_ROUTE_OUTSIDE = """Routing entry for 0.0.0.0 0.0.0.0
+  Known via "static", distance 1, metric 0, candidate default path
+  Routing Descriptor Blocks:
+  * 203.0.113.1, via outside
+"""
+
+
+class TestCiscoASAInputInterfaceCache:
+    def test_route_lookup_once_per_source(self, connected_driver):
+        connection = connected_driver.connection
+        connection.send_command.return_value = SHOW_ROUTE_OUTSIDE
+
+        assert connected_driver._resolve_input_interface("198.51.100.7") == "outside"
+        assert connected_driver._resolve_input_interface("198.51.100.7") == "outside"
+        connection.send_command.assert_called_once_with("show route 198.51.100.7")
+
+        connected_driver._resolve_input_interface("198.51.100.8")
+        assert connection.send_command.call_count == 2
+
+    def test_unresolvable_answer_cached(self, connected_driver):
+        connected_driver.connection.send_command.side_effect = ["% Network not in table", ""]
+
+        assert connected_driver._resolve_input_interface("192.0.2.1") is None
+        assert connected_driver._resolve_input_interface("192.0.2.1") is None
+        assert connected_driver.connection.send_command.call_count == 2
+
+    def test_failed_lookup_not_cached(self, connected_driver):
+        connected_driver.connection.send_command.side_effect = [
+            RuntimeError("timeout"), SHOW_NAMEIF, SHOW_ROUTE_OUTSIDE,
+        ]
+
+        assert connected_driver._resolve_input_interface("198.51.100.7") == "outside"
+        assert connected_driver._resolve_input_interface("198.51.100.7") == "outside"
+        assert connected_driver.connection.send_command.call_count == 3
+        assert connected_driver._resolve_input_interface("198.51.100.7") == "outside"
+        assert connected_driver.connection.send_command.call_count == 3
+
+    def test_cleared_on_disconnect(self, connected_driver):
+        connection = connected_driver.connection
+        connection.send_command.return_value = SHOW_ROUTE_OUTSIDE
+        connected_driver._resolve_input_interface("198.51.100.7")
+
+        connected_driver.disconnect()
+        connected_driver.connection = connection
+        connected_driver._connected = True
+        connected_driver._resolve_input_interface("198.51.100.7")
+
+        assert connection.send_command.call_count == 2
+
+
+class TestCiscoASADetectDeviceInfo:
+    def test_uses_show_version(self, connected_driver):
+        connected_driver.connection.send_command.return_value = (
+            "Cisco Adaptive Security Appliance Software Version 9.16(3)\n"
+            "fw-edge up 3 days 2 hours\n"
+            "Hardware:   ASA5516, 8192 MB RAM\n"
+        )
+
+        assert connected_driver.detect_device_info() == {
+            "hostname": "fw-edge", "version": "9.16(3)", "model": "ASA5516", "serial": ""
+        }
+
+    def test_hostname_falls_back_to_inventory(self, connected_driver):
+        connected_driver.connection.send_command.return_value = "Serial Number: ABC\n"
+
+        assert connected_driver.detect_device_info()["hostname"] == "asa-01"
+
+
+class TestCiscoASAConnectParams:
+    def test_fast_pacing_by_default_and_overridable(self, admin_creds):
+        device = NetworkDevice(hostname="asa-02", management_ip="10.0.0.2", vendor="cisco_asa")
+        calls = []
+        for config in (None, {"fast_cli": False, "global_delay_factor": 1}):
+            drv = CiscoASADriver(device, admin_creds, config)
+            with patch("pathtracer.drivers.cisco_asa.ConnectHandler") as handler:
+                drv.connect()
+            drv.disconnect()
+            calls.append(handler.call_args.kwargs)
+
+        assert (calls[0]["fast_cli"], calls[0]["global_delay_factor"]) == (True, 0.1)
+        assert (calls[1]["fast_cli"], calls[1]["global_delay_factor"]) == (False, 1)
+        assert "session_log" not in calls[0]
@@ -33,6 +33,50 @@ class TestCiscoASARouteEntry:
         assert route is None
 
 
+class TestCiscoASARoutingTable:
+    def test_parse_routing_table(self):
+        output = """Codes: L - local, C - connected, S - static, R - RIP, O - OSPF
+Gateway of last resort is 10.0.0.1 to network 0.0.0.0
+
+S*   0.0.0.0 0.0.0.0 [1/0] via 10.0.0.1, outside
+C    10.1.1.0 255.255.255.0 is directly connected, inside
+L    10.1.1.1 255.255.255.255 is directly connected, inside
+O    10.2.0.0 255.255.0.0 [110/20] via 10.1.1.3, inside
+X    10.3.0.0 255.255.0.0 [5/0] via 10.1.1.4
+"""
+        routes = CiscoASAParser.parse_routing_table(output, "ctx1")
+
+        assert [(r.destination, r.protocol, r.next_hop_type) for r in routes] == [
+            ("0.0.0.0/0", "static", "ip"),
+            ("10.1.1.0/24", "connected", "connected"),
+            ("10.1.1.1/32", "local", "local"),
+            ("10.2.0.0/16", "ospf", "ip"),
+            ("10.3.0.0/16", "unknown", "ip"),
+        ]
+        assert (routes[3].preference, routes[3].metric) == (110, 20)
+        assert routes[4].outgoing_interface is None
+        assert all(r.logical_context == "ctx1" for r in routes)
+
+    def test_parse_empty_routing_table(self):
+        assert CiscoASAParser.parse_routing_table("") == []
+
+    def test_malformed_rows_skipped(self):
+        output = """S    10.4.0.0 255.255.0.0 [1/0] via 10.0.0.1,, outside
+S    10.5.0.0 255.255.0.0 [1/0] via ,  outside
+S    10.6.0.0 255.255.0.0 [x/0] via 10.0.0.1
+S    10.7.0.0 255.255.0 [1/0] via 10.0.0.1
+C    10.8.0.0 255.255.0.0 is directly connected,inside
+O    10.9.0.0 255.255.0.0 [110/20] via 10.0.0.9, outside extra
+S    10.10.0.0 255.255.0.0 [1/0]   via   10.0.0.10,   outside
+"""
+        routes = CiscoASAParser.parse_routing_table(output)
+
+        assert [(r.destination, r.next_hop, r.outgoing_interface) for r in routes] == [
+            ("10.4.0.0/16", "10.0.0.1,", "outside"),
+            ("10.10.0.0/16", "10.0.0.10", "outside"),
+        ]
+
+
 class TestCiscoASAInterfaceDetail:
     def test_parse_interface(self):
         output = """Interface GigabitEthernet0/0 "outside", is up, line protocol is up
@@ -70,6 +114,101 @@ GigabitEthernet0/2         dmz                          50"""
         assert mapping["GigabitEthernet0/2"] == "dmz"
 
 
+SHOW_VERSION = """
+Cisco Adaptive Security Appliance Software Version 9.8(4)32 <system>
+SSP Operating System Version 2.10(1.162)
+Device Manager Version 7.16(1)
+
+Compiled on Thu 14-Oct-21 09:22 GMT by builders
+
+asa-01 up 10 days 5 hours
+failover cluster up 10 days 5 hours
+
+Hardware:   ASA5525, 8192 MB RAM, CPU Lynnfield 2394 MHz, 1 CPU (4 cores)
+Encryption hardware device : Cisco ASA Crypto on-board accelerator (revision 0x1)
+ 1: Ext: GigabitEthernet0/0  : address is 0000.0001.0003, irq 10
+
+Serial Number: FCH12345678
+Configuration register is 0x1
+"""
+
+
+class TestCiscoASAContextList:
+    def test_parse_context_list(self):
+        output = """Context Name      Class      Interfaces           Mode         URL
+ admin            default    GigabitEthernet0/1   Routed       disk0:/admin.cfg
+ ctx1             default    GigabitEthernet0/2   Routed       disk0:/ctx1.cfg
+---------------------------------------------------------------------------------
+ ctx1             default    GigabitEthernet0/3   Routed       disk0:/ctx1.cfg
+"""
+        assert CiscoASAParser.parse_context_list(output) == ["system", "admin", "ctx1"]
+
+    def test_blank_line_does_not_reach_header(self):
+        output = "\n   \nContext Name  Class\r\n ctx2  default\r\n"
+        assert CiscoASAParser.parse_context_list(output) == ["system", "ctx2"]
+
+    def test_single_context_mode(self):
+        output = "ERROR: Command not supported in single context mode\n"
+        assert CiscoASAParser.parse_context_list(output) == ["system"]
+        assert CiscoASAParser.parse_context_list("Context Name\nNot Available") == ["system"]
+
+    def test_empty_output(self):
+        assert CiscoASAParser.parse_context_list("") == ["system"]
+        assert CiscoASAParser.parse_context_list("Context Name  Class\n") == ["system"]
+
+
+class TestCiscoASAShowVersion:
+    def test_parse_show_version(self):
+        assert CiscoASAParser.parse_show_version(SHOW_VERSION) == {
+            "hostname": "asa-01",
+            "version": "9.8(4)32",
+            "model": "ASA5525",
+            "serial": "FCH12345678",
+        }
+
+    def test_crlf_output(self):
+        info = CiscoASAParser.parse_show_version(SHOW_VERSION.replace("\n", "\r\n"))
+
+        assert info["serial"] == "FCH12345678"
+        assert info["hostname"] == "asa-01"
+
+    def test_labels_mid_line_ignored(self):
+        output = "Licensed Hardware: none\nBackup Serial Number: XYZ\nlink is up now\n"
+
+        assert CiscoASAParser.parse_show_version(output) == {
+            "hostname": "", "version": "", "model": "", "serial": ""
+        }
+
+    def test_hostname_needs_uptime_unit(self):
+        output = "Gi0/0 up 2 interfaces\nasa-02 up 1 year 20 days\n"
+
+        assert CiscoASAParser.parse_show_version(output)["hostname"] == "asa-02"
+        assert CiscoASAParser.parse_show_version("fw up 5 mins 10 secs")["hostname"] == "fw"
+
+    def test_stops_once_all_fields_found(self):
+        output = SHOW_VERSION + "Hardware:   ASA5545, 16384 MB RAM\nSerial Number: LATER\n"
+
+        assert CiscoASAParser.parse_show_version(output) == {
+            "hostname": "asa-01",
+            "version": "9.8(4)32",
+            "model": "ASA5525",
+            "serial": "FCH12345678",
+        }
+
+    def test_repeated_label_overwrites_until_complete(self):
+        output = "Hardware:   ASA5506\nHardware:   ASA5508, 8192 MB RAM\n"
+
+        assert CiscoASAParser.parse_show_version(output)["model"] == "ASA5508"
+
+    def test_first_uptime_line_wins(self):
+        output = SHOW_VERSION + "standby-unit up 4 days 1 hour\n"
+
+        assert CiscoASAParser.parse_show_version(output)["hostname"] == "asa-01"
+
+    def test_empty_output(self):
+        assert CiscoASAParser.parse_show_version("")["version"] == ""
+
+
 class TestCiscoASAPacketTracer:
     def test_parse_permit(self):
         output = """Phase: 1
@@ -138,3 +277,21 @@ Action: drop"""
         assert policy is not None
         assert policy.action == "deny"
         assert nat is None
+
+    def test_translate_with_slash_runs(self):
+        # Each slash used to restart the rest of the token (seconds at this size)
+        slashes = "a/" * 10000
+        output = f"""Phase: 1
+Type: UN-NAT
+Untranslate {slashes}
+Untranslate 192.0.2.10/443 to 10.1.1.50/443
+
+Phase: 2
+Type: NAT
+Static translate //x to 10.1.1.5/22
+"""
+        _policy, nat = CiscoASAParser.parse_packet_tracer(output)
+
+        assert nat.dnat.original_ip == "192.0.2.10"
+        assert nat.dnat.translated_port == "443"
+        assert (nat.snat.original_ip, nat.snat.original_port) == ("/", "x")
@@ -2,29 +2,24 @@
 
 import pytest
 from pathtracer.drivers.cisco_ftd import CiscoFTDDriver
-from pathtracer.models import NetworkDevice, CredentialSet
+from pathtracer.models import NetworkDevice
+
+
+@pytest.fixture(scope="module")
+def driver(admin_creds):
+    device = NetworkDevice(hostname="ftd-01", management_ip="10.0.0.1", vendor="cisco_ftd")
+    return CiscoFTDDriver(device, admin_creds)
 
 
 class TestCiscoFTDDriver:
-    def test_instantiation(self):
-        device = NetworkDevice(hostname="ftd-01", management_ip="10.0.0.1", vendor="cisco_ftd")
-        creds = CredentialSet(username="admin", password="pass")
-        driver = CiscoFTDDriver(device, creds)
+    def test_instantiation(self, driver):
         assert driver is not None
 
-    def test_connect_raises(self):
-        device = NetworkDevice(hostname="ftd-01", management_ip="10.0.0.1", vendor="cisco_ftd")
-        creds = CredentialSet(username="admin", password="pass")
-        driver = CiscoFTDDriver(device, creds)
-
+    def test_connect_raises(self, driver):
         with pytest.raises(NotImplementedError, match="FMC API"):
             driver.connect()
 
-    def test_all_methods_raise(self):
-        device = NetworkDevice(hostname="ftd-01", management_ip="10.0.0.1", vendor="cisco_ftd")
-        creds = CredentialSet(username="admin", password="pass")
-        driver = CiscoFTDDriver(device, creds)
-
+    def test_all_methods_raise(self, driver):
         with pytest.raises(NotImplementedError):
             driver.disconnect()
         with pytest.raises(NotImplementedError):
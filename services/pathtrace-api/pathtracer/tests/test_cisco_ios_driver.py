@@ -0,0 +1,45 @@
+"""Tests for Cisco IOS driver VRF mapping."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pathtracer.drivers.cisco_ios import CiscoIOSDriver
+from pathtracer.models import NetworkDevice
+
+
+IP_INTERFACE_BRIEF = """Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet0/0     10.1.1.1        YES manual up                    up
+GigabitEthernet0/1     10.2.2.1        YES manual up                    up
+GigabitEthernet0/2     10.3.3.1        YES manual up                    up
+"""
+
+
+@pytest.fixture
+def driver(admin_creds):
+    device = NetworkDevice(hostname="rtr-01", management_ip="10.0.0.9", vendor="cisco_ios")
+    drv = CiscoIOSDriver(device, admin_creds)
+    drv.connection = MagicMock()
+    drv._connected = True
+    return drv
+
+
+class TestCiscoIOSInterfaceToContextMapping:
+    def test_per_interface_failure_defaults(self, driver):
+        driver.connection.send_command.side_effect = [
+            IP_INTERFACE_BRIEF,
+            " ip vrf forwarding CORP\n",
+            RuntimeError("timeout"),
+            " ip vrf forwarding\n",
+        ]
+
+        assert driver.get_interface_to_context_mapping() == {
+            "GigabitEthernet0/0": "CORP",
+            "GigabitEthernet0/1": "global",
+            "GigabitEthernet0/2": "global",
+        }
+
+    def test_interrupt_not_swallowed(self, driver):
+        driver.connection.send_command.side_effect = [IP_INTERFACE_BRIEF, KeyboardInterrupt()]
+
+        with pytest.raises(KeyboardInterrupt):
+            driver.get_interface_to_context_mapping()
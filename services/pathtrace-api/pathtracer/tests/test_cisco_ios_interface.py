@@ -72,3 +72,17 @@ class TestCiscoIOSInterfaceDetail:
 
         assert detail is not None
         assert detail.description == ""
+
+    def test_parse_unrecognised_first_line(self):
+        output = """% Invalid input detected at '^' marker.
+  Description: not an interface"""
+        assert CiscoIOSParser.parse_interface_detail(output) is None
+
+    def test_parse_line_protocol_down(self):
+        output = """GigabitEthernet0/4 is up, line protocol is down
+  MTU 1500 bytes, BW 100000 Kbit/sec, DLY 100 usec,"""
+        detail = CiscoIOSParser.parse_interface_detail(output)
+
+        assert detail is not None
+        assert detail.status == "down"
+        assert detail.speed == ""
@@ -46,6 +46,27 @@ Routing entry for 192.168.1.0/24
         assert route.preference == 110
         assert route.metric == 20
 
+    def test_parse_route_entry_returns_independent_entries(self):
+        """Repeat parses of the same reply build new entries per context."""
+        output = """
+Routing entry for 172.20.0.0/16
+  Known via "static", distance 1, metric 0
+  Routing Descriptor Blocks:
+  * 10.9.9.9
+      Route metric is 0, traffic share count is 1
+"""
+        first = CiscoIOSParser.parse_route_entry(output, "172.20.1.1", "CORP")
+        again = CiscoIOSParser.parse_route_entry(output, "172.20.5.5", "CORP")
+        other_vrf = CiscoIOSParser.parse_route_entry(output, "172.20.1.1", "GUEST")
+
+        first.destination = "mutated"
+        assert again is not first
+        assert again.destination == "172.20.0.0/16"
+        assert again.logical_context == "CORP"
+        assert other_vrf is not first
+        assert other_vrf.logical_context == "GUEST"
+        assert other_vrf.destination == "172.20.0.0/16"
+
     def test_parse_no_route(self):
         """Test parsing when no route exists."""
         output = """
@@ -97,3 +118,89 @@ O        10.2.2.0/24 [110/20] via 10.1.1.2, 00:05:23, GigabitEthernet0/1
         assert "CORP" in vrfs
         assert "GUEST" in vrfs
         assert len(vrfs) >= 2
+
+    def test_parse_interfaces(self):
+        """Test parsing of 'show ip interface brief' output."""
+        output = """
+Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet0/0     10.1.1.1        YES manual up                    up
+GigabitEthernet0/1     10.2.2.1        YES manual up                    up
+GigabitEthernet0/2     unassigned      YES unset  administratively down down
+"""
+        interfaces = CiscoIOSParser.parse_interfaces(output)
+
+        assert interfaces == {
+            "GigabitEthernet0/0": "10.1.1.1",
+            "GigabitEthernet0/1": "10.2.2.1",
+        }
+
+    def test_repeated_parse_returns_independent_lists(self):
+        """Caller mutations must not leak into later results."""
+        output = """
+C        10.1.1.0/24 is directly connected, GigabitEthernet0/0
+O        10.2.2.0/24 [110/20] via 10.1.1.2, 00:05:23, GigabitEthernet0/1
+"""
+        first = CiscoIOSParser.parse_routing_table(output, "CORP")
+        first.clear()
+        second = CiscoIOSParser.parse_routing_table(output, "CORP")
+
+        assert [r.destination for r in second] == ["10.1.1.0/24", "10.2.2.0/24"]
+        assert all(r.logical_context == "CORP" for r in second)
+
+        other_context = CiscoIOSParser.parse_routing_table(output, "GUEST")
+        assert all(r.logical_context == "GUEST" for r in other_context)
+
+        interfaces = CiscoIOSParser.parse_interfaces("Gi0/0  10.1.1.1  YES manual up  up")
+        interfaces["Gi0/9"] = "10.9.9.9"
+        assert CiscoIOSParser.parse_interfaces("Gi0/0  10.1.1.1  YES manual up  up") == {"Gi0/0": "10.1.1.1"}
+
+    def test_iter_routing_table_is_lazy(self):
+        """Generator variant yields the same routes as the list parser."""
+        output = """
+C        10.1.1.0/24 is directly connected, GigabitEthernet0/0
+O        10.2.2.0/24 [110/20] via 10.1.1.2, 00:05:23, GigabitEthernet0/1
+"""
+        routes = CiscoIOSParser.iter_routing_table(output, "CORP")
+
+        assert iter(routes) is routes
+        first = next(routes)
+        assert first.destination == "10.1.1.0/24"
+        assert [first, *routes] == CiscoIOSParser.parse_routing_table(output, "CORP")
+
+    def test_parse_routing_table_skips_unrecognised_lines(self):
+        """Lines without a route are dropped, known codes map to protocols."""
+        output = """
+D        10.3.3.0/24 [90/3072] via 10.1.1.9, 00:01:02, GigabitEthernet0/2
+      10.0.0.0/8 is variably subnetted, 3 subnets, 2 masks
+X        10.4.4.0/24 [5/0] via 10.1.1.10
+"""
+        routes = CiscoIOSParser.parse_routing_table(output)
+
+        assert [(r.destination, r.protocol) for r in routes] == [
+            ("10.3.3.0/24", "eigrp"),
+            ("10.4.4.0/24", "unknown"),
+        ]
+        assert routes[0].metric == 3072
+        assert routes[0].preference == 90
+
+    def test_parse_routing_table_legend_and_crlf(self):
+        """Legend lines are ignored and CRLF endings stay out of raw_output."""
+        output = (
+            "Codes: L - local, C - connected, S - static, R - RIP\r\n"
+            "       D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area\r\n"
+            "Gateway of last resort is 10.0.0.1 to network 0.0.0.0\r\n"
+            "\r\n"
+            "S*       0.0.0.0/0 [1/0] via 10.0.0.1\r\n"
+            "O IA     10.5.0.0/16 [110/30] via 10.1.1.5\r\n"
+            "L        10.1.1.1/32 is directly connected, GigabitEthernet0/0\r\n"
+        )
+        routes = CiscoIOSParser.parse_routing_table(output)
+
+        assert [(r.destination, r.protocol) for r in routes] == [
+            ("0.0.0.0/0", "static"),
+            ("10.5.0.0/16", "unknown"),
+            ("10.1.1.1/32", "local"),
+        ]
+        assert routes[0].raw_output == "S*       0.0.0.0/0 [1/0] via 10.0.0.1"
+        assert routes[1].preference == 110
+        assert routes[2].outgoing_interface == "GigabitEthernet0/0"
@@ -0,0 +1,217 @@
+"""Tests for the process-wide driver connection pool."""
+
+import importlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pathtracer.drivers import _pool
+from pathtracer.drivers.juniper_srx import JuniperSRXDriver
+from pathtracer.models import CommandError, NetworkDevice
+
+
+KEY = ("10.0.0.1", 22, "admin", "juniper_junos")
+
+
+@pytest.fixture(autouse=True)
+def empty_pool(monkeypatch):
+    monkeypatch.setattr(_pool, "ENABLED", True)
+    monkeypatch.setattr(_pool, "_start_reaper", lambda: None)
+    _pool.close_all()
+    yield
+    _pool.close_all()
+
+
+def _session(alive=True):
+    session = MagicMock()
+    session.is_alive.return_value = alive
+    return session
+
+
+class TestAcquireRelease:
+    def test_released_session_is_reused(self):
+        session = _session()
+        factory = MagicMock(return_value=session)
+
+        assert _pool.acquire(KEY, factory) is session
+        _pool.release(KEY, session)
+        assert _pool.acquire(KEY, factory) is session
+
+        factory.assert_called_once_with()
+        session.disconnect.assert_not_called()
+
+    def test_keys_do_not_share_sessions(self):
+        first, second = _session(), _session()
+        _pool.release(KEY, _pool.acquire(KEY, lambda: first))
+
+        assert _pool.acquire(("10.0.0.1", 22, "operator", "juniper_junos"), lambda: second) is second
+
+    def test_dead_session_replaced(self):
+        dead, fresh = _session(alive=False), _session()
+        _pool.release(KEY, _pool.acquire(KEY, lambda: dead))
+
+        assert _pool.acquire(KEY, lambda: fresh) is fresh
+        dead.disconnect.assert_called_once_with()
+
+    def test_is_alive_error_counts_as_dead(self):
+        broken, fresh = _session(), _session()
+        broken.is_alive.side_effect = OSError("socket closed")
+        _pool.release(KEY, _pool.acquire(KEY, lambda: broken))
+
+        assert _pool.acquire(KEY, lambda: fresh) is fresh
+
+    def test_reused_session_buffer_cleared(self):
+        session = _session()
+        _pool.release(KEY, _pool.acquire(KEY, lambda: session))
+
+        assert _pool.acquire(KEY, MagicMock()) is session
+        session.clear_buffer.assert_called_once_with()
+
+    def test_clear_buffer_error_counts_as_dead(self):
+        stuck, fresh = _session(), _session()
+        stuck.clear_buffer.side_effect = OSError("channel closed")
+        _pool.release(KEY, _pool.acquire(KEY, lambda: stuck))
+
+        assert _pool.acquire(KEY, lambda: fresh) is fresh
+        stuck.disconnect.assert_called_once_with()
+
+    def test_discarded_session_closed_not_pooled(self):
+        session, fresh = _session(), _session()
+
+        _pool.discard(_pool.acquire(KEY, lambda: session))
+
+        session.disconnect.assert_called_once_with()
+        assert _pool.acquire(KEY, lambda: fresh) is fresh
+        assert _pool._created.get(id(session)) is None
+
+    def test_extra_sessions_closed_beyond_max_size(self, monkeypatch):
+        monkeypatch.setattr(_pool, "MAX_SIZE", 1)
+        first, second = _session(), _session()
+        a = _pool.acquire(KEY, lambda: first)
+        b = _pool.acquire(KEY, lambda: second)
+
+        _pool.release(KEY, a)
+        _pool.release(KEY, b)
+
+        first.disconnect.assert_not_called()
+        second.disconnect.assert_called_once_with()
+
+    def test_old_session_not_pooled(self, monkeypatch):
+        monkeypatch.setattr(_pool, "MAX_AGE", 0)
+        session = _session()
+
+        _pool.release(KEY, _pool.acquire(KEY, lambda: session))
+
+        session.disconnect.assert_called_once_with()
+
+    def test_drained_key_removed(self):
+        session = _session()
+        _pool.release(KEY, _pool.acquire(KEY, lambda: session))
+
+        assert _pool.acquire(KEY, MagicMock()) is session
+        assert KEY not in _pool._idle
+
+    def test_dead_sessions_leave_no_empty_key(self):
+        dead, fresh = _session(alive=False), _session()
+        _pool.release(KEY, _pool.acquire(KEY, lambda: dead))
+
+        assert _pool.acquire(KEY, lambda: fresh) is fresh
+        assert KEY not in _pool._idle
+
+    def test_old_session_leaves_no_empty_key(self, monkeypatch):
+        monkeypatch.setattr(_pool, "MAX_AGE", 0)
+
+        _pool.release(KEY, _pool.acquire(KEY, _session))
+
+        assert KEY not in _pool._idle
+
+    def test_disabled_pool_always_closes(self, monkeypatch):
+        monkeypatch.setattr(_pool, "ENABLED", False)
+        first, second = _session(), _session()
+        _pool.release(KEY, _pool.acquire(KEY, lambda: first))
+
+        assert _pool.acquire(KEY, lambda: second) is second
+        first.disconnect.assert_called_once_with()
+
+    def test_factory_error_propagates(self):
+        def factory():
+            raise OSError("connection refused")
+
+        with pytest.raises(OSError):
+            _pool.acquire(KEY, factory)
+
+
+class TestReaper:
+    def test_idle_sessions_closed(self, monkeypatch):
+        session = _session()
+        _pool.release(KEY, _pool.acquire(KEY, lambda: session))
+
+        _pool._reap()
+        session.disconnect.assert_not_called()
+
+        monkeypatch.setattr(_pool, "IDLE_TIMEOUT", 0)
+        _pool._reap()
+        session.disconnect.assert_called_once_with()
+        assert _pool._idle == {}
+
+
+class TestShutdown:
+    def test_close_all_registered_at_exit(self):
+        with patch("atexit.register") as register:
+            importlib.reload(_pool)
+
+        register.assert_called_once_with(_pool.close_all)
+
+
+class TestJuniperSRXPooling:
+    def test_second_driver_reuses_session(self, admin_creds):
+        device = NetworkDevice(hostname="srx-01", management_ip="10.0.0.1", vendor="juniper_srx")
+        session = _session()
+
+        with patch("pathtracer.drivers.juniper_srx.ConnectHandler", return_value=session) as handler:
+            for _ in range(2):
+                with JuniperSRXDriver(device, admin_creds) as drv:
+                    assert drv.connection is session
+
+        assert handler.call_count == 1
+        assert handler.call_args.kwargs["port"] == 22
+        session.disconnect.assert_not_called()
+
+    def _device(self):
+        return NetworkDevice(hostname="srx-01", management_ip="10.0.0.1", vendor="juniper_srx")
+
+    def test_session_after_failed_command_never_reused(self, admin_creds):
+        broken, fresh = _session(), _session()
+        broken.send_command.side_effect = OSError("read timeout")
+
+        with patch("pathtracer.drivers.juniper_srx.ConnectHandler", side_effect=[broken, fresh]):
+            with pytest.raises(CommandError):
+                with JuniperSRXDriver(self._device(), admin_creds) as drv:
+                    drv.get_route("10.9.9.9")
+            with JuniperSRXDriver(self._device(), admin_creds) as drv:
+                assert drv.connection is fresh
+
+        broken.disconnect.assert_called_once_with()
+        fresh.disconnect.assert_not_called()
+
+    def test_swallowed_command_failure_still_discards(self, admin_creds):
+        broken, fresh = _session(), _session()
+        broken.send_command.side_effect = OSError("read timeout")
+
+        with patch("pathtracer.drivers.juniper_srx.ConnectHandler", side_effect=[broken, fresh]):
+            with JuniperSRXDriver(self._device(), admin_creds) as drv:
+                assert drv.get_interface_detail("ge-0/0/0.0") is None
+            with JuniperSRXDriver(self._device(), admin_creds) as drv:
+                assert drv.connection is fresh
+
+        broken.disconnect.assert_called_once_with()
+
+    def test_exception_in_block_discards(self, admin_creds):
+        session = _session()
+
+        with patch("pathtracer.drivers.juniper_srx.ConnectHandler", return_value=session):
+            with pytest.raises(RuntimeError):
+                with JuniperSRXDriver(self._device(), admin_creds):
+                    raise RuntimeError("trace aborted")
+
+        session.disconnect.assert_called_once_with()
+        assert _pool._idle == {}
@@ -0,0 +1,86 @@
+"""Tests for CredentialManager loading."""
+
+import json
+
+import pytest
+
+from pathtracer.credentials import CredentialManager
+from pathtracer.models import CredentialSet
+
+
+CREDENTIALS_YAML = """credentials:
+  default:
+    username: netops
+    password: s3cret
+  firewalls:
+    username: fwadmin
+    ssh_key_file: /keys/fw
+    api_token: abc123
+"""
+
+
+class TestLoadFromFile:
+    def test_yaml(self, tmp_path):
+        path = tmp_path / "creds.yaml"
+        path.write_text(CREDENTIALS_YAML)
+
+        manager = CredentialManager(str(path))
+
+        assert manager.get_credentials() == CredentialSet(username="netops", password="s3cret")
+        assert manager.get_credentials("firewalls") == CredentialSet(
+            username="fwadmin", ssh_key_file="/keys/fw", api_token="abc123"
+        )
+
+    def test_json(self, tmp_path):
+        path = tmp_path / "creds.json"
+        path.write_text(json.dumps({"credentials": {"default": {"username": "netops"}}}))
+
+        manager = CredentialManager(str(path))
+
+        assert manager.has_credentials()
+        assert manager.get_credentials().password is None
+
+    def test_unknown_key_rejected(self, tmp_path):
+        path = tmp_path / "creds.yaml"
+        path.write_text("credentials:\n  default:\n    username: netops\n    pasword: typo\n")
+
+        with pytest.raises(ValueError, match="'default'"):
+            CredentialManager(str(path))
+
+    def test_missing_username_rejected(self, tmp_path):
+        path = tmp_path / "creds.json"
+        path.write_text(json.dumps({"credentials": {"lab": {"password": "pw"}}}))
+
+        with pytest.raises(ValueError, match="'lab'"):
+            CredentialManager(str(path))
+
+
+class TestInitSources:
+    def test_no_file_uses_environment(self, monkeypatch):
+        monkeypatch.setenv("PATHTRACE_USER", "envuser")
+        monkeypatch.setenv("PATHTRACE_PASS", "envpass")
+
+        manager = CredentialManager()
+
+        assert manager.get_credentials() == CredentialSet(username="envuser", password="envpass")
+
+    def test_environment_read_per_instance(self, monkeypatch):
+        monkeypatch.delenv("PATHTRACE_USER", raising=False)
+        assert not CredentialManager().has_credentials()
+
+        monkeypatch.setenv("PATHTRACE_USER", "late")
+        assert CredentialManager().get_credentials().username == "late"
+
+    def test_missing_file_falls_back_to_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PATHTRACE_USER", "envuser")
+
+        manager = CredentialManager(str(tmp_path / "absent.yaml"))
+
+        assert manager.get_credentials().username == "envuser"
+
+    def test_directory_is_not_loaded_as_file(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("PATHTRACE_USER", raising=False)
+        directory = tmp_path / "creds.yaml"
+        directory.mkdir()
+
+        assert CredentialManager(str(directory)).credentials == {}
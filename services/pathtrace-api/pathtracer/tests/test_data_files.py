@@ -0,0 +1,55 @@
+"""Tests for extension-based YAML/JSON file loading and saving."""
+
+import json
+
+import pytest
+import yaml
+
+from pathtracer.utils.data_files import load_data_file, save_data_file
+
+
+DATA = {"devices": [{"hostname": "r1", "subnets": ["10.0.0.0/24"], "site": None}]}
+
+
+class TestDataFiles:
+    @pytest.mark.parametrize("name", ["inv.yaml", "inv.yml", "INV.YAML", "inv.json", "inv.txt"])
+    def test_round_trip(self, tmp_path, name):
+        path = tmp_path / name
+        save_data_file(DATA, str(path))
+
+        assert load_data_file(str(path)) == DATA
+
+    @pytest.mark.parametrize("name", ["inv.yaml", "inv.Yml"])
+    def test_yaml_suffix_writes_yaml(self, tmp_path, name):
+        path = tmp_path / name
+        save_data_file(DATA, str(path))
+
+        assert yaml.safe_load(path.read_text()) == DATA
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(path.read_text())
+
+    def test_other_suffix_writes_indented_json(self, tmp_path):
+        path = tmp_path / "inv.conf"
+        save_data_file(DATA, str(path))
+
+        assert path.read_text() == json.dumps(DATA, indent=2)
+
+    def test_yaml_loader_is_safe(self, tmp_path):
+        path = tmp_path / "evil.yaml"
+        path.write_text("!!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(yaml.YAMLError):
+            load_data_file(str(path))
+
+    @pytest.mark.parametrize("name", ["inv.yaml", "inv.json"])
+    def test_reads_utf8_regardless_of_locale(self, tmp_path, name):
+        path = tmp_path / name
+        path.write_bytes(json.dumps({"site": "Zürich"}, ensure_ascii=False).encode("utf-8"))
+
+        assert load_data_file(str(path)) == {"site": "Zürich"}
+
+    def test_yaml_with_byte_order_mark(self, tmp_path):
+        path = tmp_path / "inv.yaml"
+        path.write_bytes(b"\xef\xbb\xbfdevices: []\n")
+
+        assert load_data_file(str(path)) == {"devices": []}
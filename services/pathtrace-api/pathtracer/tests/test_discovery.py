@@ -0,0 +1,195 @@
+"""Tests for DeviceInventory lookups."""
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from pathtracer.discovery import DeviceInventory
+from pathtracer.models import NetworkDevice
+
+
+def _device(hostname, management_ip, subnets=None, site=None):
+    return NetworkDevice(
+        hostname=hostname,
+        management_ip=management_ip,
+        vendor="cisco_ios",
+        site=site,
+        subnets=subnets or [],
+    )
+
+
+@pytest.fixture
+def inventory():
+    inv = DeviceInventory()
+    inv.add_device(_device("core", "10.0.0.1", ["10.0.0.0/8", "0.0.0.0/0"]))
+    inv.add_device(_device("dist", "10.1.0.1", ["10.1.0.0/16"]))
+    inv.add_device(_device("access", "10.1.1.1", ["10.1.1.0/24", "2001:db8:1::/48"]))
+    inv.add_device(_device("v6-core", "10.9.9.9", ["2001:db8::/32"]))
+    return inv
+
+
+class TestFindDeviceForSubnet:
+    def test_longest_prefix_wins(self, inventory):
+        assert [d.hostname for d in inventory.find_device_for_subnet("10.1.1.50")] == ["access"]
+        assert [d.hostname for d in inventory.find_device_for_subnet("10.1.2.50")] == ["dist"]
+        assert [d.hostname for d in inventory.find_device_for_subnet("10.2.0.1")] == ["core"]
+
+    def test_default_route_matches_everything_else(self, inventory):
+        assert [d.hostname for d in inventory.find_device_for_subnet("192.0.2.1")] == ["core"]
+
+    def test_ipv6_lookup(self, inventory):
+        assert [d.hostname for d in inventory.find_device_for_subnet("2001:db8:1::5")] == ["access"]
+        assert [d.hostname for d in inventory.find_device_for_subnet("2001:db8:2::5")] == ["v6-core"]
+        assert inventory.find_device_for_subnet("2001:db9::1") == []
+
+    def test_all_owners_of_same_subnet_returned(self, inventory):
+        inventory.add_device(_device("access-b", "10.1.1.2", ["10.1.1.0/24"]))
+
+        assert [d.hostname for d in inventory.find_device_for_subnet("10.1.1.9")] == [
+            "access", "access-b"
+        ]
+
+    def test_host_bits_in_subnet_are_ignored(self):
+        inv = DeviceInventory()
+        inv.add_device(_device("edge", "192.0.2.1", ["172.16.5.9/24"]))
+
+        assert [d.hostname for d in inv.find_device_for_subnet("172.16.5.200")] == ["edge"]
+        assert inv.find_device_for_subnet("172.16.6.1") == []
+
+    def test_invalid_input_returns_empty(self, inventory):
+        inventory.add_device(_device("broken", "10.7.7.7", ["not-a-subnet"]))
+
+        assert inventory.find_device_for_subnet("not-an-ip") == []
+        assert "not-a-subnet" in inventory.subnet_map
+
+    def test_empty_inventory(self):
+        assert DeviceInventory().find_device_for_subnet("10.0.0.1") == []
+
+    def test_returns_a_copy(self, inventory):
+        inventory.find_device_for_subnet("10.1.1.50").clear()
+
+        assert len(inventory.find_device_for_subnet("10.1.1.50")) == 1
+
+
+class TestDeviceIndexes:
+    def test_find_device_by_hostname(self, inventory):
+        assert inventory.find_device_by_hostname("dist").management_ip == "10.1.0.1"
+        assert inventory.find_device_by_hostname("missing") is None
+
+    def test_duplicate_hostname_returns_first_added(self, inventory):
+        inventory.add_device(_device("dist", "10.1.0.99"))
+
+        assert inventory.find_device_by_hostname("dist").management_ip == "10.1.0.1"
+
+    def test_find_device_by_ip(self, inventory):
+        assert [d.hostname for d in inventory.find_device_by_ip("10.1.1.1")] == ["access"]
+        assert inventory.find_device_by_ip("10.200.0.1") == []
+
+    def test_find_device_by_ip_returns_all_sharing_ip(self, inventory):
+        inventory.add_device(_device("access-standby", "10.1.1.1"))
+
+        assert [d.hostname for d in inventory.find_device_by_ip("10.1.1.1")] == [
+            "access", "access-standby"
+        ]
+
+    def test_find_device_by_ip_returns_a_copy(self, inventory):
+        inventory.find_device_by_ip("10.1.1.1").clear()
+
+        assert len(inventory.find_device_by_ip("10.1.1.1")) == 1
+
+
+EXAMPLE_INVENTORY = Path(__file__).resolve().parent.parent / "example-inventory.yaml"
+
+
+class TestLoadFromFile:
+    def test_yaml_matches_pure_python_loader(self):
+        inv = DeviceInventory(str(EXAMPLE_INVENTORY))
+        with open(EXAMPLE_INVENTORY) as f:
+            expected = yaml.load(f, Loader=yaml.SafeLoader)
+
+        assert [d.hostname for d in inv.get_all_devices()] == [
+            d["hostname"] for d in expected["devices"]
+        ]
+        assert inv.find_device_by_hostname("core-rtr-01").subnets == ["10.10.0.0/16", "172.16.0.0/12"]
+        assert inv.find_device_by_hostname("core-rtr-01").management_ip == "10.1.1.1"
+
+    def test_json_round_trip(self, tmp_path):
+        inv = DeviceInventory(str(EXAMPLE_INVENTORY))
+        path = tmp_path / "inventory.json"
+        inv.save_to_file(str(path))
+
+        reloaded = DeviceInventory(str(path))
+
+        assert json.loads(path.read_text()) == inv.export_to_dict()
+        assert reloaded.export_to_dict() == inv.export_to_dict()
+
+    def test_yaml_round_trip(self, tmp_path):
+        inv = DeviceInventory(str(EXAMPLE_INVENTORY))
+        path = tmp_path / "inventory.yml"
+        inv.save_to_file(str(path))
+
+        assert DeviceInventory(str(path)).export_to_dict() == inv.export_to_dict()
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            DeviceInventory(str(tmp_path / "absent.yaml"))
+
+
+class TestLoadWarnings:
+    def test_duplicate_management_ip(self):
+        inv = DeviceInventory()
+        inv.add_device(_device("a", "10.0.0.1"))
+        inv.add_device(_device("b", "10.0.0.2"))
+        inv.add_device(_device("c", "10.0.0.1"))
+        inv.add_device(_device("d", "10.0.0.1"))
+
+        assert inv.get_warnings() == [
+            "Duplicate management IP 10.0.0.1: a and c",
+            "Duplicate management IP 10.0.0.1: a and d",
+            "Duplicate management IP 10.0.0.1: c and d",
+        ]
+
+    def test_same_hostname_or_empty_ip_not_duplicate(self):
+        inv = DeviceInventory()
+        inv.add_device(_device("a", "10.0.0.1"))
+        inv.add_device(_device("a", "10.0.0.1"))
+        inv.add_device(_device("b", ""))
+        inv.add_device(_device("c", ""))
+
+        assert inv.get_warnings() == []
+
+    def test_overlapping_subnet_same_site_only(self):
+        inv = DeviceInventory()
+        inv.add_device(_device("a", "10.0.0.1", ["10.5.0.0/24"], site="lon"))
+        inv.add_device(_device("b", "10.0.0.2", ["10.5.0.0/24"], site="nyc"))
+        inv.add_device(_device("c", "10.0.0.3", ["10.5.0.0/24"]))
+        inv.add_device(_device("d", "10.0.0.4", ["10.5.0.0/24", "10.6.0.0/24"], site="lon"))
+
+        assert inv.get_warnings() == [
+            "Overlapping subnet 10.5.0.0/24 at site lon: a and d",
+        ]
+        assert [d.hostname for d in inv.subnet_map["10.5.0.0/24"]] == ["a", "b", "c", "d"]
+
+    def test_large_inventory_warnings(self):
+        inv = DeviceInventory()
+        for i in range(2000):
+            inv.add_device(_device(f"dev{i}", f"10.{i // 1000}.{i % 250}.1"))
+
+        assert len(inv.get_all_devices()) == 2000
+        # 500 distinct IPs, each shared by four devices: six pairs apiece
+        assert len(inv.get_warnings()) == 3000
+
+    def test_accessors_return_copies(self):
+        inv = DeviceInventory()
+        inv.add_device(_device("a", "10.0.0.1"))
+        inv.add_device(_device("b", "10.0.0.1"))
+
+        warnings = inv.get_warnings()
+        devices = inv.get_all_devices()
+        warnings.clear()
+        devices.pop()
+
+        assert inv.get_warnings() == ["Duplicate management IP 10.0.0.1: a and b"]
+        assert [d.hostname for d in inv.get_all_devices()] == ["a", "b"]
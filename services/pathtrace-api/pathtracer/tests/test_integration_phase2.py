@@ -1,5 +1,9 @@
 """Integration tests verifying Phase 2 components work together."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from pathtracer.models import (
     NetworkDevice, RouteEntry, InterfaceDetail,
@@ -26,6 +30,33 @@ class TestAllNewDriversImportable:
             CiscoASADriver, JuniperSRXDriver, CiscoFTDDriver,
         )
 
+    def test_star_import_exports_all_drivers(self):
+        namespace = {}
+        exec("from pathtracer.drivers import *", namespace)
+
+        import pathtracer.drivers as drivers
+        assert all(namespace[name] is getattr(drivers, name) for name in drivers.__all__)
+        assert set(drivers.__all__) <= set(dir(drivers))
+
+    def test_unknown_name_raises_attribute_error(self):
+        import pathtracer.drivers as drivers
+        with pytest.raises(AttributeError):
+            drivers.NoSuchDriver
+
+    def test_driver_modules_load_on_demand(self):
+        code = (
+            "import sys\n"
+            "from pathtracer.drivers.cisco_ios import CiscoIOSDriver\n"
+            "assert 'pathtracer.drivers.cisco_ftd' not in sys.modules\n"
+            "from pathtracer.drivers import CiscoFTDDriver\n"
+            "assert 'pathtracer.drivers.cisco_ftd' in sys.modules\n"
+        )
+        project_root = Path(__file__).resolve().parents[2]
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, cwd=project_root
+        )
+        assert result.returncode == 0, result.stderr
+
 
 class TestAllNewParsersImportable:
     def test_imports(self):
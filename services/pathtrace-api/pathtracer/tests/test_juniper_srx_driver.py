@@ -2,23 +2,21 @@
 
 import pytest
 from pathtracer.drivers.juniper_srx import JuniperSRXDriver
-from pathtracer.models import NetworkDevice, CredentialSet
+from pathtracer.models import NetworkDevice
 
 
-class TestJuniperSRXDriver:
-    def test_instantiation(self):
-        device = NetworkDevice(hostname="srx-01", management_ip="10.0.0.1", vendor="juniper_srx")
-        creds = CredentialSet(username="admin", password="pass")
-        driver = JuniperSRXDriver(device, creds)
+@pytest.fixture(scope="module")
+def driver(admin_creds):
+    device = NetworkDevice(hostname="srx-01", management_ip="10.0.0.1", vendor="juniper_srx")
+    return JuniperSRXDriver(device, admin_creds)
+
 
+class TestJuniperSRXDriver:
+    def test_instantiation(self, driver):
         assert driver.device_type == "juniper_junos"
         assert driver.parser is not None
 
-    def test_has_firewall_methods(self):
-        device = NetworkDevice(hostname="srx-01", management_ip="10.0.0.1", vendor="juniper_srx")
-        creds = CredentialSet(username="admin", password="pass")
-        driver = JuniperSRXDriver(device, creds)
-
+    def test_has_firewall_methods(self, driver):
         assert hasattr(driver, 'get_interface_detail')
         assert hasattr(driver, 'get_zone_for_interface')
         assert hasattr(driver, 'lookup_security_policy')
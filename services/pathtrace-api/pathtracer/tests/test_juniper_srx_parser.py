@@ -31,10 +31,81 @@ class TestJuniperSRXRouteEntry:
         assert route.preference == 10
         assert route.metric == 20
 
+    def test_parse_direct_route_does_not_borrow_next_hop(self):
+        output = """inet.0: 2 destinations, 2 routes (2 active, 0 holddown, 0 hidden)
+
+10.1.1.0/24        *[Direct/0] 30d 12:45:00
+                    >  via ge-0/0/1.0
+10.2.2.0/24        *[Static/5] 1d 00:00:00
+                    >  to 10.1.1.2 via ge-0/0/1.0"""
+        route = JuniperSRXParser.parse_route_entry(output, "10.1.1.9")
+        assert route is not None
+        assert route.destination == "10.1.1.0/24"
+        assert route.next_hop_type == "connected"
+        assert route.next_hop == ""
+        assert route.raw_output == output
+
     def test_parse_no_route(self):
         route = JuniperSRXParser.parse_route_entry("", "1.1.1.1")
         assert route is None
 
+    def test_parse_output_without_active_route(self):
+        output = """inet.0: 15 destinations, 15 routes (15 active, 0 holddown, 0 hidden)
++ = Active Route, - = Last Active, * = Both
+"""
+        assert JuniperSRXParser.parse_route_entry(output, "1.1.1.1") is None
+
+
+class TestJuniperSRXRoutingTable:
+    def test_parse_routing_table(self):
+        output = """inet.0: 4 destinations, 5 routes (4 active, 0 holddown, 0 hidden)
++ = Active Route, - = Last Active, * = Both
+
+0.0.0.0/0          *[Static/5] 30d 12:45:00
+                    >  to 10.0.0.1 via ge-0/0/0.0
+10.1.1.0/24        *[Direct/0] 30d 12:45:00
+                    >  via ge-0/0/1.0
+10.1.1.1/32        *[Local/0] 30d 12:45:00
+                       Local via ge-0/0/1.0
+192.168.1.0/24     *[OSPF/10] 5d 03:22:10, metric 20
+                       to 10.1.1.3 via ge-0/0/1.0
+                    [OSPF/10] 5d 03:22:10, metric 30
+                    >  to 10.1.1.2 via ge-0/0/1.0"""
+        routes = JuniperSRXParser.parse_routing_table(output, "trust-vr")
+
+        assert [r.destination for r in routes] == [
+            "0.0.0.0/0", "10.1.1.0/24", "10.1.1.1/32", "192.168.1.0/24"
+        ]
+        static, direct, local, ospf = routes
+
+        assert static.next_hop == "10.0.0.1"
+        assert static.outgoing_interface == "ge-0/0/0.0"
+        assert static.preference == 5
+        assert static.raw_output == ""
+
+        # A hop line belonging to the next prefix must not be borrowed
+        assert direct.next_hop_type == "connected"
+        assert direct.next_hop == ""
+        assert direct.outgoing_interface is None
+        assert local.next_hop_type == "local"
+
+        assert ospf.next_hop == "10.1.1.2"
+        assert ospf.metric == 20
+        assert ospf.logical_context == "trust-vr"
+
+    def test_parse_routing_table_empty(self):
+        assert JuniperSRXParser.parse_routing_table("   ") == []
+
+    def test_parse_routing_table_interns_protocol(self):
+        output = """10.1.0.0/16        *[Static/5] 1d 00:00:00
+                    >  to 10.0.0.1 via ge-0/0/0.0
+10.2.0.0/16        *[Static/5] 1d 00:00:00
+                    >  to 10.0.0.1 via ge-0/0/0.0"""
+        first, second = JuniperSRXParser.parse_routing_table(output)
+
+        assert first.protocol == "static"
+        assert first.protocol is second.protocol
+
 
 class TestJuniperSRXInterfaceDetail:
     def test_parse_interface(self):
@@ -57,6 +128,45 @@ class TestJuniperSRXInterfaceDetail:
         assert detail.discards_in == 2
         assert detail.discards_out == 0
 
+    def test_parse_fields_last_value_wins(self):
+        output = """Physical interface: ge-0/0/3, Enabled, Physical link is Down
+  Description: Spare
+  Link-level type: Ethernet, MTU: 1514, Speed: 10Gbps
+  Input errors: 7, Output errors: 3
+  Input drops: 1, Output drops: 4
+  Logical interface ge-0/0/3.0
+    Input errors: 8, Output errors: 9"""
+        detail = JuniperSRXParser.parse_interface_detail(output)
+        assert detail is not None
+        assert detail.name == "ge-0/0/3"
+        assert detail.status == "down"
+        assert detail.description == "Spare"
+        assert detail.speed == "10Gbps"
+        assert (detail.errors_in, detail.errors_out) == (8, 9)
+        assert (detail.discards_in, detail.discards_out) == (1, 4)
+
+    def test_fields_in_any_order(self):
+        output = """Physical interface: ge-0/0/5, Enabled, Physical link is Up
+  Input drops: 6, Output drops: 7
+  Interface index: 153, SNMP ifIndex: 531
+  Input errors: 2, Output errors: 3
+  Link-level type: Ethernet, MTU: 1514, Speed: 100mbps
+  Description: Lab uplink"""
+        detail = JuniperSRXParser.parse_interface_detail(output)
+        assert detail is not None
+        assert detail.description == "Lab uplink"
+        assert detail.speed == "100mbps"
+        assert (detail.errors_in, detail.errors_out) == (2, 3)
+        assert (detail.discards_in, detail.discards_out) == (6, 7)
+
+    def test_header_only(self):
+        detail = JuniperSRXParser.parse_interface_detail(
+            "Physical interface: ge-0/0/4, Enabled, Physical link is Up"
+        )
+        assert detail is not None
+        assert detail.description == ""
+        assert detail.errors_in == 0
+
 
 class TestJuniperSRXSecurityZones:
     def test_parse_zones(self):
@@ -75,6 +185,35 @@ Security zone: untrust
         assert zones["ge-0/0/2.0"] == "trust"
         assert zones["ge-0/0/0.0"] == "untrust"
 
+        # Zone names are interned, so separate parses share one string
+        again = JuniperSRXParser.parse_security_zones(output)
+        assert again["ge-0/0/0.0"] is zones["ge-0/0/0.0"]
+
+    def test_parse_zones_with_interfaces_heading(self):
+        output = """Security zone: trust
+  Zone ID: 6
+  Send reset for non-SYN session TCP packets: Off
+  Policy configurable: Yes
+  Interfaces bound: 2
+  Interfaces:
+    ge-0/0/1.0
+    lo0.0
+
+Security zone: junos-host
+  Send reset for non-SYN session TCP packets: Off
+  Interfaces bound: 0
+  Interfaces:
+
+Security zone: dmz
+  Interfaces bound: 1
+  Interfaces:
+    xe-1/0/0.100"""
+        zones = JuniperSRXParser.parse_security_zones(output)
+        assert zones == {"ge-0/0/1.0": "trust", "xe-1/0/0.100": "dmz"}
+
+    def test_parse_zones_empty(self):
+        assert JuniperSRXParser.parse_security_zones("") == {}
+
 
 class TestJuniperSRXPolicyMatch:
     def test_parse_permit(self):
@@ -90,6 +229,31 @@ class TestJuniperSRXPolicyMatch:
         assert result.action == "permit"
         assert result.source_zone == "trust"
         assert result.dest_zone == "untrust"
+        assert result.logging is True
+
+    def test_logging_only_read_after_action(self):
+        output = """Policy: Syslog-Out, State: enabled, Index: 7, Scope Policy: 0, Sequence number: 2
+  Source zone: trust, Destination zone: untrust
+  Source addresses: syslog-servers
+  Destination addresses: any
+  Applications: junos-syslog
+  Action: permit"""
+        result = JuniperSRXParser.parse_security_policy_match(output)
+        assert result is not None
+        assert result.logging is False
+
+    def test_address_lists_split_on_commas(self):
+        output = """Policy: Multi, State: enabled, Index: 9, Scope Policy: 0, Sequence number: 3
+  Source zone: trust, Destination zone: untrust
+  Source addresses: 10.0.0.0/8 ,  192.168.0.0/16,, 172.16.0.0/12
+  Destination addresses: any
+  Applications: junos-http,junos-https ,
+  Action: permit"""
+        result = JuniperSRXParser.parse_security_policy_match(output)
+        assert result is not None
+        assert result.source_addresses == ["10.0.0.0/8", "192.168.0.0/16", "172.16.0.0/12"]
+        assert result.dest_addresses == ["any"]
+        assert result.services == ["junos-http", "junos-https"]
 
     def test_parse_deny(self):
         output = """Policy: default-deny, State: enabled, Index: 65534, Scope Policy: 0, Sequence number: 100
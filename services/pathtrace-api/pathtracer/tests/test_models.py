@@ -3,6 +3,7 @@
 import pytest
 
 from pathtracer.models import (
+    CredentialSet,
     DeviceVendor,
     InterfaceDetail,
     HopQueryResult,
@@ -225,3 +226,77 @@ class TestPathHopExtended:
         assert hop.egress_detail is None
         assert hop.policy_result is None
         assert hop.nat_result is None
+
+
+# ---------------------------------------------------------------------------
+# TestSlottedModels
+# ---------------------------------------------------------------------------
+class TestSlottedModels:
+    """Parser output models are slotted to keep large tables small."""
+
+    @pytest.mark.parametrize("instance", [
+        RouteEntry(destination="10.0.0.0/8", next_hop="10.1.1.1", next_hop_type="ip"),
+        InterfaceDetail(name="eth0"),
+        PolicyResult(
+            rule_name="allow-web",
+            rule_position=1,
+            action="permit",
+            source_zone="trust",
+            dest_zone="untrust",
+            source_addresses=["any"],
+            dest_addresses=["any"],
+            services=["tcp/443"],
+            logging=False,
+        ),
+        NatTranslation(
+            original_ip="10.0.0.1",
+            original_port=None,
+            translated_ip="203.0.113.1",
+            translated_port=None,
+        ),
+        NatResult(),
+        CredentialSet(username="netops"),
+        NetworkDevice(hostname="r1", management_ip="10.0.0.1", vendor="cisco_ios"),
+        PathHop(
+            sequence=1,
+            device=NetworkDevice(hostname="r1", management_ip="10.0.0.1", vendor="cisco_ios"),
+        ),
+    ])
+    def test_no_instance_dict(self, instance):
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.unexpected = 1
+
+    def test_route_entry_fields_still_mutable(self):
+        route = RouteEntry(destination="10.0.0.0/8", next_hop="10.1.1.1", next_hop_type="ip")
+        route.metric = 5
+        assert route.metric == 5
+
+
+class TestCredentialSet:
+    def test_unknown_field_rejected(self):
+        with pytest.raises(TypeError):
+            CredentialSet(username="netops", pasword="typo")
+
+    def test_comparable(self):
+        assert CredentialSet(username="a") == CredentialSet(username="a")
+        assert CredentialSet(username="a") != CredentialSet(username="a", password="pw")
+
+    def test_auth_helpers(self):
+        creds = CredentialSet(username="netops", ssh_key_file="/keys/id")
+        assert creds.has_key() and not creds.has_password()
+
+
+class TestNetworkDeviceIdentity:
+    def test_equality_by_management_ip(self):
+        a = NetworkDevice(hostname="r1", management_ip="10.0.0.1", vendor="cisco_ios")
+        b = NetworkDevice(hostname="r1-alias", management_ip="10.0.0.1", vendor="arista_eos")
+
+        assert a == b
+        assert a != NetworkDevice(hostname="r1", management_ip="10.0.0.2", vendor="cisco_ios")
+
+    def test_hash_by_hostname_and_ip(self):
+        a = NetworkDevice(hostname="r1", management_ip="10.0.0.1", vendor="cisco_ios")
+        b = NetworkDevice(hostname="r1", management_ip="10.0.0.1", vendor="arista_eos")
+
+        assert len({a, b}) == 1
@@ -30,6 +30,11 @@ class TestPaloAltoSecurityPolicyMatch:
         assert "10.0.0.0/8" in result.source_addresses
         assert "any" in result.dest_addresses
 
+        # Zone names are interned, so separate parses share one string
+        again = PaloAltoParser.parse_security_policy_match(output)
+        assert again.source_zone is result.source_zone
+        assert again.dest_zone is result.dest_zone
+
     def test_parse_deny_rule(self):
         output = """"Block-All" {
         from any;
@@ -46,10 +51,81 @@ class TestPaloAltoSecurityPolicyMatch:
         assert result.rule_name == "Block-All"
         assert result.action == "deny"
 
+    def test_parse_multi_value_fields(self):
+        output = """"Allow-DNS" {
+        from trust;
+        source-region none;
+        source 10.0.0.0/8 192.168.0.0/16;
+        to untrust;
+        destination-region none;
+        destination 8.8.8.8;
+        application/service dns/udp/any/53;
+        action drop;
+}"""
+        result = PaloAltoParser.parse_security_policy_match(output)
+
+        assert result is not None
+        assert result.source_addresses == ["10.0.0.0/8", "192.168.0.0/16"]
+        assert result.dest_addresses == ["8.8.8.8"]
+        assert result.services == ["dns/udp/any/53"]
+        assert result.action == "drop"
+
+    def test_keyword_without_value_does_not_take_next_line(self):
+        output = """"Empty-Dest" {
+        from trust;
+        destination
+        source 10.0.0.0/8;
+        to untrust;
+        action allow;
+}"""
+        result = PaloAltoParser.parse_security_policy_match(output)
+
+        assert result is not None
+        assert result.dest_addresses == []
+        assert result.source_addresses == ["10.0.0.0/8"]
+        assert (result.source_zone, result.dest_zone) == ("trust", "untrust")
+        assert result.action == "permit"
+
+    def test_first_occurrence_wins(self):
+        output = """"Twice" {
+        from trust dmz;
+        from dmz;
+        action deny;
+        action allow;
+}"""
+        result = PaloAltoParser.parse_security_policy_match(output)
+
+        assert result is not None
+        assert result.source_zone == "dmz"
+        assert result.action == "deny"
+
+    def test_parse_unterminated_fields(self):
+        output = '"Broken" {\n' + "        source " + "x" * 5000 + "\n" + " " * 5000 + "\n}"
+        result = PaloAltoParser.parse_security_policy_match(output)
+
+        assert result is not None
+        assert result.source_addresses == []
+        assert result.action == "deny"
+
     def test_parse_no_match(self):
         result = PaloAltoParser.parse_security_policy_match("")
         assert result is None
 
+    def test_repeated_output_returns_independent_results(self):
+        output = """"Allow-Web" {
+        from trust;
+        source 10.0.0.0/8;
+        to untrust;
+        action allow;
+}"""
+        first = PaloAltoParser.parse_security_policy_match(output)
+        first.source_addresses.append("192.0.2.0/24")
+
+        second = PaloAltoParser.parse_security_policy_match(output)
+
+        assert second is not first
+        assert second.source_addresses == ["10.0.0.0/8"]
+
 
 class TestPaloAltoNatMatch:
     def test_parse_snat(self):
@@ -90,3 +166,27 @@ class TestPaloAltoNatMatch:
     def test_parse_no_nat(self):
         result = PaloAltoParser.parse_nat_policy_match("")
         assert result is None
+
+    def test_parse_translation_with_ports(self):
+        output = """Matched NAT rule: "Port-NAT"
+  Source translation: 10.1.1.100:8080 ==> 203.0.113.5:80
+  Destination translation: 203.0.113.10 ==> 10.1.1.50:443"""
+        result = PaloAltoParser.parse_nat_policy_match(output)
+
+        assert result is not None
+        assert (result.snat.original_ip, result.snat.original_port) == ("10.1.1.100", "8080")
+        assert (result.snat.translated_ip, result.snat.translated_port) == ("203.0.113.5", "80")
+        assert result.dnat.original_port is None
+        assert result.dnat.translated_port == "443"
+        assert result.dnat.nat_rule_name == "Port-NAT"
+
+    def test_repeated_output_returns_independent_results(self):
+        output = """Matched NAT rule: "Internet-SNAT"
+  Source translation: 10.1.1.100 ==> 203.0.113.5"""
+        first = PaloAltoParser.parse_nat_policy_match(output)
+        first.snat = None
+
+        second = PaloAltoParser.parse_nat_policy_match(output)
+
+        assert second is not first
+        assert second.snat.translated_ip == "203.0.113.5"
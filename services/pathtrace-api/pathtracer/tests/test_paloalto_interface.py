@@ -37,6 +37,34 @@ Name: ethernet1/1
         assert detail.discards_in == 2
         assert detail.discards_out == 0
 
+    def test_non_numeric_fields_keep_defaults(self):
+        output = """Name: tunnel.1
+  Link speed:          ukn
+  Link state:          Down
+  Errors received:     n/a
+  Description:"""
+        detail = PaloAltoParser.parse_interface_detail(output)
+
+        assert detail == InterfaceDetail(name="tunnel.1", status="down")
+
+    def test_crlf_line_endings(self):
+        output = "Name: ethernet1/2\r\n  Link state:          up\r\n  Zone:                trust\r\n"
+        detail = PaloAltoParser.parse_interface_detail(output)
+
+        assert detail is not None
+        assert detail.name == "ethernet1/2"
+        assert detail.status == "up"
+        assert PaloAltoParser.parse_zone_from_interface(output) == "trust"
+
+    def test_blank_output(self):
+        assert PaloAltoParser.parse_interface_detail(" \n \n") is None
+        assert PaloAltoParser.parse_zone_from_interface(" \n \n") is None
+
+    def test_missing_name_returns_none(self):
+        output = """  Link speed:          1000
+  Link state:          up"""
+        assert PaloAltoParser.parse_interface_detail(output) is None
+
 
 class TestPaloAltoZoneParsing:
     def test_parse_zone_from_interface(self):
@@ -57,3 +85,14 @@ Name: loopback.1
 -------------------------------------------------------------------------------"""
         zone = PaloAltoParser.parse_zone_from_interface(output)
         assert zone is None
+
+    def test_zone_label_inside_other_field_ignored(self):
+        output = """Name: ethernet1/4
+  Description:         Zone: legacy dmz
+  Zone:                dmz"""
+        zone = PaloAltoParser.parse_zone_from_interface(output)
+        assert zone == "dmz"
+
+        detail = PaloAltoParser.parse_interface_detail(output)
+        assert detail is not None
+        assert detail.description == "Zone: legacy dmz"
@@ -0,0 +1,262 @@
+"""Tests for Palo Alto routing and inventory parsing."""
+
+import pytest
+from pathtracer.parsers.paloalto_parser import PaloAltoParser
+from pathtracer.models import NextHopType
+
+
+ROUTING_TABLE = """flags: A:active, ?:loose, C:connect, H:host, S:static, ~:internal, R:rip, O:ospf, B:bgp
+
+VIRTUAL ROUTER: default (id 1)
+  ==========
+destination        nexthop              metric       flags   age          interface    tag
+---------------   -------------------  -----  ----------  --------  ---------------  ----
+0.0.0.0/0         203.0.113.1          10     A S         1234567   ethernet1/1      0
+10.1.1.0/24       10.1.1.1             0      A C         1234567   ethernet1/2      0
+
+10.2.0.0/16       10.1.1.2             20     A O         123456    ethernet1/2      0
+192.0.2.0/24      discard              0      A S         123456    ethernet1/3      0
+total routes shown: 4
+"""
+
+
+class TestPaloAltoVirtualRouters:
+    def test_parse_virtual_router_list(self):
+        output = """
+Virtual Router: default
+  interfaces: ethernet1/1 ethernet1/2
+Virtual Router: guest
+  interfaces: ethernet1/3
+Virtual Router: default
+"""
+        assert PaloAltoParser.parse_virtual_router_list(output) == ["default", "guest"]
+
+    def test_parse_virtual_router_list_ignores_other_lines(self):
+        output = """
+VIRTUAL ROUTER: default (id 1)
+  Virtual Router: transit (id 2)
+  virtual router: lab
+"""
+        assert PaloAltoParser.parse_virtual_router_list(output) == ["transit"]
+
+    def test_parse_virtual_router_list_many_duplicates(self):
+        output = "\n".join(
+            f"Virtual Router: vr{i % 50}" for i in range(500)
+        )
+        assert PaloAltoParser.parse_virtual_router_list(output) == [
+            f"vr{i}" for i in range(50)
+        ]
+
+    def test_parse_virtual_router_list_empty(self):
+        assert PaloAltoParser.parse_virtual_router_list("") == []
+
+
+class TestPaloAltoInterfaceList:
+    def test_parse_interface_list(self):
+        output = """ethernet1/1  16  1000/full/up
+  ip: 203.0.113.2/24
+ethernet1/2  17  1000/full/up
+  ip: 10.1.1.1/24
+vlan.10  20  ukn/ukn/up
+  ip: N/A
+"""
+        interfaces = PaloAltoParser.parse_interface_list(output)
+
+        assert interfaces == {"ethernet1/1": "203.0.113.2", "ethernet1/2": "10.1.1.1"}
+
+    def test_parse_interface_list_ip_label_any_case(self):
+        output = """ethernet1/3  18  1000/full/up
+  IP: 10.3.3.1/24
+ethernet1/4  19  1000/full/up
+  Ip:  10.4.4.1/24
+"""
+        assert PaloAltoParser.parse_interface_list(output) == {
+            "ethernet1/3": "10.3.3.1", "ethernet1/4": "10.4.4.1"
+        }
+
+    def test_parse_interface_list_other_kinds(self):
+        output = """ae1  32  [n/a]/[n/a]/up
+  ip: 10.10.10.1/30
+tunnel.1  256  [n/a]/[n/a]/up
+  ip: 169.254.0.1/30
+loopback.1  257  [n/a]/[n/a]/up
+  ip: 192.0.2.1/32
+mgmt  1  1000/full/up
+  ip: 198.51.100.10/24
+"""
+        interfaces = PaloAltoParser.parse_interface_list(output)
+
+        assert interfaces == {
+            "ae1": "10.10.10.1",
+            "tunnel.1": "169.254.0.1",
+            "loopback.1": "192.0.2.1",
+        }
+
+
+class TestPaloAltoRouting:
+    def test_parse_routing_table(self):
+        routes = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default")
+
+        assert [r.destination for r in routes] == [
+            "0.0.0.0/0", "10.1.1.0/24", "10.2.0.0/16", "192.0.2.0/24"
+        ]
+        assert [r.protocol for r in routes] == ["static", "connected", "ospf", "static"]
+        assert routes[0].next_hop == "203.0.113.1"
+        assert routes[0].metric == 10
+        assert routes[0].outgoing_interface == "ethernet1/1"
+        assert routes[1].next_hop_type == NextHopType.CONNECTED.value
+        assert routes[3].next_hop_type == NextHopType.NULL.value
+
+    def test_parse_routing_table_flag_layouts(self):
+        output = """destination        nexthop              metric       flags   age          interface    tag
+---------------   -------------------  -----  ----------  --------  ---------------  ----
+10.1.1.0/24       10.1.1.1             0      A C                   ethernet1/2
+172.16.0.0/12     198.51.100.7         0      A?B         5400      ethernet1/1      0
+10.9.0.0/16       10.1.1.9             5      AR          60        tunnel.1         0
+"""
+        routes = PaloAltoParser.parse_routing_table(output)
+
+        assert [(r.protocol, r.outgoing_interface) for r in routes] == [
+            ("connected", "ethernet1/2"),
+            ("bgp", "ethernet1/1"),
+            ("rip", "tunnel.1"),
+        ]
+        assert routes[2].metric == 5
+
+    def test_parse_routing_table_unmapped_flags(self):
+        output = """destination        nexthop              metric       flags   age          interface    tag
+---------------   -------------------  -----  ----------  --------  ---------------  ----
+10.7.0.0/16       10.1.1.7             0      A?H         60        ethernet1/2      0
+10.6.0.0/16       10.1.1.6             0      ~OB         60        ethernet1/2      0
+"""
+        routes = PaloAltoParser.parse_routing_table(output)
+
+        assert [r.protocol for r in routes] == ["unknown", "ospf"]
+        assert routes[0].next_hop_type == NextHopType.IP.value
+
+    def test_parse_routing_table_short_and_tabbed_rows(self):
+        output = (
+            "destination  nexthop  metric  flags  age  interface  tag\n"
+            "-----------  -------  ------  -----  ---  ---------  ---\n"
+            "10.3.0.0/16\t10.1.1.3\t7\tA\tS\t99\tethernet1/3\t0\n"
+            "10.4.0.0/16  10.1.1.4  0  AS\n"
+            "10.5.0.0/16  10.1.1.5  0  A S\n"
+        )
+        routes = PaloAltoParser.parse_routing_table(output)
+
+        assert [(r.destination, r.metric, r.outgoing_interface) for r in routes] == [
+            ("10.3.0.0/16", 7, "ethernet1/3"),
+            ("10.5.0.0/16", 0, None),
+        ]
+
+    def test_parse_routing_table_non_numeric_metric(self):
+        output = """destination        nexthop              metric       flags   age          interface    tag
+---------------   -------------------  -----  ----------  --------  ---------------  ----
+10.8.0.0/16       10.1.1.8             -      A S         60        ethernet1/2      0
+"""
+        routes = PaloAltoParser.parse_routing_table(output)
+
+        assert len(routes) == 1
+        assert routes[0].metric == 0
+        assert routes[0].outgoing_interface == "ethernet1/2"
+
+    def test_same_flags_classified_by_next_hop(self):
+        output = """destination        nexthop              metric       flags   age          interface    tag
+---------------   -------------------  -----  ----------  --------  ---------------  ----
+192.0.2.0/24      discard              0      A S         60        ethernet1/3      0
+198.51.100.0/24   10.1.1.5             0      A S         60        ethernet1/2      0
+"""
+        routes = PaloAltoParser.parse_routing_table(output)
+
+        assert [r.next_hop_type for r in routes] == [
+            NextHopType.NULL.value, NextHopType.IP.value
+        ]
+        assert [r.protocol for r in routes] == ["static", "static"]
+
+    def test_only_prefix_rows_are_parsed(self):
+        output = ROUTING_TABLE + """
+VIRTUAL ROUTER: guest (id 2)
+  ==========
+destination        nexthop              metric       flags   age          interface    tag
+---------------   -------------------  -----  ----------  --------  ---------------  ----
+10.50.0.0/16      10.50.0.1            0      A C                   ethernet1/5
+"""
+        routes = PaloAltoParser.parse_routing_table(output)
+
+        assert [r.destination for r in routes] == [
+            "0.0.0.0/0", "10.1.1.0/24", "10.2.0.0/16", "192.0.2.0/24", "10.50.0.0/16"
+        ]
+
+    def test_parse_routing_table_without_header_rule(self):
+        assert PaloAltoParser.parse_routing_table("total routes shown: 0") == []
+
+    def test_parse_route_entry_returns_first_row(self):
+        route = PaloAltoParser.parse_route_entry(ROUTING_TABLE, "10.2.3.4", "default")
+
+        assert route is not None
+        assert route.destination == "0.0.0.0/0"
+        assert route.logical_context == "default"
+
+    def test_parse_route_entry_skips_rows_without_flags(self):
+        output = """destination        nexthop              metric       flags   age          interface    tag
+---------------   -------------------  -----  ----------  --------  ---------------  ----
+10.0.0.0/8        10.1.1.1             0      -
+10.2.0.0/16       10.1.1.2             20     A O         123456    ethernet1/2      0
+"""
+        route = PaloAltoParser.parse_route_entry(output, "10.2.3.4")
+
+        assert route is not None
+        assert route.destination == "10.2.0.0/16"
+        assert route.protocol == "ospf"
+
+    def test_header_rule_without_rows(self):
+        output = "destination  nexthop  metric  flags\n-----------  -------  ------  -----"
+        assert PaloAltoParser.parse_route_entry(output, "10.2.3.4") is None
+        assert PaloAltoParser.parse_routing_table(output) == []
+
+    def test_parse_route_entry_not_found(self):
+        assert PaloAltoParser.parse_route_entry("destination not found", "10.2.3.4") is None
+        assert PaloAltoParser.parse_route_entry("no table here", "10.2.3.4") is None
+
+    def test_repeated_parse_returns_independent_lists(self):
+        first = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default")
+        first.clear()
+        second = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default")
+
+        assert len(second) == 4
+        other = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "guest")
+        assert all(r.logical_context == "guest" for r in other)
+
+    def test_repeated_parse_builds_new_entries(self):
+        first = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default")
+        first[0].next_hop = "mutated"
+
+        second = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default")
+
+        assert second[0] is not first[0]
+        assert second[0].next_hop == "203.0.113.1"
+
+    def test_parse_routing_table_accepts_bytes(self):
+        routes = PaloAltoParser.parse_routing_table(ROUTING_TABLE.encode(), "default")
+
+        assert routes == PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default")
+        assert isinstance(routes[0].destination, str)
+
+    def test_parse_route_entry_accepts_bytes(self):
+        route = PaloAltoParser.parse_route_entry(ROUTING_TABLE.encode(), "10.2.3.4", "default")
+
+        assert route is not None
+        assert route.next_hop == "203.0.113.1"
+        assert PaloAltoParser.parse_route_entry(b"destination not found", "10.2.3.4") is None
+
+    def test_raw_output_only_on_request(self):
+        routes = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default")
+        assert all(r.raw_output == "" for r in routes)
+
+        raw = PaloAltoParser.parse_routing_table(ROUTING_TABLE, "default", include_raw=True)
+        assert raw[0].raw_output.startswith("0.0.0.0/0         203.0.113.1")
+
+    def test_parse_route_entry_keeps_raw_output(self):
+        route = PaloAltoParser.parse_route_entry(ROUTING_TABLE, "10.2.3.4", "default")
+
+        assert route.raw_output.startswith("0.0.0.0/0")
@@ -0,0 +1,15 @@
+"""Tests for device output text helpers."""
+
+from pathtracer.utils.text import as_text
+
+
+class TestAsText:
+    def test_str_passed_through(self):
+        output = "10.0.0.0/8  10.1.1.1"
+        assert as_text(output) is output
+
+    def test_bytes_decoded_as_utf8(self):
+        assert as_text("vrf café".encode()) == "vrf café"
+
+    def test_undecodable_bytes_replaced(self):
+        assert as_text(b"eth\xff0") == "eth�0"
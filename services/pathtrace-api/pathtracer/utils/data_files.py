@@ -0,0 +1,68 @@
+"""Loading and saving YAML/JSON data files by extension."""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, IO
+
+import yaml
+
+try:
+    # libyaml-backed loader when PyYAML was built against it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _load_yaml(raw: bytes) -> Any:
+    return yaml.load(raw, Loader=_YamlLoader)
+
+
+def _dump_yaml(data: Any, f: IO[str]) -> None:
+    yaml.dump(data, f, default_flow_style=False)
+
+
+def _dump_json(data: Any, f: IO[str]) -> None:
+    json.dump(data, f, indent=2)
+
+
+# File suffix (lowercase) -> reader/writer; anything else is treated as JSON.
+# Readers take the raw file bytes: both parsers detect UTF-8/16/32
+# themselves, so there is no text-mode decode pass in between.
+_LOADERS: Dict[str, Callable[[bytes], Any]] = {
+    '.yaml': _load_yaml,
+    '.yml': _load_yaml,
+    '.json': json.loads,
+}
+_DUMPERS: Dict[str, Callable[[Any, IO[str]], None]] = {
+    '.yaml': _dump_yaml,
+    '.yml': _dump_yaml,
+    '.json': _dump_json,
+}
+
+
+def load_data_file(file_path: str) -> Any:
+    """
+    Load a YAML or JSON file, choosing the format from its extension.
+
+    Args:
+        file_path: Path to a .yaml/.yml file; any other extension is read as JSON
+
+    Returns:
+        Parsed file contents
+    """
+    loader = _LOADERS.get(Path(file_path).suffix.lower(), json.loads)
+    with open(file_path, 'rb') as f:
+        return loader(f.read())
+
+
+def save_data_file(data: Any, file_path: str) -> None:
+    """
+    Write data as YAML or JSON, choosing the format from the file extension.
+
+    Args:
+        data: Data to serialize
+        file_path: Path to a .yaml/.yml file; any other extension is written as JSON
+    """
+    dumper = _DUMPERS.get(Path(file_path).suffix.lower(), _dump_json)
+    with open(file_path, 'w') as f:
+        dumper(data, f)
@@ -0,0 +1,17 @@
+"""Device output text helpers."""
+
+from typing import Union
+
+
+def as_text(output: Union[bytes, str]) -> str:
+    """Return device output as text, decoding raw bytes once up front.
+
+    Args:
+        output: Raw command output as read from the channel or as a string
+
+    Returns:
+        Output as a string; undecodable bytes are replaced
+    """
+    if isinstance(output, bytes):
+        return output.decode('utf-8', 'replace')
+    return output